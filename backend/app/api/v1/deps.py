@@ -58,11 +58,12 @@ def require_permissions(*permission_codes: str) -> Callable[[CurrentUser], Curre
 
     说明：
     - 超级管理员角色（SUPERUSER_ROLE_CODE）默认放行；
-    - 其他角色：根据 sys_menu.auth_code + sys_role_menu 计算可用权限码集合；
+    - 其他角色：根据 sys_menu.auth_code + sys_role_menu 计算可用权限码集合（按角色集合缓存）；
     - 当缺少任一必需权限码时，返回 403。
     """
 
     required = [code for code in permission_codes if code]
+    required_set = frozenset(required)
 
     async def dependency(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
         if settings.SUPERUSER_ROLE_CODE in current_user.roles:
@@ -71,8 +72,8 @@ def require_permissions(*permission_codes: str) -> Callable[[CurrentUser], Curre
         if not required:
             return current_user
 
-        codes = await auth_service.get_access_codes(current_user.roles)
-        if not set(required).issubset(set(codes)):
+        codes = await auth_service.get_access_code_set(current_user.roles)
+        if not required_set.issubset(codes):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权限")
 
         return current_user
@@ -0,0 +1,66 @@
+"""后台任务：查询状态、下载结果文件。"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.responses import FileResponse
+
+from app.api.v1.deps import get_current_user
+from app.core.config import settings
+from app.models.job import JobStatus, SysJob
+from app.schemas.job import JobOut
+from app.schemas.response import ApiResponse, ok
+from app.schemas.user import CurrentUser
+from app.services.job import job_result_path, job_to_out
+from app.utils.excel import XLSX_MEDIA_TYPE
+
+router = APIRouter()
+
+
+async def _get_own_job(job_id: int, current_user: CurrentUser) -> SysJob:
+    """获取任务（仅创建人或超级管理员可访问）。"""
+
+    job = await SysJob.get_or_none(id=job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="任务不存在")
+    if (
+        job.creator_name != current_user.username
+        and settings.SUPERUSER_ROLE_CODE not in current_user.roles
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权访问该任务")
+    return job
+
+
+@router.get("/{job_id}", response_model=ApiResponse[JobOut])
+async def get_job(
+    job_id: int,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """查询任务状态与进度。"""
+
+    return ok(job_to_out(await _get_own_job(job_id, current_user)))
+
+
+@router.get("/{job_id}/download")
+async def download_job_result(
+    job_id: int,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """下载任务结果文件。"""
+
+    job = await _get_own_job(job_id, current_user)
+    if job.status == JobStatus.EXPIRED:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="结果文件已过期")
+    if job.status != JobStatus.SUCCESS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="任务尚未完成")
+
+    abs_path = job_result_path(job)
+    if not abs_path or not abs_path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="结果文件已丢失")
+
+    return FileResponse(
+        path=str(abs_path),
+        media_type=XLSX_MEDIA_TYPE if abs_path.suffix == ".xlsx" else "application/octet-stream",
+        filename=job.result_file_name or abs_path.name,
+        content_disposition_type="attachment",
+    )
@@ -3,13 +3,17 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from tortoise.queryset import QuerySet
 
 from app.api.v1.deps import require_permissions
+from app.core.config import settings
 from app.models.log import LoginLog
 from app.schemas.monitor_log import IdsPayload, LoginLogOut
 from app.schemas.response import ApiResponse, ok
 from app.schemas.user import CurrentUser
 from app.services.data_scope import get_allowed_user_ids
+from app.utils.excel import ExcelColumn, stream_xlsx, xlsx_stream_response
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, iter_by_keyset, paginate
 
 router = APIRouter()
 
@@ -20,16 +24,14 @@ def _format_dt(dt: datetime | None) -> str | None:
     return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S")
 
 
-@router.get("/list", response_model=ApiResponse[dict])
-async def list_login_logs(
-    page: int = Query(default=1, ge=1),
-    pageSize: int = Query(default=20, ge=1, le=200),
-    username: str | None = Query(default=None),
-    status_: int | None = Query(default=None, alias="status"),
-    current_user: CurrentUser = Depends(require_permissions("Monitor:LoginLog:List")),
-):
-    """获取登录日志列表（分页）。"""
-
+async def _filter_login_logs(
+    current_user: CurrentUser,
+    *,
+    username: str | None,
+    status_: int | None,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> QuerySet[LoginLog]:
     qs = LoginLog.all()
     allowed_user_ids = await get_allowed_user_ids(current_user)
     if allowed_user_ids is not None:
@@ -38,9 +40,42 @@ async def list_login_logs(
         qs = qs.filter(username__icontains=username)
     if status_ in (0, 1):
         qs = qs.filter(status=status_)
+    # 时间范围条件可让 PostgreSQL 只扫描对应月份的分区
+    if start_time:
+        qs = qs.filter(created_at__gte=start_time.astimezone())
+    if end_time:
+        qs = qs.filter(created_at__lt=end_time.astimezone())
+    return qs
 
-    total = await qs.count()
-    records = await qs.order_by("-id").offset((page - 1) * pageSize).limit(pageSize)
+
+@router.get("/list", response_model=ApiResponse[dict])
+async def list_login_logs(
+    page: int = Query(default=1, ge=1),
+    pageSize: int = Query(default=20, ge=1, le=200),
+    username: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    startTime: datetime | None = Query(default=None, description="开始时间（含）"),
+    endTime: datetime | None = Query(default=None, description="结束时间（不含）"),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
+    current_user: CurrentUser = Depends(require_permissions("Monitor:LoginLog:List")),
+):
+    """获取登录日志列表（分页，支持游标模式）。"""
+
+    qs = await _filter_login_logs(
+        current_user,
+        username=username,
+        status_=status_,
+        start_time=startTime,
+        end_time=endTime,
+    )
+
+    records, page_info = await paginate(
+        qs,
+        page=page,
+        page_size=pageSize,
+        cursor=cursor,
+        approximate_count=True,
+    )
 
     items: list[LoginLogOut] = []
     for rec in records:
@@ -59,7 +94,57 @@ async def list_login_logs(
             ),
         )
 
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
+
+
+@router.get("/export")
+async def export_login_logs(
+    username: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    startTime: datetime | None = Query(default=None, description="开始时间（含）"),
+    endTime: datetime | None = Query(default=None, description="结束时间（不含）"),
+    current_user: CurrentUser = Depends(require_permissions("Monitor:LoginLog:Export")),
+):
+    """导出登录日志（Excel，按批查询并流式输出）。"""
+
+    qs = await _filter_login_logs(
+        current_user,
+        username=username,
+        status_=status_,
+        start_time=startTime,
+        end_time=endTime,
+    )
+
+    columns = [
+        ExcelColumn(title="用户名", key="username"),
+        ExcelColumn(title="IP地址", key="ip"),
+        ExcelColumn(title="登录地点", key="location"),
+        ExcelColumn(title="浏览器", key="browser"),
+        ExcelColumn(title="操作系统", key="os"),
+        ExcelColumn(title="状态", key="statusText"),
+        ExcelColumn(title="消息", key="message"),
+        ExcelColumn(title="登录时间", key="createTime"),
+    ]
+
+    async def batches():
+        async for records in iter_by_keyset(qs, limit=settings.EXCEL_EXPORT_MAX_ROWS):
+            yield [
+                {
+                    "username": rec.username,
+                    "ip": rec.ip,
+                    "location": rec.location,
+                    "browser": rec.browser,
+                    "os": rec.os,
+                    "statusText": "成功" if rec.status == 1 else "失败",
+                    "message": rec.message,
+                    "createTime": _format_dt(rec.created_at),
+                }
+                for rec in records
+            ]
+
+    content = stream_xlsx(sheet_name="登录日志", columns=columns, batches=batches())
+    filename = f"登录日志_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
+    return xlsx_stream_response(content, filename)
 
 
 @router.delete("/{log_id}", response_model=ApiResponse[bool])
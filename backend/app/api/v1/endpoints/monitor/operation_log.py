@@ -3,13 +3,18 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from tortoise.queryset import QuerySet
 
 from app.api.v1.deps import require_permissions
+from app.core.config import settings
 from app.models.log import OperationLog
 from app.schemas.monitor_log import IdsPayload, OperationLogOut
 from app.schemas.response import ApiResponse, ok
 from app.schemas.user import CurrentUser
 from app.services.data_scope import get_allowed_user_ids
+from app.services.log_search import operation_log_search
+from app.utils.excel import ExcelColumn, stream_xlsx, xlsx_stream_response
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, iter_by_keyset, paginate
 
 router = APIRouter()
 
@@ -20,19 +25,18 @@ def _format_dt(dt: datetime | None) -> str | None:
     return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S")
 
 
-@router.get("/list", response_model=ApiResponse[dict])
-async def list_operation_logs(
-    page: int = Query(default=1, ge=1),
-    pageSize: int = Query(default=20, ge=1, le=200),
-    username: str | None = Query(default=None),
-    module: str | None = Query(default=None),
-    action: str | None = Query(default=None),
-    method: str | None = Query(default=None),
-    status_: int | None = Query(default=None, alias="status"),
-    current_user: CurrentUser = Depends(require_permissions("Monitor:OperationLog:List")),
-):
-    """获取操作日志列表（分页）。"""
-
+async def _filter_operation_logs(
+    current_user: CurrentUser,
+    *,
+    username: str | None,
+    module: str | None,
+    action: str | None,
+    method: str | None,
+    status_: int | None,
+    keyword: str | None = None,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> QuerySet[OperationLog]:
     qs = OperationLog.all()
     allowed_user_ids = await get_allowed_user_ids(current_user)
     if allowed_user_ids is not None:
@@ -47,9 +51,56 @@ async def list_operation_logs(
         qs = qs.filter(method__iexact=method)
     if status_ in (0, 1):
         qs = qs.filter(status=status_)
+    if keyword:
+        qs = operation_log_search.apply(qs, keyword)
+    # 时间范围条件可让 PostgreSQL 只扫描对应月份的分区
+    if start_time:
+        qs = qs.filter(created_at__gte=start_time.astimezone())
+    if end_time:
+        qs = qs.filter(created_at__lt=end_time.astimezone())
+    return qs
 
-    total = await qs.count()
-    records = await qs.order_by("-id").offset((page - 1) * pageSize).limit(pageSize)
+
+@router.get("/list", response_model=ApiResponse[dict])
+async def list_operation_logs(
+    page: int = Query(default=1, ge=1),
+    pageSize: int = Query(default=20, ge=1, le=200),
+    username: str | None = Query(default=None),
+    module: str | None = Query(default=None),
+    action: str | None = Query(default=None),
+    method: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    keyword: str | None = Query(
+        default=None,
+        max_length=100,
+        description="关键字（匹配用户名、模块、URL、请求数据）",
+    ),
+    startTime: datetime | None = Query(default=None, description="开始时间（含）"),
+    endTime: datetime | None = Query(default=None, description="结束时间（不含）"),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
+    current_user: CurrentUser = Depends(require_permissions("Monitor:OperationLog:List")),
+):
+    """获取操作日志列表（分页，支持游标模式）。"""
+
+    qs = await _filter_operation_logs(
+        current_user,
+        username=username,
+        module=module,
+        action=action,
+        method=method,
+        status_=status_,
+        keyword=keyword,
+        start_time=startTime,
+        end_time=endTime,
+    )
+
+    records, page_info = await paginate(
+        qs,
+        page=page,
+        page_size=pageSize,
+        cursor=cursor,
+        approximate_count=True,
+    )
 
     items: list[OperationLogOut] = []
     for rec in records:
@@ -71,7 +122,73 @@ async def list_operation_logs(
             ),
         )
 
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
+
+
+@router.get("/export")
+async def export_operation_logs(
+    username: str | None = Query(default=None),
+    module: str | None = Query(default=None),
+    action: str | None = Query(default=None),
+    method: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    keyword: str | None = Query(
+        default=None,
+        max_length=100,
+        description="关键字（匹配用户名、模块、URL、请求数据）",
+    ),
+    startTime: datetime | None = Query(default=None, description="开始时间（含）"),
+    endTime: datetime | None = Query(default=None, description="结束时间（不含）"),
+    current_user: CurrentUser = Depends(require_permissions("Monitor:OperationLog:Export")),
+):
+    """导出操作日志（Excel，按批查询并流式输出）。"""
+
+    qs = await _filter_operation_logs(
+        current_user,
+        username=username,
+        module=module,
+        action=action,
+        method=method,
+        status_=status_,
+        keyword=keyword,
+        start_time=startTime,
+        end_time=endTime,
+    )
+
+    columns = [
+        ExcelColumn(title="用户名", key="username"),
+        ExcelColumn(title="操作模块", key="module"),
+        ExcelColumn(title="操作类型", key="action"),
+        ExcelColumn(title="请求方法", key="method"),
+        ExcelColumn(title="请求URL", key="url", width=50),
+        ExcelColumn(title="IP地址", key="ip"),
+        ExcelColumn(title="状态", key="statusText"),
+        ExcelColumn(title="耗时(ms)", key="duration"),
+        ExcelColumn(title="请求数据", key="requestData", width=60),
+        ExcelColumn(title="操作时间", key="createTime"),
+    ]
+
+    async def batches():
+        async for records in iter_by_keyset(qs, limit=settings.EXCEL_EXPORT_MAX_ROWS):
+            yield [
+                {
+                    "username": rec.username,
+                    "module": rec.module,
+                    "action": rec.action,
+                    "method": rec.method,
+                    "url": rec.url,
+                    "ip": rec.ip,
+                    "statusText": "成功" if rec.status == 1 else "失败",
+                    "duration": rec.duration,
+                    "requestData": rec.request_data,
+                    "createTime": _format_dt(rec.created_at),
+                }
+                for rec in records
+            ]
+
+    content = stream_xlsx(sheet_name="操作日志", columns=columns, batches=batches())
+    filename = f"操作日志_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
+    return xlsx_stream_response(content, filename)
 
 
 @router.delete("/{log_id}", response_model=ApiResponse[bool])
@@ -2,10 +2,11 @@
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints.monitor import login_log, operation_log
+from app.api.v1.endpoints.monitor import login_log, operation_log, runtime, ws
 
 router = APIRouter()
 
 router.include_router(operation_log.router, prefix="/operation-log", tags=["监控-操作日志"])
 router.include_router(login_log.router, prefix="/login-log", tags=["监控-登录日志"])
-
+router.include_router(runtime.router, prefix="/runtime", tags=["监控-运行状态"])
+router.include_router(ws.router, prefix="/ws", tags=["监控-WebSocket"])
@@ -0,0 +1,33 @@
+"""运行状态（后台任务指标）。"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from app.api.v1.deps import require_superuser
+from app.schemas.response import ApiResponse, ok
+from app.schemas.user import CurrentUser
+from app.services.heartbeat import heartbeat_buffer
+from app.services.job import job_runner
+from app.services.log_retention import log_retention_service
+from app.services.operation_log_writer import operation_log_writer
+from app.ws.notice import notice_ws_manager
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=ApiResponse[dict])
+async def runtime_stats(
+    _current_user: CurrentUser = Depends(require_superuser),
+):
+    """获取后台任务运行指标（仅超级管理员）。"""
+
+    return ok(
+        {
+            "heartbeat": heartbeat_buffer.stats(),
+            "operationLog": operation_log_writer.stats(),
+            "jobs": job_runner.stats(),
+            "logRetention": log_retention_service.stats(),
+            "ws": notice_ws_manager.stats(),
+        },
+    )
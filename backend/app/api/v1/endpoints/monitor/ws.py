@@ -0,0 +1,38 @@
+"""WebSocket 连接监控。"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from app.api.v1.deps import require_superuser
+from app.schemas.response import ApiResponse, ok
+from app.schemas.user import CurrentUser
+from app.ws.broker import INSTANCE_ID
+from app.ws.notice import notice_ws_manager
+
+router = APIRouter()
+
+_TOTAL_KEYS = ("connections", "enqueued", "evicted", "sendErrors", "pings", "idleReaped", "expired")
+
+
+@router.get("", response_model=ApiResponse[dict])
+async def ws_stats(
+    _current_user: CurrentUser = Depends(require_superuser),
+):
+    """
+    获取 WebSocket 连接指标（仅超级管理员）。
+
+    说明：
+    - workers：每个 worker 的连接数、连接最多的用户、发送队列积压、剔除/发送失败等计数；
+    - 其他 worker 的数据来自其最近一次心跳上报（WS_BROKER=redis 时可见全部 worker）；
+    - total 为各 worker 计数之和（同一用户可能连接到多个 worker，因此不汇总用户数）。
+    """
+
+    workers = await notice_ws_manager.worker_stats()
+    return ok(
+        {
+            "instance": INSTANCE_ID,
+            "workers": workers,
+            "total": {key: sum(int(w.get(key) or 0) for w in workers) for key in _TOTAL_KEYS},
+        },
+    )
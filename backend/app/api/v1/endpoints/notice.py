@@ -17,6 +17,7 @@ from app.schemas.notice import (
 )
 from app.schemas.response import ApiResponse, ok
 from app.schemas.user import CurrentUser
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, paginate
 
 router = APIRouter()
 
@@ -128,9 +129,10 @@ async def inbox_list(
     keyword: str | None = Query(default=None),
     readStatus: str = Query(default="all"),
     type_: int | None = Query(default=None, alias="type"),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    """消息收件箱列表（分页，按最新优先）。"""
+    """消息收件箱列表（分页，按最新优先，支持游标模式）。"""
 
     user = await User.get_or_none(username=current_user.username, is_active=True)
     if not user:
@@ -151,8 +153,13 @@ async def inbox_list(
             Q(notice__title__icontains=keyword) | Q(notice__message__icontains=keyword),
         )
 
-    total = await qs.count()
-    rows = await qs.order_by("-created_at", "-id").offset((page - 1) * pageSize).limit(pageSize)
+    rows, page_info = await paginate(
+        qs,
+        page=page,
+        page_size=pageSize,
+        cursor=cursor,
+        ordering=("-created_at", "-id"),
+    )
 
     items: list[NoticeInboxItem] = []
     for un in rows:
@@ -160,7 +167,7 @@ async def inbox_list(
             continue
         items.append(_build_item(un, notice=un.notice))
 
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
 
 
 @router.get("/inbox/{user_notice_id}", response_model=ApiResponse[NoticeDetail])
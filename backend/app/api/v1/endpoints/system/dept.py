@@ -9,7 +9,8 @@ from app.models.dept import Dept
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_dept import SystemDeptCreate, SystemDeptOut, SystemDeptUpdate
 from app.schemas.user import CurrentUser
-from app.services.data_scope import build_data_scope_q
+from app.services.data_scope import build_data_scope_q, invalidate_data_scope_cache
+from app.services.dept_index import dept_index
 
 router = APIRouter()
 
@@ -82,6 +83,8 @@ async def create_dept(
         remark=payload.remark,
         parent=parent,
     )
+    dept_index.upsert(dept.id, dept.parent_id)
+    invalidate_data_scope_cache()
     return ok(dept.id)
 
 
@@ -119,6 +122,8 @@ async def update_dept(
     for key, value in data.items():
         setattr(dept, key, value)
     await dept.save()
+    dept_index.upsert(dept.id, dept.parent_id)
+    invalidate_data_scope_cache()
     return ok(True)
 
 
@@ -137,4 +142,6 @@ async def delete_dept(dept_id: int, _user=Depends(require_permissions("System:De
         )
 
     await dept.delete()
+    dept_index.remove(dept_id)
+    invalidate_data_scope_cache()
     return ok(True)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from tortoise.queryset import QuerySet
 
 from app.api.v1.deps import require_permissions
+from app.core.config import settings
 from app.models.dict import DictData, DictType
+from app.schemas.job import JobOut
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_dict import (
     DictDataCreate,
@@ -16,6 +20,10 @@ from app.schemas.system_dict import (
     DictTypeOut,
     DictTypeUpdate,
 )
+from app.schemas.user import CurrentUser
+from app.services.job import job_runner, job_to_out, xlsx_export_handler
+from app.utils.excel import ExcelColumn, stream_xlsx, xlsx_stream_response
+from app.utils.pagination import iter_by_keyset
 
 router = APIRouter()
 
@@ -249,6 +257,115 @@ async def list_dict_data_alias(
     )
 
 
+def _dict_data_export_columns() -> list[ExcelColumn]:
+    return [
+        ExcelColumn(title="字典类型", key="typeCode"),
+        ExcelColumn(title="字典标签", key="label"),
+        ExcelColumn(title="字典键值", key="value"),
+        ExcelColumn(title="排序", key="sort"),
+        ExcelColumn(title="状态", key="statusText"),
+        ExcelColumn(title="样式", key="style"),
+        ExcelColumn(title="备注", key="remark"),
+        ExcelColumn(title="创建时间", key="createTime"),
+    ]
+
+
+def _dict_data_export_query(
+    *,
+    typeCode: str,
+    label: str | None,
+    value: str | None,
+    status_: int | None,
+) -> QuerySet[DictData]:
+    type_code = typeCode.strip()
+    if not type_code:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="typeCode 不能为空")
+
+    qs = DictData.filter(type_code=type_code)
+    if label:
+        qs = qs.filter(label__icontains=label)
+    if value:
+        qs = qs.filter(value__icontains=value)
+    if status_ in (0, 1):
+        qs = qs.filter(status=status_)
+    return qs
+
+
+async def _dict_data_export_batches(qs: QuerySet[DictData]) -> AsyncIterator[list[dict]]:
+    # keyset 分批按 id 升序读取（列表页按 sort 排序，导出不依赖顺序）
+    async for records in iter_by_keyset(
+        qs,
+        limit=settings.EXCEL_EXPORT_MAX_ROWS,
+        descending=False,
+    ):
+        yield [
+            {
+                "typeCode": rec.type_code,
+                "label": rec.label,
+                "value": rec.value,
+                "sort": rec.sort,
+                "statusText": "启用" if rec.status == 1 else "禁用",
+                "style": rec.style,
+                "remark": rec.remark,
+                "createTime": _format_dt(rec.created_at),
+            }
+            for rec in records
+        ]
+
+
+@router.get("/data/export")
+async def export_dict_data(
+    typeCode: str = Query(...),
+    label: str | None = Query(default=None),
+    value: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    _current_user=Depends(require_permissions("System:DictData:Export")),
+):
+    """导出字典数据（Excel，按批查询并流式输出）。"""
+
+    qs = _dict_data_export_query(typeCode=typeCode, label=label, value=value, status_=status_)
+    content = stream_xlsx(
+        sheet_name="字典数据",
+        columns=_dict_data_export_columns(),
+        batches=_dict_data_export_batches(qs),
+    )
+    filename = f"字典数据_{typeCode.strip()}_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
+    return xlsx_stream_response(content, filename)
+
+
+@router.post("/data/export-jobs", response_model=ApiResponse[JobOut])
+async def create_dict_data_export_job(
+    typeCode: str = Query(...),
+    label: str | None = Query(default=None),
+    value: str | None = Query(default=None),
+    status_: int | None = Query(default=None, alias="status"),
+    current_user: CurrentUser = Depends(require_permissions("System:DictData:Export")),
+):
+    """创建字典数据导出后台任务（立即返回任务，完成后通过 WebSocket 通知并提供下载）。"""
+
+    qs = _dict_data_export_query(typeCode=typeCode, label=label, value=value, status_=status_)
+    total = await qs.count()
+    if total > settings.EXCEL_EXPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"导出数据量过大（{total}），最大允许 {settings.EXCEL_EXPORT_MAX_ROWS} 行",
+        )
+
+    job = await job_runner.submit(
+        kind="dict_data_export",
+        title=f"导出字典数据（{typeCode.strip()}）",
+        creator_name=current_user.username,
+        handler=xlsx_export_handler(
+            file_name=f"字典数据_{typeCode.strip()}_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx",
+            sheet_name="字典数据",
+            columns=_dict_data_export_columns(),
+            batches=_dict_data_export_batches(qs),
+            total=total,
+        ),
+    )
+    return ok(job_to_out(job))
+
+
 @router.post("/data", response_model=ApiResponse[int])
 async def create_dict_data(
     payload: DictDataCreate,
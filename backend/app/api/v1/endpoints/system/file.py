@@ -16,7 +16,8 @@ from app.schemas.monitor_log import IdsPayload
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_file import SystemFileOut
 from app.schemas.user import CurrentUser
-from app.services.data_scope import build_data_scope_q, get_data_scope_result
+from app.services.data_scope import assert_can_access_many, build_data_scope_q
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, paginate
 
 router = APIRouter()
 
@@ -114,22 +115,7 @@ async def _get_actor(current_user: CurrentUser) -> User:
 async def _assert_can_access_file(rec: SysFile, current_user: CurrentUser) -> None:
     """校验当前用户是否可访问该文件（基于数据范围）。"""
 
-    scope = await get_data_scope_result(current_user)
-    if scope.allow_all:
-        return
-
-    # 满足任一条件即可访问：在部门范围内 或 仅本人且创建人是自己
-    if rec.dept_id and int(rec.dept_id) in scope.dept_ids:
-        return
-    if (
-        scope.allow_self
-        and scope.user_id
-        and rec.creator_id
-        and int(rec.creator_id) == int(scope.user_id)
-    ):
-        return
-
-    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权限")
+    await assert_can_access_many([rec], current_user)
 
 
 def _to_out(rec: SysFile) -> SystemFileOut:
@@ -158,9 +144,10 @@ async def list_files(
     originalName: str | None = Query(default=None),
     creatorName: str | None = Query(default=None),
     deptId: int | None = Query(default=None),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
     current_user: CurrentUser = Depends(require_permissions("System:File:List")),
 ):
-    """文件列表（分页）。"""
+    """文件列表（分页，支持游标模式）。"""
 
     qs = SysFile.all()
     data_q = await build_data_scope_q(
@@ -178,10 +165,9 @@ async def list_files(
     if deptId:
         qs = qs.filter(dept_id=deptId)
 
-    total = await qs.count()
-    records = await qs.order_by("-id").offset((page - 1) * pageSize).limit(pageSize)
+    records, page_info = await paginate(qs, page=page, page_size=pageSize, cursor=cursor)
     items = [_to_out(r) for r in records]
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
 
 
 @router.post("/upload", response_model=ApiResponse[SystemFileOut])
@@ -303,8 +289,7 @@ async def batch_delete_files(
     records = await SysFile.filter(id__in=ids).all()
 
     # 先做权限校验：只要存在一条无权限记录，就直接拒绝（避免“部分删除”带来的混乱）
-    for rec in records:
-        await _assert_can_access_file(rec, current_user)
+    await assert_can_access_many(records, current_user)
 
     deleted = 0
     for rec in records:
@@ -6,7 +6,7 @@ from app.api.v1.deps import require_permissions
 from app.models.menu import Menu
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_menu import SystemMenuCreate, SystemMenuOut, SystemMenuUpdate
-from app.services.menu import get_system_menu_tree
+from app.services.menu import get_system_menu_tree, invalidate_menu_cache
 
 router = APIRouter()
 
@@ -97,6 +97,7 @@ async def create_menu(
         data["component"] = None
 
     menu = await Menu.create(**data, parent=parent)
+    invalidate_menu_cache()
     return ok(menu.id)
 
 
@@ -162,6 +163,7 @@ async def update_menu(
         menu.component = None
 
     await menu.save()
+    invalidate_menu_cache()
     return ok(True)
 
 
@@ -174,4 +176,5 @@ async def delete_menu(menu_id: int, _user=Depends(require_permissions("System:Me
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="菜单不存在")
 
     await menu.delete()
+    invalidate_menu_cache()
     return ok(True)
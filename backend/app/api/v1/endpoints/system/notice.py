@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
-
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from tortoise.expressions import Q
 from tortoise.functions import Count
@@ -13,42 +11,19 @@ from app.models.user import User
 from app.schemas.notice import NoticeOutboxDetail, NoticeOutboxItem, NoticeSendRequest, format_dt
 from app.schemas.response import ApiResponse, ok
 from app.schemas.user import CurrentUser
+from app.services.dept_index import dept_index
 from app.ws.notice import notice_ws_manager
 
 router = APIRouter()
 
 
 async def _expand_dept_ids(dept_ids: set[int]) -> set[int]:
-    """
-    递归展开部门 ID（包含子部门）。
-
-    说明：
-    - 当前使用 Python 侧遍历，适合中小规模数据；
-    - 若未来部门规模很大，可改为递归 CTE 在数据库侧完成。
-    """
+    """递归展开部门 ID（包含子部门，基于进程内部门层级索引）。"""
 
     if not dept_ids:
         return set()
 
-    rows = await Dept.all().values("id", "parent_id")
-    children: dict[int, list[int]] = defaultdict(list)
-    for row in rows:
-        pid = row.get("parent_id")
-        if pid is None:
-            continue
-        children[int(pid)].append(int(row["id"]))
-
-    expanded: set[int] = set(int(d) for d in dept_ids)
-    queue = list(expanded)
-    while queue:
-        current = queue.pop(0)
-        for child_id in children.get(current, []):
-            if child_id in expanded:
-                continue
-            expanded.add(child_id)
-            queue.append(child_id)
-
-    return expanded
+    return await dept_index.get_descendants(dept_ids)
 
 
 def _get_send_scope(notice: Notice) -> str:
@@ -12,6 +12,8 @@ from app.models.menu import Menu
 from app.models.role import DataScope, Role
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_role import SystemRoleCreate, SystemRoleOut, SystemRoleUpdate
+from app.services.data_scope import invalidate_data_scope_cache
+from app.services.menu import invalidate_menu_cache
 
 router = APIRouter()
 
@@ -35,12 +37,15 @@ async def _role_permissions(role: Role) -> list[int]:
 
 
 async def _set_role_permissions(role: Role, menu_ids: list[int]) -> None:
-    await role.menus.clear()
-    if not menu_ids:
-        return
-    menus = await Menu.filter(id__in=menu_ids).all()
-    if menus:
-        await role.menus.add(*menus)
+    try:
+        await role.menus.clear()
+        if not menu_ids:
+            return
+        menus = await Menu.filter(id__in=menu_ids).all()
+        if menus:
+            await role.menus.add(*menus)
+    finally:
+        invalidate_menu_cache()
 
 
 async def _set_role_depts(role: Role, dept_ids: list[int]) -> None:
@@ -171,6 +176,7 @@ async def update_role(
     if data_scope is not None:
         role.data_scope = data_scope
     await role.save()
+    invalidate_menu_cache()
 
     if permissions is not None:
         await _set_role_permissions(role, permissions)
@@ -183,6 +189,7 @@ async def update_role(
         if dept_ids is not None:
             await _set_role_depts(role, dept_ids)
 
+    invalidate_data_scope_cache()
     return ok(True)
 
 
@@ -204,6 +211,8 @@ async def delete_role(role_id: int, _user=Depends(require_permissions("System:Ro
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="默认用户角色不可删除")
 
     await role.delete()
+    invalidate_menu_cache()
+    invalidate_data_scope_cache()
     return ok(True)
 
 
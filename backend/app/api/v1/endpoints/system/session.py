@@ -11,6 +11,7 @@ from app.schemas.system_session import BatchKickRequest, SystemSessionOut
 from app.schemas.user import CurrentUser
 from app.services.data_scope import get_allowed_user_ids
 from app.services.session import session_service
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, paginate
 
 router = APIRouter()
 
@@ -28,9 +29,10 @@ async def list_sessions(
     username: str | None = Query(default=None),
     ip: str | None = Query(default=None),
     status_: int | None = Query(default=None, alias="status"),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
     current_user: CurrentUser = Depends(require_permissions("System:Session:List")),
 ):
-    """在线用户/会话列表（分页）。"""
+    """在线用户/会话列表（分页，支持游标模式）。"""
 
     qs = UserSession.all()
     allowed_user_ids = await get_allowed_user_ids(current_user)
@@ -43,8 +45,7 @@ async def list_sessions(
     if status_ in (0, 1):
         qs = qs.filter(status=status_)
 
-    total = await qs.count()
-    records = await qs.order_by("-id").offset((page - 1) * pageSize).limit(pageSize)
+    records, page_info = await paginate(qs, page=page, page_size=pageSize, cursor=cursor)
 
     now = datetime.now(UTC)
     items: list[SystemSessionOut] = []
@@ -71,7 +72,7 @@ async def list_sessions(
             ),
         )
 
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
 
 
 @router.delete("/{session_id}", response_model=ApiResponse[bool])
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
 import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
 from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from openpyxl import Workbook
+from pypika_tortoise import Table
 from starlette.responses import StreamingResponse
 from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 
 from app.api.v1.deps import require_permissions
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.security import ahash_password, ahash_passwords
 from app.models.dept import Dept
 from app.models.role import Role
 from app.models.user import User
 from app.schemas.import_export import ImportErrorItem, ImportResult
+from app.schemas.job import JobOut
 from app.schemas.response import ApiResponse, ok
 from app.schemas.system_user import (
     SystemUserCreate,
@@ -25,17 +31,34 @@ from app.schemas.system_user import (
     SystemUserUpdate,
 )
 from app.schemas.user import CurrentUser
-from app.services.data_scope import build_data_scope_q
-from app.utils.excel import ExcelColumn, append_sheet, export_xlsx_bytes, parse_xlsx_rows
+from app.services.data_scope import build_data_scope_q, invalidate_data_scope_cache
+from app.services.job import (
+    JobContext,
+    JobHandler,
+    finish_import_job,
+    job_runner,
+    job_to_out,
+    xlsx_export_handler,
+)
+from app.utils.excel import (
+    XLSX_MEDIA_TYPE,
+    ExcelColumn,
+    ExcelRowReader,
+    append_sheet,
+    stream_xlsx,
+    xlsx_stream_response,
+)
+from app.utils.pagination import CURSOR_QUERY_DESCRIPTION, iter_by_keyset, paginate
 
 router = APIRouter()
 
-_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# 用户导入每块处理的行数
+_IMPORT_CHUNK_SIZE = 500
 
 
 def _xlsx_response(content: bytes, filename: str) -> StreamingResponse:
     headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
-    return StreamingResponse(BytesIO(content), media_type=_XLSX_MEDIA_TYPE, headers=headers)
+    return StreamingResponse(BytesIO(content), media_type=XLSX_MEDIA_TYPE, headers=headers)
 
 
 def _user_export_columns() -> list[ExcelColumn]:
@@ -112,9 +135,10 @@ async def list_users(
     realName: str | None = Query(default=None),
     deptId: int | None = Query(default=None),
     status_: str | None = Query(default=None, alias="status"),
+    cursor: str | None = Query(default=None, description=CURSOR_QUERY_DESCRIPTION),
     current_user: CurrentUser = Depends(require_permissions("System:User:List")),
 ):
-    """获取用户列表（分页）。"""
+    """获取用户列表（分页，支持游标模式）。"""
 
     qs = User.all()
     data_q = await build_data_scope_q(current_user, dept_field="dept_id", user_field="id")
@@ -129,13 +153,8 @@ async def list_users(
     if status_ in {"0", "1"}:
         qs = qs.filter(is_active=(status_ == "1"))
 
-    total = await qs.count()
-    users = (
-        await qs.order_by("-id")
-        .offset((page - 1) * pageSize)
-        .limit(pageSize)
-        .prefetch_related("roles", "dept")
-    )
+    users, page_info = await paginate(qs, page=page, page_size=pageSize, cursor=cursor)
+    await User.fetch_for_list(users, "roles", "dept")
 
     items: list[SystemUserOut] = []
     for user in users:
@@ -156,18 +175,18 @@ async def list_users(
             ),
         )
 
-    return ok({"items": items, "total": total})
+    return ok({"items": items, **page_info})
 
 
-@router.get("/export")
-async def export_users(
-    username: str | None = Query(default=None),
-    realName: str | None = Query(default=None),
-    deptId: int | None = Query(default=None),
-    status_: str | None = Query(default=None, alias="status"),
-    current_user: CurrentUser = Depends(require_permissions("System:User:Export")),
-):
-    """导出用户列表（Excel）。"""
+async def _user_export_query(
+    current_user: CurrentUser,
+    *,
+    username: str | None,
+    realName: str | None,
+    deptId: int | None,
+    status_: str | None,
+) -> tuple[QuerySet[User], int]:
+    """构建导出查询（含数据范围），返回（查询, 总条数）；超出导出上限时报错。"""
 
     qs = User.all()
     data_q = await build_data_scope_q(current_user, dept_field="dept_id", user_field="id")
@@ -189,29 +208,81 @@ async def export_users(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"导出数据量过大（{total}），最大允许 {settings.EXCEL_EXPORT_MAX_ROWS} 行",
         )
+    return qs, total
 
-    users = await qs.order_by("-id").limit(settings.EXCEL_EXPORT_MAX_ROWS).prefetch_related(
-        "roles",
-        "dept",
-    )
 
-    rows: list[dict] = []
-    for u in users:
-        roles = list(u.roles) if hasattr(u, "roles") else []
-        rows.append(
+async def _user_export_batches(qs: QuerySet[User]) -> AsyncIterator[list[dict]]:
+    async for users in iter_by_keyset(qs, limit=settings.EXCEL_EXPORT_MAX_ROWS):
+        await User.fetch_for_list(users, "roles", "dept")
+        yield [
             {
                 "username": u.username,
                 "realName": u.real_name,
                 "deptName": u.dept.name if u.dept else None,
-                "roleNames": "、".join([str(r.name) for r in roles]),
+                "roleNames": "、".join([str(r.name) for r in u.roles]),
                 "statusText": "启用" if u.is_active else "禁用",
                 "createTime": _format_dt(u.created_at),
-            },
-        )
+            }
+            for u in users
+        ]
 
-    content = export_xlsx_bytes(sheet_name="用户列表", columns=_user_export_columns(), rows=rows)
+
+@router.get("/export")
+async def export_users(
+    username: str | None = Query(default=None),
+    realName: str | None = Query(default=None),
+    deptId: int | None = Query(default=None),
+    status_: str | None = Query(default=None, alias="status"),
+    current_user: CurrentUser = Depends(require_permissions("System:User:Export")),
+):
+    """导出用户列表（Excel，按批查询并流式输出）。"""
+
+    qs, _ = await _user_export_query(
+        current_user,
+        username=username,
+        realName=realName,
+        deptId=deptId,
+        status_=status_,
+    )
+    content = stream_xlsx(
+        sheet_name="用户列表",
+        columns=_user_export_columns(),
+        batches=_user_export_batches(qs),
+    )
     filename = f"用户列表_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
-    return _xlsx_response(content, filename)
+    return xlsx_stream_response(content, filename)
+
+
+@router.post("/export-jobs", response_model=ApiResponse[JobOut])
+async def create_user_export_job(
+    username: str | None = Query(default=None),
+    realName: str | None = Query(default=None),
+    deptId: int | None = Query(default=None),
+    status_: str | None = Query(default=None, alias="status"),
+    current_user: CurrentUser = Depends(require_permissions("System:User:Export")),
+):
+    """创建用户导出后台任务（立即返回任务，完成后通过 WebSocket 通知并提供下载）。"""
+
+    qs, total = await _user_export_query(
+        current_user,
+        username=username,
+        realName=realName,
+        deptId=deptId,
+        status_=status_,
+    )
+    job = await job_runner.submit(
+        kind="user_export",
+        title="导出用户列表",
+        creator_name=current_user.username,
+        handler=xlsx_export_handler(
+            file_name=f"用户列表_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx",
+            sheet_name="用户列表",
+            columns=_user_export_columns(),
+            batches=_user_export_batches(qs),
+            total=total,
+        ),
+    )
+    return ok(job_to_out(job))
 
 
 @router.get("/import/template")
@@ -279,31 +350,160 @@ async def import_users(
     file: UploadFile = File(..., description="xlsx 文件"),
     current_user: CurrentUser = Depends(require_permissions("System:User:Import")),
 ):
-    """批量导入用户（Excel）。"""
+    """批量导入用户（Excel，同步返回结果；大文件请使用 /import-jobs）。"""
+
+    content = await _read_import_file(file)
+    with _open_import_reader(content) as reader:
+        return ok(await _import_user_rows(reader, actor=current_user))
+
+
+@router.post("/import-jobs", response_model=ApiResponse[JobOut])
+async def create_user_import_job(
+    file: UploadFile = File(..., description="xlsx 文件"),
+    current_user: CurrentUser = Depends(require_permissions("System:User:Import")),
+):
+    """
+    创建用户导入后台任务（立即返回任务，完成后通过 WebSocket 通知）。
+
+    说明：
+    - 表头与行数在创建任务前校验，格式错误直接返回 400；
+    - 任务完成后 message 为汇总信息，有失败行时结果文件为失败明细（xlsx）。
+    """
+
+    content = await _read_import_file(file)
+    _open_import_reader(content).close()
+
+    job = await job_runner.submit(
+        kind="user_import",
+        title="导入用户",
+        creator_name=current_user.username,
+        handler=_user_import_job_handler(content, actor=current_user),
+    )
+    return ok(job_to_out(job))
+
 
+async def _read_import_file(file: UploadFile) -> bytes:
     if not file.filename or not file.filename.lower().endswith(".xlsx"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="仅支持 .xlsx 文件")
+    return await file.read()
+
+
+def _open_import_reader(content: bytes) -> ExcelRowReader:
+    """打开导入文件并校验表头与行数（不合法时抛出 400）。"""
 
-    content = await file.read()
     try:
-        parsed_rows, parse_errors = parse_xlsx_rows(
-            content=content,
-            columns=_user_import_columns(),
-        )
+        reader = ExcelRowReader(content=content, columns=_user_import_columns())
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    if len(parsed_rows) > settings.EXCEL_IMPORT_MAX_ROWS:
-        max_rows = settings.EXCEL_IMPORT_MAX_ROWS
+    max_rows = settings.EXCEL_IMPORT_MAX_ROWS
+    estimated_rows = reader.estimated_rows
+    if estimated_rows is not None and estimated_rows > max_rows:
+        reader.close()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"导入数据量过大（{len(parsed_rows)}），最大允许 {max_rows} 行",
+            detail=f"导入数据量过大（{estimated_rows}），最大允许 {max_rows} 行",
         )
+    return reader
 
-    result = ImportResult(total=len(parsed_rows))
-    bad_rows = {e.row for e in parse_errors}
-    for e in parse_errors:
-        result.errors.append(ImportErrorItem(row=e.row, column=e.column, message=e.message))
+
+def _user_import_job_handler(content: bytes, *, actor: CurrentUser) -> JobHandler:
+    async def handler(ctx: JobContext) -> None:
+        with _open_import_reader(content) as reader:
+            result = await _import_user_rows(reader, actor=actor, on_progress=ctx.set_progress)
+        await finish_import_job(
+            ctx,
+            result,
+            file_name=f"用户导入失败明细_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx",
+        )
+
+    return handler
+
+
+@dataclass(slots=True)
+class _PendingImportUser:
+    """校验通过、待写入的导入行。"""
+
+    row_idx: int
+    username: str
+    password: str
+    real_name: str
+    is_active: bool
+    dept_id: int | None
+    role_ids: list[int]
+
+
+async def _bulk_create_import_users(
+    items: list[_PendingImportUser],
+    password_hashes: list[str],
+) -> None:
+    """
+    在一个事务内批量写入用户及其角色关系。
+
+    说明：
+    - 用户使用 bulk_create 批量插入，再按用户名一次查回 ID；
+    - 用户-角色关系直接批量 INSERT 到 sys_user_role（新用户无已有关系，无需逐个 clear/add）。
+    """
+
+    roles_field = User._meta.fields_map["roles"]
+    through = Table(roles_field.through)
+
+    async with in_transaction() as conn:
+        await User.bulk_create(
+            [
+                User(
+                    username=item.username,
+                    password_hash=password_hash,
+                    real_name=item.real_name,
+                    is_active=item.is_active,
+                    dept_id=item.dept_id,
+                )
+                for item, password_hash in zip(items, password_hashes, strict=True)
+            ],
+            batch_size=_IMPORT_CHUNK_SIZE,
+            using_db=conn,
+        )
+        id_by_username = dict(
+            await User.filter(username__in=[item.username for item in items])
+            .using_db(conn)
+            .values_list("username", "id"),
+        )
+
+        pairs = [
+            (int(id_by_username[item.username]), role_id)
+            for item in items
+            for role_id in dict.fromkeys(item.role_ids)
+        ]
+        # 每条 INSERT 限制行数，避免超出数据库单条语句的参数个数上限
+        batch = 400
+        for start in range(0, len(pairs), batch):
+            query = conn.query_class.into(through).columns(
+                through[roles_field.backward_key],
+                through[roles_field.forward_key],
+            )
+            for user_id, role_id in pairs[start : start + batch]:
+                query = query.insert(user_id, role_id)
+            await conn.execute_query(*query.get_parameterized_sql())
+
+
+async def _import_user_rows(
+    reader: ExcelRowReader,
+    *,
+    actor: CurrentUser,
+    on_progress: Callable[[int, int | None], Awaitable[None]] | None = None,
+) -> ImportResult:
+    """
+    逐行读取并按块导入用户（调用方需先通过 _open_import_reader 校验行数）。
+
+    说明：
+    - 行数据按需从 Excel 读取，每 _IMPORT_CHUNK_SIZE 行校验并写入一次，内存占用与文件大小无关；
+    - 已存在用户名按块批量查询，避免逐行 exists() 查询；
+    - 每块校验通过的行在一个事务内批量写入用户与角色关系，失败时该块逐行重试以定位出错行；
+    - on_progress：每块处理完后回调（已处理行数, 预估总行数），用于后台任务汇报进度。
+    """
+
+    max_rows = settings.EXCEL_IMPORT_MAX_ROWS
+    result = ImportResult(total=0)
 
     # 预加载角色与部门（减少循环内的数据库查询次数）
     roles = await Role.filter(status=1).all()
@@ -351,86 +551,148 @@ async def import_users(
             codes.append(p)
         return codes
 
-    # 一次性查出本次导入中“已存在”的用户名，避免逐行 exists() 查询
-    import_usernames: list[str] = []
-    for row_idx, row in parsed_rows:
-        if row_idx in bad_rows:
-            continue
-        u = row.get("username")
-        if isinstance(u, str) and u.strip():
-            import_usernames.append(u.strip())
-    existing_usernames = set()
-    if import_usernames:
-        unique_usernames = list(set(import_usernames))
-        existing_usernames = set(
-            await User.filter(username__in=unique_usernames).values_list(
-                "username",
-                flat=True,
-            ),
-        )
-
     seen_in_file: set[str] = set()
-    for row_idx, row in parsed_rows:
-        if row_idx in bad_rows:
-            result.failed += 1
-            continue
 
-        try:
-            username = str(row.get("username") or "").strip()
-            password = str(row.get("password") or "").strip()
-            real_name = str(row.get("realName") or "").strip()
-            dept_name = str(row.get("deptName") or "").strip()
-            role_codes = parse_role_codes(row.get("roleCodes"))
-            status_val = parse_status(row.get("status"))
-
-            if not username:
-                raise ValueError("用户名不能为空")
-            if username in seen_in_file:
-                raise ValueError("用户名在文件中重复")
-            seen_in_file.add(username)
-            if username in existing_usernames:
-                raise ValueError("用户名已存在")
-            if not real_name:
-                raise ValueError("姓名不能为空")
-
-            _validate_password(password)
-
-            dept = None
-            if dept_name:
-                cands = dept_by_name.get(dept_name) or []
-                if not cands:
-                    raise ValueError(f"部门不存在：{dept_name}")
-                if len(cands) > 1:
-                    raise ValueError(f"部门名称不唯一，请使用更精确的部门：{dept_name}")
-                dept = cands[0]
-
-            role_ids: list[int] = []
-            if role_codes:
-                for code in role_codes:
-                    role = role_by_code.get(code)
-                    if not role:
-                        raise ValueError(f"角色不存在或已禁用：{code}")
-                    role_ids.append(int(role.id))
-
-            user = await User.create(
-                username=username,
-                password_hash=get_password_hash(password),
-                real_name=real_name,
-                is_active=status_val == 1,
-                dept=dept,
+    actor_is_super = settings.SUPERUSER_ROLE_CODE in actor.roles
+    default_role_id: int | None = None
+
+    async def get_default_role_id() -> int:
+        # 未填写角色时分配普通用户角色（与手动创建用户一致）
+        nonlocal default_role_id
+        if default_role_id is None:
+            role, _ = await Role.get_or_create(code="user", defaults={"name": "普通用户"})
+            default_role_id = int(role.id)
+        return default_role_id
+
+    def record_failure(row_idx: int, exc: Exception) -> None:
+        result.failed += 1
+        msg = str(exc.detail) if isinstance(exc, HTTPException) else str(exc)
+        result.errors.append(ImportErrorItem(row=row_idx, column=None, message=msg))
+
+    async def import_chunk(chunk: list[tuple[int, dict]]) -> None:
+        chunk_rows = {row_idx for row_idx, _ in chunk}
+        bad_rows: set[int] = set()
+        for e in reader.errors:
+            if e.row in chunk_rows:
+                bad_rows.add(e.row)
+                result.errors.append(ImportErrorItem(row=e.row, column=e.column, message=e.message))
+
+        # 一次性查出本块中“已存在”的用户名，避免逐行 exists() 查询
+        chunk_usernames: set[str] = set()
+        for row_idx, row in chunk:
+            u = row.get("username")
+            if row_idx not in bad_rows and isinstance(u, str) and u.strip():
+                chunk_usernames.add(u.strip())
+        existing_usernames: set[str] = set()
+        if chunk_usernames:
+            existing_usernames = set(
+                await User.filter(username__in=list(chunk_usernames)).values_list(
+                    "username",
+                    flat=True,
+                ),
             )
-            await _set_user_roles(user, role_ids, actor=current_user)
 
-            result.success += 1
-        except Exception as exc:  # noqa: BLE001 - 需要汇总错误并继续处理下一行
-            result.failed += 1
-            if isinstance(exc, HTTPException):
-                msg = str(exc.detail)
-            else:
-                msg = str(exc)
-            result.errors.append(ImportErrorItem(row=row_idx, column=None, message=msg))
+        pending: list[_PendingImportUser] = []
+        for row_idx, row in chunk:
+            if row_idx in bad_rows:
+                result.failed += 1
+                continue
+
+            try:
+                username = str(row.get("username") or "").strip()
+                password = str(row.get("password") or "").strip()
+                real_name = str(row.get("realName") or "").strip()
+                dept_name = str(row.get("deptName") or "").strip()
+                role_codes = parse_role_codes(row.get("roleCodes"))
+                status_val = parse_status(row.get("status"))
+
+                if not username:
+                    raise ValueError("用户名不能为空")
+                if username in seen_in_file:
+                    raise ValueError("用户名在文件中重复")
+                seen_in_file.add(username)
+                if username in existing_usernames:
+                    raise ValueError("用户名已存在")
+                if not real_name:
+                    raise ValueError("姓名不能为空")
+
+                _validate_password(password)
+
+                dept = None
+                if dept_name:
+                    cands = dept_by_name.get(dept_name) or []
+                    if not cands:
+                        raise ValueError(f"部门不存在：{dept_name}")
+                    if len(cands) > 1:
+                        raise ValueError(f"部门名称不唯一，请使用更精确的部门：{dept_name}")
+                    dept = cands[0]
+
+                role_ids: list[int] = []
+                if role_codes:
+                    for code in role_codes:
+                        role = role_by_code.get(code)
+                        if not role:
+                            raise ValueError(f"角色不存在或已禁用：{code}")
+                        if code == settings.SUPERUSER_ROLE_CODE and not actor_is_super:
+                            raise ValueError("无权限授予超级管理员角色")
+                        role_ids.append(int(role.id))
+                else:
+                    role_ids.append(await get_default_role_id())
+
+                pending.append(
+                    _PendingImportUser(
+                        row_idx=row_idx,
+                        username=username,
+                        password=password,
+                        real_name=real_name,
+                        is_active=status_val == 1,
+                        dept_id=int(dept.id) if dept else None,
+                        role_ids=role_ids,
+                    ),
+                )
+            except Exception as exc:  # noqa: BLE001 - 需要汇总错误并继续处理下一行
+                record_failure(row_idx, exc)
+
+        if not pending:
+            return
+
+        # 校验通过的行并行计算密码哈希（线程池 + 并发上限，不阻塞事件循环）
+        password_hashes = await ahash_passwords(item.password for item in pending)
+
+        try:
+            await _bulk_create_import_users(pending, password_hashes)
+            result.success += len(pending)
+        except Exception:  # noqa: BLE001 - 批量写入失败（如并发导入同名用户）时逐行重试，定位出错行
+            for item, password_hash in zip(pending, password_hashes, strict=True):
+                try:
+                    await _bulk_create_import_users([item], [password_hash])
+                    result.success += 1
+                except Exception as exc:  # noqa: BLE001 - 需要汇总错误并继续处理下一行
+                    record_failure(item.row_idx, exc)
+
+    chunk: list[tuple[int, dict]] = []
+    for row_idx, row in reader:
+        if result.total >= max_rows:
+            # 文件未记录准确行数时，超出上限的行不再导入
+            result.errors.append(
+                ImportErrorItem(
+                    row=row_idx,
+                    column=None,
+                    message=f"超过最大导入行数 {max_rows}，其余行未导入",
+                ),
+            )
+            break
+        result.total += 1
+        chunk.append((row_idx, row))
+        if len(chunk) >= _IMPORT_CHUNK_SIZE:
+            await import_chunk(chunk)
+            chunk = []
+            if on_progress is not None:
+                await on_progress(result.total, reader.estimated_rows)
+    if chunk:
+        await import_chunk(chunk)
 
-    return ok(result)
+    return result
 
 
 @router.post("", response_model=ApiResponse[int])
@@ -457,7 +719,7 @@ async def create_user(
 
     user = await User.create(
         username=username,
-        password_hash=get_password_hash(payload.password),
+        password_hash=await ahash_password(payload.password),
         real_name=payload.realName,
         is_active=payload.status == 1,
         avatar=payload.avatar,
@@ -526,6 +788,7 @@ async def update_user(
     if payload.roleIds is not None:
         await _set_user_roles(user, payload.roleIds, actor=current_user)
 
+    invalidate_data_scope_cache()
     return ok(True)
 
 
@@ -547,6 +810,7 @@ async def delete_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="超级管理员不可删除")
 
     await user.delete()
+    invalidate_data_scope_cache()
     return ok(True)
 
 
@@ -564,7 +828,7 @@ async def reset_password(
 
     _validate_password(payload.password)
 
-    user.password_hash = get_password_hash(payload.password)
+    user.password_hash = await ahash_password(payload.password)
     await user.save()
     return ok(True)
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.v1.deps import get_current_user
-from app.core.security import get_password_hash, verify_password
+from app.core.security import ahash_password, averify_password
 from app.models.user import User
 from app.schemas.response import ApiResponse, ok
 from app.schemas.user import CurrentUser, UserChangePassword, UserInfo, UserProfileUpdate
@@ -65,7 +65,7 @@ async def change_password(
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="用户不存在")
 
-    if not verify_password(payload.oldPassword, user.password_hash):
+    if not await averify_password(payload.oldPassword, user.password_hash):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="旧密码不正确")
 
     new_pwd = payload.newPassword
@@ -82,7 +82,7 @@ async def change_password(
             detail="新密码不能与旧密码相同",
         )
 
-    user.password_hash = get_password_hash(new_pwd)
+    user.password_hash = await ahash_password(new_pwd)
     await user.save()
 
     return ok(True)
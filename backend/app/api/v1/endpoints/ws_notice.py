@@ -15,6 +15,8 @@ async def notice_ws(websocket: WebSocket, token: str = Query(default="")):
     约定：
     - 前端通过 query 传入 token：/ws/notice?token=xxx
     - token 解析失败则直接关闭连接
+    - 服务端定期推送 ping 事件，客户端需回复任意文本（如 pong），长时间无消息的连接会被断开
+    - 会话过期后服务端主动关闭连接（1008）
     """
 
     await websocket.accept()
@@ -39,13 +41,24 @@ async def notice_ws(websocket: WebSocket, token: str = Query(default="")):
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
 
-    await notice_ws_manager.connect(current_user.username, current_user.jti, websocket)
+    expires_at = await session_service.get_expires_at(
+        username=current_user.username,
+        jti=current_user.jti,
+    )
+    conn = await notice_ws_manager.connect(
+        current_user.username,
+        current_user.jti,
+        websocket,
+        expires_at=expires_at,
+    )
 
     try:
         while True:
-            # 当前阶段仅用于保持连接；后续可扩展：客户端订阅、心跳、回执等
+            # 客户端消息目前只用作心跳回复（pong），任意消息都刷新活跃时间
             await websocket.receive_text()
-    except WebSocketDisconnect:
+            conn.touch()
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError：服务端已主动关闭连接（如慢消费者剔除）后继续读取
         pass
     finally:
-        await notice_ws_manager.disconnect(current_user.username, current_user.jti, websocket)
+        await notice_ws_manager.disconnect(conn)
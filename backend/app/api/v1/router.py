@@ -2,7 +2,17 @@
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, health, menu, monitor, notice, system, user, ws_notice
+from app.api.v1.endpoints import (
+    auth,
+    health,
+    job,
+    menu,
+    monitor,
+    notice,
+    system,
+    user,
+    ws_notice,
+)
 
 router = APIRouter()
 
@@ -13,4 +23,5 @@ router.include_router(menu.router, prefix="/menu", tags=["菜单"])
 router.include_router(notice.router, prefix="/notice", tags=["消息通知"])
 router.include_router(system.router, prefix="/system", tags=["系统"])
 router.include_router(monitor.router, prefix="/monitor", tags=["监控"])
+router.include_router(job.router, prefix="/jobs", tags=["后台任务"])
 router.include_router(ws_notice.router, tags=["WebSocket"])
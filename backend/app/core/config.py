@@ -53,10 +53,109 @@ class Settings(BaseSettings):
         description="AccessToken 过期分钟数",
     )
 
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=0,
+        description="密码哈希（bcrypt）线程池大小（0 表示按 CPU 核数自动取值，最多 4；至少 2）",
+    )
+    PASSWORD_HASH_BULK_CONCURRENCY: int = Field(
+        default=0,
+        description="批量导入合计并发的密码哈希数（0 或过大时取线程池大小减 1，为登录预留线程）",
+    )
+
     SESSION_LOGIN_MODE: str | None = Field(
         default=None,
         description="登录会话模式：single/multi（为空则读取系统配置 auth.login.mode，默认 multi）",
     )
+    SESSION_CACHE_TTL_SECONDS: int = Field(
+        default=10,
+        description="会话校验缓存有效期（秒，0 表示关闭；也是其他 worker 强制下线的最大生效延迟）",
+    )
+    SESSION_CACHE_MAX_SIZE: int = Field(default=10000, description="会话校验缓存最大条目数")
+    SESSION_STORE: str = Field(
+        default="local",
+        description="会话状态存储：local=进程内缓存，redis=Redis 共享存储（需配置 REDIS_URL）",
+    )
+    SESSION_HEARTBEAT_FLUSH_SECONDS: int = Field(
+        default=10,
+        description="会话最后活跃时间批量写库间隔（秒）",
+    )
+
+    WS_BROKER: str = Field(
+        default="local",
+        description="WebSocket 广播总线：local=进程内，redis=Redis Pub/Sub（需配置 REDIS_URL）",
+    )
+
+    WS_SEND_QUEUE_SIZE: int = Field(
+        default=100,
+        description="每个 WebSocket 连接的发送队列长度（队列满时断开该慢客户端）",
+    )
+
+    WS_HEARTBEAT_INTERVAL_SECONDS: int = Field(
+        default=25,
+        description="WebSocket 心跳间隔（秒）：发送 ping 并检查空闲/过期连接；<=0 表示关闭",
+    )
+
+    WS_IDLE_TIMEOUT_SECONDS: int = Field(
+        default=75,
+        description="WebSocket 空闲超时（秒）：超过该时间未收到客户端消息则断开；<=0 表示不检查",
+    )
+
+    PERMISSION_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="权限相关缓存（权限码、路由菜单、部门层级）有效期（秒，0 表示关闭）",
+    )
+
+    DATA_SCOPE_CACHE_TTL_SECONDS: int = Field(
+        default=5,
+        description="数据范围计算结果缓存有效期（秒，0 表示仅在单个请求内复用）",
+    )
+
+    DATA_SCOPE_QUERY_MODE: str = Field(
+        default="in",
+        description="数据范围部门过滤方式：in=IN 列表，cte=递归 CTE 子查询（PostgreSQL/SQLite）",
+    )
+
+    OPERATION_LOG_QUEUE_SIZE: int = Field(default=10000, description="操作日志写入队列容量")
+    OPERATION_LOG_BATCH_SIZE: int = Field(default=200, description="操作日志单次批量写入条数")
+    OPERATION_LOG_FLUSH_MS: int = Field(default=500, description="操作日志批量写入间隔（毫秒）")
+    OPERATION_LOG_OVERFLOW: str = Field(
+        default="drop_oldest",
+        description="操作日志队列满时的策略：drop_oldest=丢弃最早日志并计数，block=等待队列空位",
+    )
+
+    OPERATION_LOG_RETENTION_DAYS: int = Field(
+        default=0,
+        description="操作日志保留天数（0 表示不自动清理）",
+    )
+    LOGIN_LOG_RETENTION_DAYS: int = Field(
+        default=0,
+        description="登录日志保留天数（0 表示不自动清理）",
+    )
+    LOG_RETENTION_INTERVAL_SECONDS: int = Field(
+        default=3600,
+        description="日志分区维护与过期清理的执行间隔（秒，最小 60）",
+    )
+    LOG_PARTITION_PREMAKE_MONTHS: int = Field(
+        default=2,
+        description="日志分区预建月数（PostgreSQL，除当月外提前创建的月分区数）",
+    )
+    LOG_RETENTION_BATCH_SIZE: int = Field(
+        default=5000,
+        description="过期日志分批删除时每批的行数",
+    )
+
+    LOG_ARCHIVE_ENABLED: bool = Field(
+        default=False,
+        description="过期日志删除前是否先归档到 FILE_STORAGE_ROOT/archive",
+    )
+    LOG_ARCHIVE_FORMAT: str = Field(
+        default="ndjson",
+        description="日志归档格式：ndjson=gzip 压缩的 NDJSON，parquet=zstd 压缩（需安装 pyarrow）",
+    )
+    LOG_ARCHIVE_FILE_MAX_ROWS: int = Field(
+        default=1000000,
+        description="单个日志归档文件的最大行数",
+    )
 
     INIT_SUPERUSER: bool = Field(
         default=False,
@@ -81,9 +180,35 @@ class Settings(BaseSettings):
     )
     FILE_MAX_SIZE_MB: int = Field(default=50, description="上传文件大小限制（MB）")
 
-    EXCEL_EXPORT_MAX_ROWS: int = Field(default=20000, description="Excel 导出最大行数")
+    EXCEL_EXPORT_MAX_ROWS: int = Field(
+        default=1000000,
+        description="Excel 导出最大行数（流式导出，内存占用与行数无关；xlsx 单表上限 1048575 行）",
+    )
     EXCEL_IMPORT_MAX_ROWS: int = Field(default=5000, description="Excel 导入最大行数")
 
+    COUNT_ESTIMATE_MIN_ROWS: int = Field(
+        default=100000,
+        description="日志列表无过滤条件时，PostgreSQL 估算行数达到该值才使用估算总数",
+    )
+    COUNT_EXACT_MAX: int = Field(
+        default=10000,
+        description="日志列表带过滤条件时最多精确统计的行数（超过显示为近似值，0 表示不限制）",
+    )
+    COUNT_CACHE_TTL_SECONDS: int = Field(
+        default=10,
+        description="日志列表总数缓存有效期（秒，0 表示关闭）",
+    )
+
+    JOB_MAX_CONCURRENCY: int = Field(default=2, description="每个进程同时执行的后台任务数")
+    JOB_STALE_SECONDS: int = Field(
+        default=600,
+        description="未完成任务的执行进程超过该秒数未刷新心跳时，视为已中断（进程异常退出遗留）",
+    )
+    JOB_RESULT_TTL_HOURS: int = Field(
+        default=72,
+        description="后台任务结果文件保留小时数（过期后删除文件并标记为 expired，0 表示永久保留）",
+    )
+
     @model_validator(mode="after")
     def build_database_url(self) -> "Settings":
         """
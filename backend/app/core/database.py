@@ -133,6 +133,7 @@ def build_tortoise_config() -> dict:
                     "app.models.dict",
                     "app.models.config",
                     "app.models.log",
+                    "app.models.job",
                     "aerich.models",
                 ],
                 "default_connection": "default",
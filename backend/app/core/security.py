@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
@@ -32,6 +36,94 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+# bcrypt 计算时会释放 GIL，用独立线程池即可利用多核，且不占用默认线程池
+_hash_executor: ThreadPoolExecutor | None = None
+
+# 所有批量哈希调用共享的并发上限（多个导入同时进行时合计也不会占满线程池）
+_bulk_semaphore: asyncio.Semaphore | None = None
+
+
+def _password_hash_workers() -> int:
+    # 至少 2 个线程：批量哈希最多占用 workers - 1 个，始终为登录校验留出一个
+    workers = int(settings.PASSWORD_HASH_WORKERS or 0)
+    if workers <= 0:
+        workers = min(4, os.cpu_count() or 1)
+    return max(2, workers)
+
+
+def _bulk_hash_limit() -> int:
+    reserved_limit = _password_hash_workers() - 1
+    limit = int(settings.PASSWORD_HASH_BULK_CONCURRENCY or 0)
+    return min(limit, reserved_limit) if limit > 0 else reserved_limit
+
+
+def _get_bulk_semaphore() -> asyncio.Semaphore:
+    global _bulk_semaphore
+
+    if _bulk_semaphore is None:
+        _bulk_semaphore = asyncio.Semaphore(_bulk_hash_limit())
+    return _bulk_semaphore
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=_password_hash_workers(),
+            thread_name_prefix="password-hash",
+        )
+    return _hash_executor
+
+
+def shutdown_password_executor() -> None:
+    """关闭密码哈希线程池（应用关闭时调用）。"""
+
+    global _hash_executor, _bulk_semaphore
+
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+    _bulk_semaphore = None
+
+
+async def ahash_password(password: str) -> str:
+    """生成密码哈希（在线程池中执行，不阻塞事件循环）。"""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), get_password_hash, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """校验密码（在线程池中执行，不阻塞事件循环）。"""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_hash_executor(),
+        verify_password,
+        plain_password,
+        hashed_password,
+    )
+
+
+async def ahash_passwords(passwords: Iterable[str]) -> list[str]:
+    """
+    批量生成密码哈希（用于批量导入）。
+
+    说明：
+    - 多个哈希并行计算，所有批量调用合计的在途数量不超过 PASSWORD_HASH_BULK_CONCURRENCY；
+    - 上限最多为线程池大小减 1，保证批量导入期间登录等请求始终有空闲线程可用。
+    """
+
+    semaphore = _get_bulk_semaphore()
+
+    async def hash_one(password: str) -> str:
+        async with semaphore:
+            return await ahash_password(password)
+
+    return list(await asyncio.gather(*(hash_one(p) for p in passwords)))
+
+
 def create_access_token(
     subject: str,
     roles: list[str] | None = None,
@@ -400,6 +400,16 @@ async def seed_system_menus_and_roles() -> None:
     if system_dict_data_delete.parent_id != system_dict_data.id:
         system_dict_data_delete.parent_id = system_dict_data.id
         await system_dict_data_delete.save(update_fields=["parent_id"])
+    system_dict_data_export = await _get_or_create_menu(
+        name="SystemDictDataExport",
+        parent=system_dict_data,
+        defaults={
+            "type": "button",
+            "auth_code": "System:DictData:Export",
+            "meta": {"title": "common.export"},
+            "status": 1,
+        },
+    )
 
     # 参数配置
     system_config = await _get_or_create_menu(
@@ -771,6 +781,16 @@ async def seed_system_menus_and_roles() -> None:
             "status": 1,
         },
     )
+    monitor_operation_log_export = await _get_or_create_menu(
+        name="MonitorOperationLogExport",
+        parent=monitor_operation_log,
+        defaults={
+            "type": "button",
+            "auth_code": "Monitor:OperationLog:Export",
+            "meta": {"title": "common.export"},
+            "status": 1,
+        },
+    )
 
     # 日志审计：登录日志
     expected_login_log_path = "/system/monitor/login-log"
@@ -808,6 +828,16 @@ async def seed_system_menus_and_roles() -> None:
             "status": 1,
         },
     )
+    monitor_login_log_export = await _get_or_create_menu(
+        name="MonitorLoginLogExport",
+        parent=monitor_login_log,
+        defaults={
+            "type": "button",
+            "auth_code": "Monitor:LoginLog:Export",
+            "meta": {"title": "common.export"},
+            "status": 1,
+        },
+    )
 
     # 默认角色：user
     user_role, _ = await Role.get_or_create(code="user", defaults={"name": "普通用户"})
@@ -845,6 +875,7 @@ async def seed_system_menus_and_roles() -> None:
         system_dict_data_create,
         system_dict_data_edit,
         system_dict_data_delete,
+        system_dict_data_export,
         system_config,
         system_config_create,
         system_config_edit,
@@ -853,6 +884,8 @@ async def seed_system_menus_and_roles() -> None:
         monitor_login_log,
         monitor_operation_log_delete,
         monitor_login_log_delete,
+        monitor_operation_log_export,
+        monitor_login_log_export,
         system_tools_form_generator,
     )
 
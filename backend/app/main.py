@@ -7,7 +7,7 @@ FastAPI 应用入口。
 
 import time
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -16,8 +16,16 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.api.router import api_router
 from app.core.config import settings
 from app.core.database import init_db
-from app.middlewares.audit import try_write_operation_log
+from app.core.security import shutdown_password_executor
+from app.middlewares.audit import AuditLogMiddleware
 from app.schemas.response import fail
+from app.services.job import job_runner
+from app.services.log_retention import log_retention_service
+from app.services.log_search import operation_log_search
+from app.services.operation_log_writer import operation_log_writer
+from app.services.session import session_service
+from app.utils.cache import close_redis
+from app.ws.notice import notice_ws_manager
 
 
 def create_app() -> FastAPI:
@@ -75,23 +83,28 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    @app.middleware("http")
-    async def audit_log_middleware(request: Request, call_next):  # noqa: ANN001
-        start = time.perf_counter()
-        response = await call_next(request)
-        duration_ms = int((time.perf_counter() - start) * 1000)
-        await try_write_operation_log(
-            request=request,
-            status_code=response.status_code,
-            duration_ms=duration_ms,
-        )
-        return response
+    app.add_middleware(AuditLogMiddleware)
 
     app.include_router(api_router)
 
     # 数据库初始化（如果连接配置不正确会在启动期暴露问题）
     init_db(app)
 
+    # 后台任务：在 Tortoise 初始化之后启动，关闭时先于数据库连接释放前停止（会写入剩余数据）
+    app.add_event_handler("startup", notice_ws_manager.start)
+    app.add_event_handler("startup", session_service.start)
+    app.add_event_handler("startup", operation_log_writer.start)
+    app.add_event_handler("startup", job_runner.start)
+    app.add_event_handler("startup", operation_log_search.ensure_index)
+    app.add_event_handler("startup", log_retention_service.start)
+    app.add_event_handler("shutdown", log_retention_service.stop)
+    app.add_event_handler("shutdown", job_runner.stop)
+    app.add_event_handler("shutdown", session_service.stop)
+    app.add_event_handler("shutdown", operation_log_writer.stop)
+    app.add_event_handler("shutdown", notice_ws_manager.stop)
+    app.add_event_handler("shutdown", close_redis)
+    app.add_event_handler("shutdown", shutdown_password_executor)
+
     return app
 
 
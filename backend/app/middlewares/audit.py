@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import json
+import time
+from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.models.log import OperationLog
 from app.services.auth import auth_service
+from app.services.operation_log_writer import operation_log_writer
+
+# 审计最多采集的请求体字节数（超出部分不缓存，也不写入日志）
+_MAX_CAPTURE_BYTES = 8 * 1024
 
 _SENSITIVE_KEYS = {
     "password",
@@ -56,11 +63,25 @@ def _derive_module(path: str) -> str | None:
     return None
 
 
+def _should_audit(method: str, path: str) -> bool:
+    """默认仅记录非 GET 请求，并跳过登录/注册等包含敏感信息的接口与 WS。"""
+
+    if method.upper() == "GET":
+        return False
+    if path.startswith("/api/v1/auth/"):
+        return False
+    if path.startswith("/api/v1/ws"):
+        return False
+    return True
+
+
 async def try_write_operation_log(
     *,
     request: Request,
     status_code: int,
     duration_ms: int,
+    body: bytes | None = None,
+    body_truncated: bool = False,
     response_summary: str | None = None,
 ) -> None:
     """
@@ -69,16 +90,12 @@ async def try_write_operation_log(
     说明：
     - 默认仅记录非 GET 请求（减少噪声与写入压力）。
     - 对登录/注册等包含敏感信息的接口做跳过。
+    - 日志交给后台写入器批量落库，请求本身不等待 INSERT。
     """
 
     method = request.method.upper()
-    if method == "GET":
-        return
-
     path = request.url.path
-    if path.startswith("/api/v1/auth/"):
-        return
-    if path.startswith("/api/v1/ws"):
+    if not _should_audit(method, path):
         return
 
     username: str | None = None
@@ -102,12 +119,12 @@ async def try_write_operation_log(
         pass
 
     try:
-        content_type = (request.headers.get("content-type") or "").lower()
-        if "application/json" in content_type:
-            body = await request.body()
-            if body:
-                data = json.loads(body.decode("utf-8"))
-                request_payload["body"] = _mask_sensitive(data)
+        if body_truncated:
+            # 请求体超过采集上限：无法完整解析与脱敏，只记录标记
+            request_payload["body"] = {"truncated": True}
+        elif body:
+            data = json.loads(body.decode("utf-8"))
+            request_payload["body"] = _mask_sensitive(data)
     except Exception:
         # 解析失败不影响主流程
         pass
@@ -120,18 +137,79 @@ async def try_write_operation_log(
         request_data = None
 
     try:
-        await OperationLog.create(
-            username=username,
-            module=_derive_module(path),
-            action=_derive_action(method),
-            method=method,
-            url=path,
-            ip=ip,
-            request_data=request_data,
-            response_data=(response_summary or None),
-            status=1 if status_code < 400 else 0,
-            duration=duration_ms,
+        await operation_log_writer.submit(
+            OperationLog(
+                username=username,
+                module=_derive_module(path),
+                action=_derive_action(method),
+                method=method,
+                url=path,
+                ip=ip,
+                request_data=request_data,
+                response_data=(response_summary or None),
+                status=1 if status_code < 400 else 0,
+                duration=duration_ms,
+                created_at=datetime.now(UTC),
+            ),
         )
     except Exception:
         # 日志写入失败不应影响正常业务
         return
+
+
+class AuditLogMiddleware:
+    """
+    审计日志中间件（纯 ASGI 实现）。
+
+    说明：
+    - 不重复读取请求体：包装 receive，在请求体流经时顺带采集前 8KB 的 JSON 内容；
+    - 不包装响应体：send 只用于获取状态码，响应原样透传；
+    - 大文件上传等非 JSON 请求不缓存请求体；
+    - 耗时统计到应用处理完成（响应发送结束）为止。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _should_audit(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        capture = "application/json" in (request.headers.get("content-type") or "").lower()
+        chunks: list[bytes] = []
+        captured = 0
+        truncated = False
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal captured, truncated
+            message = await receive()
+            if capture and not truncated and message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                if captured + len(chunk) > _MAX_CAPTURE_BYTES:
+                    truncated = True
+                    chunks.clear()
+                elif chunk:
+                    chunks.append(chunk)
+                    captured += len(chunk)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            await try_write_operation_log(
+                request=request,
+                status_code=status_code,
+                duration_ms=int((time.perf_counter() - start) * 1000),
+                body=b"".join(chunks) if capture else None,
+                body_truncated=truncated,
+            )
@@ -0,0 +1,63 @@
+"""后台任务相关模型。"""
+
+from tortoise import fields
+
+from app.models.base import BaseModel
+
+
+class JobStatus:
+    """后台任务状态。"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    # 成功任务的结果文件超过 JOB_RESULT_TTL_HOURS 后被清理
+    EXPIRED = "expired"
+
+    UNFINISHED = (PENDING, RUNNING)
+
+
+class SysJob(BaseModel):
+    """后台任务（导入/导出等长耗时操作）。"""
+
+    kind = fields.CharField(max_length=50, description="任务类型：如 user_export/dict_data_export")
+    title = fields.CharField(max_length=100, description="任务名称")
+    status = fields.CharField(
+        max_length=20,
+        default=JobStatus.PENDING,
+        description="状态：pending/running/success/failed/expired",
+    )
+    progress = fields.IntField(default=0, description="进度（0-100）")
+    total = fields.IntField(null=True, description="总条数（未知时为空）")
+    processed = fields.IntField(default=0, description="已处理条数")
+    message = fields.CharField(max_length=500, null=True, description="结果说明/失败原因")
+
+    # 结果文件：本地存储时为相对于 FILE_STORAGE_ROOT 的路径（使用 / 分隔）
+    result_object_key = fields.CharField(max_length=500, null=True, description="结果文件 key")
+    result_file_name = fields.CharField(max_length=255, null=True, description="结果文件下载名")
+
+    creator = fields.ForeignKeyField(
+        "models.User",
+        related_name="jobs",
+        null=True,
+        on_delete=fields.SET_NULL,
+        description="创建人",
+    )
+    creator_name = fields.CharField(max_length=50, null=True, description="创建人用户名（冗余）")
+
+    # 执行实例（进程）定期刷新心跳；心跳超过 JOB_STALE_SECONDS 未更新的未完成任务视为已中断
+    owner = fields.CharField(max_length=64, null=True, description="执行实例 ID")
+    heartbeat_at = fields.DatetimeField(null=True, description="执行实例最近心跳时间")
+
+    started_at = fields.DatetimeField(null=True, description="开始时间")
+    finished_at = fields.DatetimeField(null=True, description="结束时间")
+
+    class Meta:
+        table = "sys_job"
+        indexes = [
+            ("creator_id", "created_at"),
+            ("status", "updated_at"),
+            ("status", "finished_at"),
+            ("status", "heartbeat_at"),
+        ]
@@ -31,6 +31,11 @@ class OperationLog(CreatedAtModel):
 
     class Meta:
         table = "sys_operation_log"
+        indexes = [
+            ("created_at",),
+            ("user_id", "created_at"),
+            ("username", "created_at"),
+        ]
 
 
 class LoginLog(CreatedAtModel):
@@ -47,4 +52,8 @@ class LoginLog(CreatedAtModel):
 
     class Meta:
         table = "sys_login_log"
+        indexes = [
+            ("created_at",),
+            ("user_id", "created_at"),
+        ]
 
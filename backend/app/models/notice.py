@@ -53,3 +53,9 @@ class UserNotice(BaseModel):
     class Meta:
         table = "sys_user_notice"
         unique_together = (("user", "notice"),)
+        indexes = [
+            # 铃铛：未读且未隐藏，按时间倒序
+            ("user_id", "is_read", "bell_hidden", "created_at"),
+            # 收件箱：按时间倒序分页
+            ("user_id", "created_at"),
+        ]
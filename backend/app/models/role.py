@@ -28,7 +28,7 @@ class Role(BaseModel):
     remark = fields.CharField(max_length=255, null=True, description="备注")
     data_scope = fields.CharField(
         max_length=20,
-        default=DataScope.DEPT,
+        default=DataScope.DEPT.value,
         description="数据范围：all/custom/dept/dept_and_children/self",
     )
 
@@ -31,3 +31,4 @@ class User(BaseModel):
 
     class Meta:
         table = "sys_user"
+        indexes = [("dept_id", "is_active")]
@@ -0,0 +1,21 @@
+"""后台任务相关 Schema。"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class JobOut(BaseModel):
+    id: int = Field(..., description="任务ID")
+    kind: str = Field(..., description="任务类型")
+    title: str = Field(..., description="任务名称")
+    status: str = Field(..., description="状态：pending/running/success/failed/expired")
+    progress: int = Field(default=0, description="进度（0-100）")
+    total: int | None = Field(default=None, description="总条数（未知时为空）")
+    processed: int = Field(default=0, description="已处理条数")
+    message: str | None = Field(default=None, description="结果说明/失败原因")
+    fileName: str | None = Field(default=None, description="结果文件名")
+    downloadUrl: str | None = Field(default=None, description="结果文件下载地址（成功后可用）")
+    createTime: str | None = Field(default=None, description="创建时间")
+    startedAt: str | None = Field(default=None, description="开始时间")
+    finishedAt: str | None = Field(default=None, description="结束时间")
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class CurrentUser(BaseModel):
@@ -8,6 +10,9 @@ class CurrentUser(BaseModel):
     roles: list[str] = Field(default_factory=list, description="角色标识列表")
     jti: str | None = Field(default=None, description="Token ID（用于会话校验）")
 
+    # 请求内缓存（如数据范围计算结果）：同一请求内的依赖共享同一个 CurrentUser 实例，不参与序列化
+    _request_cache: dict[str, Any] = PrivateAttr(default_factory=dict)
+
 
 class UserInfo(BaseModel):
     """返回给前端的用户信息结构。"""
@@ -13,15 +13,19 @@ from uuid import uuid4
 
 from app.core.config import settings
 from app.core.security import (
+    ahash_password,
+    averify_password,
     create_access_token,
     decode_access_token,
-    get_password_hash,
-    verify_password,
 )
 from app.models.role import Role
 from app.models.user import User
 from app.schemas.user import CurrentUser, UserInfo
-from app.services.menu import get_access_codes_for_roles, get_routes_for_user
+from app.services.menu import (
+    get_access_code_set,
+    get_access_codes_for_roles,
+    get_routes_for_user,
+)
 from app.services.session import session_service
 
 
@@ -37,7 +41,7 @@ class AuthService:
         user = await User.get_or_none(username=username, is_active=True)
         if not user:
             return None
-        if not verify_password(password, user.password_hash):
+        if not await averify_password(password, user.password_hash):
             return None
 
         roles = await user.roles.filter(status=1).all()
@@ -67,11 +71,13 @@ class AuthService:
         """
 
         role, _ = await Role.get_or_create(code="user", defaults={"name": "普通用户"})
+        if await User.filter(username=username).exists():
+            return None
 
         user, created = await User.get_or_create(
             username=username,
             defaults={
-                "password_hash": get_password_hash(password),
+                "password_hash": await ahash_password(password),
                 "real_name": username,
                 "is_active": True,
             },
@@ -126,6 +132,11 @@ class AuthService:
 
         return await get_access_codes_for_roles(roles)
 
+    async def get_access_code_set(self, roles: list[str]) -> frozenset[str]:
+        """获取权限码集合（带缓存，用于接口权限校验）。"""
+
+        return await get_access_code_set(roles)
+
     async def get_menus(self, username: str) -> list[dict]:
         """获取用户菜单（用于动态路由与侧边栏渲染）。"""
 
@@ -6,20 +6,31 @@
 说明：
 - 数据范围是 RBAC 的补充：RBAC 解决“能不能看/能不能操作”，数据范围解决“能看多少数据”。
 - 超级管理员默认不受数据范围限制（全放行）。
+- 计算结果在单个请求内复用，并按（用户名, 角色集合）做短 TTL 缓存；
+  角色、部门、用户部门变更时通过 invalidate_data_scope_cache() 清空。
+- 批量操作使用 assert_can_access_many() 对整批记录只计算一次范围。
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
-from tortoise.expressions import Q
+from fastapi import HTTPException, status
+from tortoise.expressions import Q, RawSQL
 
 from app.core.config import settings
 from app.models.dept import Dept
 from app.models.role import DataScope, Role
 from app.models.user import User
 from app.schemas.user import CurrentUser
+from app.services.dept_index import dept_index
+from app.utils.cache import TTLCache
+
+# (版本号, 用户名, 角色集合) -> DataScopeResult；其他 worker 的变更最多延迟 TTL 生效
+_scope_version = 0
+_scope_cache = TTLCache(maxsize=4096, ttl=settings.DATA_SCOPE_CACHE_TTL_SECONDS)
 
 
 @dataclass(frozen=True)
@@ -30,49 +41,84 @@ class DataScopeResult:
     allow_self: bool
     user_id: int | None
     dept_id: int | None
-    dept_ids: set[int]
+    dept_ids: frozenset[int]
+    # 展开前的部门集合：direct_dept_ids 为仅本部门，subtree_root_ids 为需包含子孙部门的根
+    direct_dept_ids: frozenset[int] = frozenset()
+    subtree_root_ids: frozenset[int] = frozenset()
+
+    def can_access(self, *, dept_id: int | None, owner_id: int | None) -> bool:
+        """判断单条记录是否在数据范围内（在部门范围内，或仅本人且归属人是自己）。"""
+
+        if self.allow_all:
+            return True
+        if dept_id and int(dept_id) in self.dept_ids:
+            return True
+        return bool(
+            self.allow_self and self.user_id and owner_id and int(owner_id) == int(self.user_id),
+        )
+
+
+def invalidate_data_scope_cache() -> None:
+    """角色数据范围、部门结构或用户所属部门变更后调用。"""
+
+    global _scope_version
 
+    _scope_version += 1
+    _scope_cache.clear()
 
-async def _build_dept_children_map() -> dict[int, list[int]]:
+
+async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
     """
-    构建部门父子关系映射，用于递归获取子部门。
+    获取当前用户的数据范围。
 
-    返回：
-    - key: parent_id（根节点使用 0）
-    - value: children_ids
+    说明：
+    - 同一请求内多次调用只计算一次（缓存在 CurrentUser 实例上）；
+    - 跨请求按（用户名, 角色集合）缓存 DATA_SCOPE_CACHE_TTL_SECONDS 秒。
     """
 
-    rows = await Dept.all().values("id", "parent_id")
-    children: dict[int, list[int]] = {}
-    for row in rows:
-        did = int(row["id"])
-        pid = int(row["parent_id"] or 0)
-        children.setdefault(pid, []).append(did)
-    return children
+    cached = current_user._request_cache.get("data_scope")
+    if cached is not None:
+        return cached
 
+    key = (_scope_version, current_user.username, frozenset(current_user.roles))
+    result = _scope_cache.get(key)
+    if result is None:
+        result = await _compute_data_scope_result(current_user)
+        _scope_cache.set(key, result)
 
-def _collect_dept_descendants(
-    start_ids: Iterable[int],
-    *,
-    children_map: dict[int, list[int]],
-) -> set[int]:
-    """从给定部门集合出发，收集包含自身在内的所有子孙部门 ID。"""
+    current_user._request_cache["data_scope"] = result
+    return result
 
-    result: set[int] = set()
-    stack = [int(i) for i in start_ids if int(i) > 0]
 
-    while stack:
-        current = stack.pop()
-        if current in result:
-            continue
-        result.add(current)
-        stack.extend(children_map.get(current, []))
+async def assert_can_access_many(
+    records: Iterable[Any],
+    current_user: CurrentUser,
+    *,
+    dept_field: str = "dept_id",
+    owner_field: str = "creator_id",
+) -> None:
+    """
+    批量校验记录是否都在当前用户的数据范围内，任一条不在范围内即抛出 403。
 
-    return result
+    说明：
+    - 整批记录只计算一次数据范围（同一请求内与其他调用共用缓存），不随记录数增加查询；
+    - dept_field/owner_field 为记录上的部门与归属人字段名（如文件为 dept_id/creator_id）。
+    """
 
+    scope = await get_data_scope_result(current_user)
+    if scope.allow_all:
+        return
+    for rec in records:
+        # 满足任一条件即可访问：在部门范围内 或 仅本人且归属人是自己
+        if not scope.can_access(
+            dept_id=getattr(rec, dept_field, None),
+            owner_id=getattr(rec, owner_field, None),
+        ):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="无权限")
 
-async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
-    """计算当前用户的数据范围。"""
+
+async def _compute_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
+    """计算当前用户的数据范围（访问数据库）。"""
 
     # 超级管理员全放行（不做数据范围限制）
     if settings.SUPERUSER_ROLE_CODE in current_user.roles:
@@ -81,7 +127,7 @@ async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
             allow_self=False,
             user_id=None,
             dept_id=None,
-            dept_ids=set(),
+            dept_ids=frozenset(),
         )
 
     user = await User.get_or_none(username=current_user.username, is_active=True)
@@ -92,7 +138,7 @@ async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
             allow_self=False,
             user_id=None,
             dept_id=None,
-            dept_ids=set(),
+            dept_ids=frozenset(),
         )
 
     roles = await Role.filter(code__in=current_user.roles, status=1).all()
@@ -103,20 +149,18 @@ async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
             allow_self=True,
             user_id=int(user.id),
             dept_id=int(user.dept_id) if user.dept_id else None,
-            dept_ids=set(),
+            dept_ids=frozenset(),
         )
 
     allow_all = False
     allow_self = False
     dept_ids: set[int] = set()
+    direct_dept_ids: set[int] = set()
+    subtree_root_ids: set[int] = set()
 
-    # 仅在需要递归子部门时才构建映射，避免每次请求都扫描部门表
-    need_children_map = any(
-        r.data_scope in (DataScope.DEPT_AND_CHILDREN, DataScope.CUSTOM) for r in roles
-    )
-    children_map: dict[int, list[int]] = (
-        await _build_dept_children_map() if need_children_map else {}
-    )
+    # 仅在需要递归子部门时才加载部门层级索引（进程内共享，加载后不再扫描部门表）
+    if any(r.data_scope in (DataScope.DEPT_AND_CHILDREN, DataScope.CUSTOM) for r in roles):
+        await dept_index.ensure_loaded()
 
     for role in roles:
         try:
@@ -135,21 +179,21 @@ async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
         if scope == DataScope.DEPT:
             if user.dept_id:
                 dept_ids.add(int(user.dept_id))
+                direct_dept_ids.add(int(user.dept_id))
             continue
 
         if scope == DataScope.DEPT_AND_CHILDREN:
             if user.dept_id:
-                dept_ids |= _collect_dept_descendants(
-                    [int(user.dept_id)],
-                    children_map=children_map,
-                )
+                dept_ids |= dept_index.descendants([int(user.dept_id)])
+                subtree_root_ids.add(int(user.dept_id))
             continue
 
         if scope == DataScope.CUSTOM:
             # 自定义部门默认包含其子部门（更符合“树选择”直觉）
             ids = await role.depts.all().values_list("id", flat=True)
-            base_ids = {int(i) for i in ids}
-            dept_ids |= _collect_dept_descendants(base_ids, children_map=children_map)
+            base_ids = {int(i) for i in ids if int(i) > 0}
+            dept_ids |= dept_index.descendants(base_ids)
+            subtree_root_ids |= base_ids
             continue
 
     return DataScopeResult(
@@ -157,10 +201,52 @@ async def get_data_scope_result(current_user: CurrentUser) -> DataScopeResult:
         allow_self=allow_self,
         user_id=int(user.id),
         dept_id=int(user.dept_id) if user.dept_id else None,
-        dept_ids=dept_ids,
+        dept_ids=frozenset(dept_ids),
+        direct_dept_ids=frozenset(direct_dept_ids - subtree_root_ids),
+        subtree_root_ids=frozenset(subtree_root_ids),
     )
 
 
+def _use_cte_mode() -> bool:
+    """是否使用递归 CTE 下推部门范围（仅 PostgreSQL/SQLite 支持，其他数据库回退为 IN 列表）。"""
+
+    if (settings.DATA_SCOPE_QUERY_MODE or "in").strip().lower() != "cte":
+        return False
+    return Dept._meta.db.capabilities.dialect in ("postgres", "sqlite")
+
+
+def _dept_subtree_subquery(root_ids: Iterable[int]) -> RawSQL:
+    """
+    生成“根部门及其全部子孙部门 ID”的递归 CTE 子查询（用于 `dept_id IN (...)`）。
+
+    说明：根部门 ID 来自数据库且已转换为 int，可安全内联。
+    """
+
+    table = Dept._meta.db_table
+    ids = ", ".join(str(int(i)) for i in sorted(root_ids))
+    return RawSQL(
+        f"(WITH RECURSIVE scope_dept(id) AS ("
+        f"SELECT id FROM {table} WHERE id IN ({ids}) "
+        f"UNION SELECT d.id FROM {table} d JOIN scope_dept s ON d.parent_id = s.id"
+        f") SELECT id FROM scope_dept)",
+    )
+
+
+def _build_dept_q(scope: DataScopeResult, dept_field: str) -> Q | None:
+    """按查询模式生成部门范围条件（IN 列表 或 递归 CTE 子查询）。"""
+
+    if not scope.dept_ids:
+        return None
+
+    if not scope.subtree_root_ids or not _use_cte_mode():
+        return Q(**{f"{dept_field}__in": list(scope.dept_ids)})
+
+    q = Q(**{f"{dept_field}__in": _dept_subtree_subquery(scope.subtree_root_ids)})
+    if scope.direct_dept_ids:
+        q = q | Q(**{f"{dept_field}__in": list(scope.direct_dept_ids)})
+    return q
+
+
 async def build_data_scope_q(
     current_user: CurrentUser,
     *,
@@ -177,6 +263,9 @@ async def build_data_scope_q(
     返回：
     - None：表示“全放行”（不需要额外 filter）
     - Q：可直接用于 .filter(q) 的条件
+
+    说明：DATA_SCOPE_QUERY_MODE=cte 时，子孙部门以递归 CTE 子查询下推到数据库，
+    避免大部门树下生成超长的 IN 列表；调用方无需改动。
     """
 
     scope = await get_data_scope_result(current_user)
@@ -185,8 +274,8 @@ async def build_data_scope_q(
 
     q: Q | None = None
 
-    if dept_field and scope.dept_ids:
-        dept_q = Q(**{f"{dept_field}__in": list(scope.dept_ids)})
+    dept_q = _build_dept_q(scope, dept_field) if dept_field else None
+    if dept_q is not None:
         q = dept_q if q is None else (q | dept_q)
 
     if user_field and scope.allow_self and scope.user_id:
@@ -215,8 +304,9 @@ async def get_allowed_user_ids(current_user: CurrentUser) -> set[int] | None:
         return None
 
     allowed: set[int] = set()
-    if scope.dept_ids:
-        ids = await User.filter(dept_id__in=list(scope.dept_ids)).values_list("id", flat=True)
+    dept_q = _build_dept_q(scope, "dept_id")
+    if dept_q is not None:
+        ids = await User.filter(dept_q).values_list("id", flat=True)
         allowed |= {int(i) for i in ids}
 
     if scope.allow_self and scope.user_id:
@@ -0,0 +1,114 @@
+"""
+部门层级索引（进程内）。
+
+说明：
+- 数据范围（DEPT_AND_CHILDREN/CUSTOM）与通知按部门发送都需要“部门及其全部子孙部门”；
+- 索引在首次使用时从 sys_dept 全量加载一次，之后查询子孙部门不访问数据库，耗时与结果规模成正比；
+- 本 worker 内的部门新增/修改/删除会增量更新索引；
+- 其他 worker 的变更最多延迟 PERMISSION_CACHE_TTL_SECONDS 后（重新全量加载）生效。
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+
+from app.core.config import settings
+from app.models.dept import Dept
+
+
+class DeptIndex:
+    """部门父子关系索引（父指针 + 子节点列表）。"""
+
+    def __init__(self, *, ttl: float) -> None:
+        self.ttl = float(ttl)
+        self._parent_of: dict[int, int | None] = {}
+        self._children_of: dict[int, list[int]] = {}
+        self._expire_at: float | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._expire_at is not None and self._expire_at > time.monotonic()
+
+    async def ensure_loaded(self) -> None:
+        if self.loaded:
+            return
+
+        rows = await Dept.all().values("id", "parent_id")
+        parent_of: dict[int, int | None] = {}
+        children_of: dict[int, list[int]] = {}
+        for row in rows:
+            did = int(row["id"])
+            pid = int(row["parent_id"]) if row["parent_id"] else None
+            parent_of[did] = pid
+            if pid is not None:
+                children_of.setdefault(pid, []).append(did)
+
+        self._parent_of = parent_of
+        self._children_of = children_of
+        self._expire_at = time.monotonic() + max(0.0, self.ttl)
+
+    def invalidate(self) -> None:
+        self._expire_at = None
+
+    def _unlink(self, dept_id: int) -> None:
+        pid = self._parent_of.get(dept_id)
+        if pid is None:
+            return
+        siblings = self._children_of.get(pid)
+        if siblings and dept_id in siblings:
+            siblings.remove(dept_id)
+            if not siblings:
+                self._children_of.pop(pid, None)
+
+    def upsert(self, dept_id: int, parent_id: int | None) -> None:
+        """新增部门或调整上级部门后调用（索引未加载时忽略，下次使用时全量加载）。"""
+
+        if self._expire_at is None:
+            return
+
+        did = int(dept_id)
+        pid = int(parent_id) if parent_id else None
+        if did in self._parent_of:
+            if self._parent_of[did] == pid:
+                return
+            self._unlink(did)
+
+        self._parent_of[did] = pid
+        if pid is not None:
+            self._children_of.setdefault(pid, []).append(did)
+
+    def remove(self, dept_id: int) -> None:
+        """删除部门后调用（仅允许删除叶子部门，子节点列表无需处理）。"""
+
+        if self._expire_at is None:
+            return
+
+        did = int(dept_id)
+        self._unlink(did)
+        self._parent_of.pop(did, None)
+        self._children_of.pop(did, None)
+
+    def descendants(self, start_ids: Iterable[int]) -> set[int]:
+        """从给定部门集合出发，收集包含自身在内的所有子孙部门 ID（需先 ensure_loaded）。"""
+
+        result: set[int] = set()
+        stack = [int(i) for i in start_ids if int(i) > 0]
+
+        while stack:
+            current = stack.pop()
+            if current in result:
+                continue
+            result.add(current)
+            stack.extend(self._children_of.get(current, ()))
+
+        return result
+
+    async def get_descendants(self, start_ids: Iterable[int]) -> set[int]:
+        """同 descendants，必要时先加载索引。"""
+
+        await self.ensure_loaded()
+        return self.descendants(start_ids)
+
+
+dept_index = DeptIndex(ttl=settings.PERMISSION_CACHE_TTL_SECONDS)
@@ -0,0 +1,112 @@
+"""
+会话心跳（最后活跃时间）写回缓冲。
+
+说明：
+- 请求路径只把 jti -> 最后活跃时间 记入内存，不再同步写库；
+- 后台任务按固定间隔批量写库：每批一条 `UPDATE ... SET last_seen_at = CASE jti ... END`；
+- 应用关闭时会再写一次，尽量不丢失最后一批心跳；
+- last_seen_at 仅用于“在线用户”展示，进程异常退出时丢失一个间隔内的心跳是可接受的。
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+from tortoise.expressions import Case, F, Value, When
+
+from app.models.session import UserSession
+
+# 单条 UPDATE 内最多包含的会话数（避免 SQL 过长/参数过多）
+_FLUSH_BATCH_SIZE = 500
+
+
+class HeartbeatBuffer:
+    """最后活跃时间的内存缓冲（同一 jti 只保留最新时间）。"""
+
+    def __init__(self, *, batch_size: int = _FLUSH_BATCH_SIZE) -> None:
+        self.batch_size = max(1, int(batch_size))
+        self._pending: dict[str, datetime] = {}
+
+        self._flush_count = 0
+        self._flushed_rows = 0
+        self._failed_flushes = 0
+        self._last_flush_ms: float | None = None
+        self._max_flush_ms: float = 0.0
+        self._last_flush_at: datetime | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def record(self, jti: str, seen_at: datetime) -> None:
+        current = self._pending.get(jti)
+        if current is None or seen_at > current:
+            self._pending[jti] = seen_at
+
+    def _merge_back(self, beats: dict[str, datetime]) -> None:
+        for jti, seen_at in beats.items():
+            self.record(jti, seen_at)
+
+    async def flush(self, extra: dict[str, datetime] | None = None) -> int:
+        """
+        批量写库，返回写入的会话数。
+
+        参数：
+        - extra：来自其他缓冲（如 Redis）的心跳，与本地缓冲合并后一起写入。
+
+        说明：写库失败时会把本批心跳放回缓冲，等待下一次重试。
+        """
+
+        beats = self._pending
+        self._pending = {}
+        for jti, seen_at in (extra or {}).items():
+            current = beats.get(jti)
+            if current is None or seen_at > current:
+                beats[jti] = seen_at
+
+        if not beats:
+            return 0
+
+        start = time.perf_counter()
+        items = list(beats.items())
+        written = 0
+        try:
+            for i in range(0, len(items), self.batch_size):
+                chunk = items[i : i + self.batch_size]
+                await UserSession.filter(jti__in=[jti for jti, _ in chunk], status=1).update(
+                    last_seen_at=Case(
+                        *[When(jti=jti, then=Value(seen_at)) for jti, seen_at in chunk],
+                        default=F("last_seen_at"),
+                    ),
+                )
+                written += len(chunk)
+        except Exception:
+            self._failed_flushes += 1
+            self._merge_back(dict(items[written:]))
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._flush_count += 1
+            self._flushed_rows += written
+            self._last_flush_ms = round(elapsed_ms, 2)
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._last_flush_at = datetime.now(UTC)
+
+        return written
+
+    def stats(self) -> dict:
+        """运行指标（用于监控接口）。"""
+
+        return {
+            "queueDepth": self.queue_depth,
+            "flushCount": self._flush_count,
+            "flushedRows": self._flushed_rows,
+            "failedFlushes": self._failed_flushes,
+            "lastFlushMs": self._last_flush_ms,
+            "maxFlushMs": round(self._max_flush_ms, 2),
+            "lastFlushAt": self._last_flush_at.isoformat() if self._last_flush_at else None,
+        }
+
+
+heartbeat_buffer = HeartbeatBuffer()
@@ -0,0 +1,492 @@
+"""
+后台任务（进程内异步执行）。
+
+说明：
+- 导入/导出等长耗时操作不再占用 HTTP 请求：接口只创建任务记录并立即返回任务 ID；
+- 任务在当前进程内以 asyncio 任务执行，同时运行数量不超过 JOB_MAX_CONCURRENCY，其余排队（pending）；
+- 状态与进度持久化在 sys_job 表，结果文件保存在 FILE_STORAGE_ROOT/jobs 下；
+- 任务结束后通过通知 WebSocket 推送 `job:finished` 事件给创建人；
+- 任务记录执行实例（owner）并由该进程定期刷新心跳；进程退出时未完成的任务标记为失败，
+  进程异常退出遗留的任务在心跳超过 JOB_STALE_SECONDS 后，由任一存活进程标记为失败
+  （其他进程排队中或长时间处理中的任务心跳正常，不受影响）；
+- 状态流转使用条件更新（仅 pending/running 可变更），已被判定中断的任务不会被改回；
+- 结果文件保留 JOB_RESULT_TTL_HOURS 小时，之后由定期清理删除文件并将任务标记为 expired。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from tortoise.expressions import Q
+
+from app.core.config import settings
+from app.models.job import JobStatus, SysJob
+from app.models.user import User
+from app.schemas.import_export import ImportErrorItem, ImportResult
+from app.schemas.job import JobOut
+from app.utils.excel import ExcelColumn, stream_xlsx
+from app.ws.broker import INSTANCE_ID
+from app.ws.notice import notice_ws_manager
+
+logger = logging.getLogger(__name__)
+
+# 进度写库的最小间隔（秒），避免每批数据都 UPDATE 一次
+_PROGRESS_FLUSH_SECONDS = 1.0
+# 过期结果文件清理间隔（秒）
+_CLEANUP_INTERVAL_SECONDS = 3600
+
+
+class JobContext:
+    """任务执行上下文：汇报进度、登记结果文件。"""
+
+    def __init__(self, job: SysJob) -> None:
+        self.job = job
+        self._last_flush = 0.0
+
+    async def set_progress(self, processed: int, total: int | None = None) -> None:
+        """更新进度（按时间节流写库）。"""
+
+        job = self.job
+        job.processed = int(processed)
+        if total is not None:
+            job.total = int(total)
+        if job.total:
+            job.progress = min(99, int(job.processed * 100 / job.total))
+
+        now = time.monotonic()
+        if now - self._last_flush < _PROGRESS_FLUSH_SECONDS:
+            return
+        self._last_flush = now
+        await job.save(update_fields=["processed", "total", "progress", "updated_at"])
+
+    def new_result_path(self, ext: str) -> tuple[Path, str]:
+        """分配结果文件路径，返回（绝对路径, 相对 FILE_STORAGE_ROOT 的 object_key）。"""
+
+        subdir = datetime.now().strftime("jobs/%Y/%m/%d")
+        object_key = f"{subdir}/{uuid4().hex}.{ext.lstrip('.')}"
+        abs_path = settings.FILE_STORAGE_ROOT / Path(object_key)
+        abs_path.parent.mkdir(parents=True, exist_ok=True)
+        return abs_path, object_key
+
+    def set_result(
+        self,
+        *,
+        object_key: str | None = None,
+        file_name: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        self.job.result_object_key = object_key
+        self.job.result_file_name = file_name
+        self.job.message = message
+
+
+JobHandler = Callable[[JobContext], Awaitable[None]]
+
+
+def xlsx_export_handler(
+    *,
+    file_name: str,
+    sheet_name: str,
+    columns: list[ExcelColumn],
+    batches: AsyncIterable[list[dict[str, Any]]],
+    total: int | None = None,
+) -> JobHandler:
+    """生成“流式导出 xlsx 到结果文件”的任务处理函数（按已写入行数汇报进度）。"""
+
+    async def handler(ctx: JobContext) -> None:
+        processed = 0
+
+        async def counted() -> AsyncIterable[list[dict[str, Any]]]:
+            nonlocal processed
+            async for rows in batches:
+                yield rows
+                processed += len(rows)
+                await ctx.set_progress(processed, total)
+
+        object_key = await _write_xlsx_result(
+            ctx,
+            sheet_name=sheet_name,
+            columns=columns,
+            batches=counted(),
+        )
+
+        await ctx.set_progress(processed, processed)
+        ctx.set_result(object_key=object_key, file_name=file_name, message=f"共导出 {processed} 条")
+
+    return handler
+
+
+async def _write_xlsx_result(
+    ctx: JobContext,
+    *,
+    sheet_name: str,
+    columns: list[ExcelColumn],
+    batches: AsyncIterable[list[dict[str, Any]]],
+) -> str:
+    """把行数据流式写入新的 xlsx 结果文件，返回 object_key（失败时删除半成品文件）。"""
+
+    abs_path, object_key = ctx.new_result_path("xlsx")
+    try:
+        with abs_path.open("wb") as f:
+            async for chunk in stream_xlsx(sheet_name=sheet_name, columns=columns, batches=batches):
+                f.write(chunk)
+    except BaseException:
+        abs_path.unlink(missing_ok=True)
+        raise
+    return object_key
+
+
+async def finish_import_job(ctx: JobContext, result: ImportResult, *, file_name: str) -> None:
+    """
+    导入任务收尾：记录汇总信息；有失败行时生成失败明细文件供创建人下载。
+
+    说明：失败明细不写入任务记录（可能很多行），只保存在结果文件中。
+    """
+
+    await ctx.set_progress(result.total, result.total)
+    message = f"共 {result.total} 条，成功 {result.success} 条，失败 {result.failed} 条"
+    if not result.errors:
+        ctx.set_result(message=message)
+        return
+
+    async def error_rows(errors: list[ImportErrorItem]) -> AsyncIterable[list[dict[str, Any]]]:
+        yield [e.model_dump() for e in errors]
+
+    object_key = await _write_xlsx_result(
+        ctx,
+        sheet_name="失败明细",
+        columns=[
+            ExcelColumn(title="行号", key="row"),
+            ExcelColumn(title="列", key="column"),
+            ExcelColumn(title="原因", key="message"),
+        ],
+        batches=error_rows(result.errors),
+    )
+    ctx.set_result(object_key=object_key, file_name=file_name, message=message)
+
+
+def job_result_path(job: SysJob) -> Path | None:
+    """任务结果文件的绝对路径（无结果文件时为 None）。"""
+
+    if not job.result_object_key:
+        return None
+    return settings.FILE_STORAGE_ROOT / Path(job.result_object_key)
+
+
+def _format_dt(dt: datetime | None) -> str | None:
+    if not dt:
+        return None
+    return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def job_to_out(job: SysJob) -> JobOut:
+    """任务记录转换为接口输出。"""
+
+    download_url = None
+    if job.status == JobStatus.SUCCESS and job.result_object_key:
+        download_url = f"{settings.API_V1_STR}/jobs/{job.id}/download"
+
+    return JobOut(
+        id=job.id,
+        kind=job.kind,
+        title=job.title,
+        status=job.status,
+        progress=job.progress,
+        total=job.total,
+        processed=job.processed,
+        message=job.message,
+        fileName=job.result_file_name,
+        downloadUrl=download_url,
+        createTime=_format_dt(job.created_at),
+        startedAt=_format_dt(job.started_at),
+        finishedAt=_format_dt(job.finished_at),
+    )
+
+
+class JobRunner:
+    """进程内任务执行器。"""
+
+    def __init__(self, *, max_concurrency: int, stale_seconds: int, result_ttl_hours: int) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.stale_seconds = max(60, int(stale_seconds))
+        self.result_ttl_hours = max(0, int(result_ttl_hours))
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._cleanup_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._expired_jobs = 0
+        self._interrupted_jobs = 0
+        self._removed_files = 0
+
+    async def submit(
+        self,
+        *,
+        kind: str,
+        title: str,
+        creator_name: str,
+        handler: JobHandler,
+    ) -> SysJob:
+        """创建任务记录并在后台执行。"""
+
+        creator = await User.get_or_none(username=creator_name)
+        job = await SysJob.create(
+            kind=kind,
+            title=title,
+            status=JobStatus.PENDING,
+            creator=creator,
+            creator_name=creator_name,
+            owner=INSTANCE_ID,
+            heartbeat_at=datetime.now(UTC),
+        )
+        task = asyncio.create_task(self._run(job, handler))
+        self._tasks[int(job.id)] = task
+        task.add_done_callback(lambda _t, job_id=int(job.id): self._tasks.pop(job_id, None))
+        return job
+
+    async def _run(self, job: SysJob, handler: JobHandler) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            async with self._semaphore:
+                now = datetime.now(UTC)
+                started = await SysJob.filter(id=job.id, status=JobStatus.PENDING).update(
+                    status=JobStatus.RUNNING,
+                    started_at=now,
+                    heartbeat_at=now,
+                    updated_at=now,
+                )
+                if not started:
+                    logger.warning("后台任务已不在排队状态，跳过执行：%s#%s", job.kind, job.id)
+                    return
+                job.status = JobStatus.RUNNING
+                job.started_at = now
+
+                await handler(JobContext(job))
+            job.status = JobStatus.SUCCESS
+            job.progress = 100
+        except asyncio.CancelledError:
+            job.status = JobStatus.FAILED
+            job.message = "服务停止，任务已中断"
+            await self._finish(job)
+            raise
+        except Exception as exc:  # noqa: BLE001 - 任务失败需记录原因，不影响其他任务
+            logger.exception("后台任务执行失败：%s#%s", job.kind, job.id)
+            job.status = JobStatus.FAILED
+            job.message = str(exc)[:500] or "任务执行失败"
+
+        await self._finish(job)
+
+    async def _finish(self, job: SysJob) -> None:
+        job.finished_at = datetime.now(UTC)
+        try:
+            # 仅更新仍未结束的任务：已被判定中断（心跳超时）的任务保持失败状态
+            finished = await SysJob.filter(id=job.id, status__in=JobStatus.UNFINISHED).update(
+                status=job.status,
+                progress=job.progress,
+                total=job.total,
+                processed=job.processed,
+                message=job.message,
+                result_object_key=job.result_object_key,
+                result_file_name=job.result_file_name,
+                finished_at=job.finished_at,
+                updated_at=job.finished_at,
+            )
+        except Exception:
+            logger.exception("后台任务状态保存失败：%s#%s", job.kind, job.id)
+            return
+        if not finished:
+            logger.warning("后台任务已被标记为中断，忽略执行结果：%s#%s", job.kind, job.id)
+            return
+
+        if job.creator_name:
+            await notice_ws_manager.send_to_user(
+                job.creator_name,
+                notice_ws_manager.build_event(
+                    "job:finished",
+                    {
+                        "id": job.id,
+                        "kind": job.kind,
+                        "title": job.title,
+                        "status": job.status,
+                        "message": job.message,
+                    },
+                ),
+            )
+
+    async def cleanup_expired(self) -> int:
+        """
+        清理过期结果文件，返回本轮标记为 expired 的任务数。
+
+        说明：
+        - 成功任务在结束 result_ttl_hours 小时后删除结果文件，任务标记为 expired（保留记录）；
+        - 同时删除 jobs 目录下超过保留期、且不属于任何成功任务的遗留文件（如进程中断时的半成品）
+          以及因此变空的日期目录；
+        - 删除文件与更新状态均可重复执行，多 worker 同时清理不会出错。
+        """
+
+        if self.result_ttl_hours <= 0:
+            return 0
+        deadline = datetime.now(UTC) - timedelta(hours=self.result_ttl_hours)
+
+        expired = 0
+        jobs = await SysJob.filter(
+            status=JobStatus.SUCCESS,
+            finished_at__lt=deadline,
+        ).only("id", "result_object_key")
+        for job in jobs:
+            abs_path = job_result_path(job)
+            if abs_path is not None:
+                self._remove_file(abs_path)
+            expired += await SysJob.filter(id=job.id, status=JobStatus.SUCCESS).update(
+                status=JobStatus.EXPIRED,
+                message="结果文件已过期清理",
+                result_object_key=None,
+            )
+        self._expired_jobs += expired
+
+        await self._remove_orphan_files(deadline)
+        return expired
+
+    async def _remove_orphan_files(self, deadline: datetime) -> None:
+        root = settings.FILE_STORAGE_ROOT / "jobs"
+        if not root.is_dir():
+            return
+
+        cutoff = deadline.timestamp()
+        candidates = {
+            path.relative_to(settings.FILE_STORAGE_ROOT).as_posix(): path
+            for path in root.rglob("*")
+            if path.is_file() and path.stat().st_mtime < cutoff
+        }
+        if candidates:
+            in_use = await SysJob.filter(
+                status=JobStatus.SUCCESS,
+                result_object_key__in=list(candidates),
+            ).values_list("result_object_key", flat=True)
+            for object_key in set(candidates) - set(in_use):
+                self._remove_file(candidates[object_key])
+
+        # 自底向上删除空的日期目录（jobs 目录本身保留）
+        for path in sorted(root.rglob("*"), key=lambda p: len(p.parts), reverse=True):
+            if path.is_dir():
+                with contextlib.suppress(OSError):
+                    path.rmdir()
+
+    def _remove_file(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        self._removed_files += 1
+
+    async def _cleanup_loop(self) -> None:
+        while True:
+            try:
+                await self.cleanup_expired()
+            except Exception:  # noqa: BLE001 - 单轮失败不影响下一轮
+                logger.exception("后台任务结果文件清理失败")
+            await asyncio.sleep(_CLEANUP_INTERVAL_SECONDS)
+
+    @property
+    def heartbeat_interval(self) -> float:
+        """心跳间隔：判定超时秒数的 1/3，超时前至少刷新两次。"""
+
+        return self.stale_seconds / 3
+
+    async def heartbeat(self) -> None:
+        """刷新本进程内任务（含排队中）的心跳。"""
+
+        if not self._tasks:
+            return
+        await SysJob.filter(
+            id__in=list(self._tasks),
+            owner=INSTANCE_ID,
+            status__in=JobStatus.UNFINISHED,
+        ).update(heartbeat_at=datetime.now(UTC))
+
+    async def fail_orphaned(self) -> int:
+        """
+        将执行进程已不存在的未完成任务标记为失败，返回标记数量。
+
+        说明：执行进程存活时会持续刷新心跳，因此只有心跳超过 stale_seconds 的任务才会被判定中断；
+        迁移前创建、没有心跳的旧记录按 updated_at 判断。
+        """
+
+        now = datetime.now(UTC)
+        deadline = now - timedelta(seconds=self.stale_seconds)
+        failed = await SysJob.filter(
+            Q(heartbeat_at__lt=deadline) | Q(heartbeat_at__isnull=True, updated_at__lt=deadline),
+            status__in=JobStatus.UNFINISHED,
+        ).update(
+            status=JobStatus.FAILED,
+            message="执行进程已停止，任务已中断",
+            finished_at=now,
+            updated_at=now,
+        )
+        self._interrupted_jobs += failed
+        return failed
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat()
+                await self.fail_orphaned()
+            except Exception:  # noqa: BLE001 - 单轮失败不影响下一轮
+                logger.exception("后台任务心跳刷新失败")
+
+    async def start(self) -> None:
+        """应用启动时调用：将执行进程已不存在的任务标记为失败，并启动心跳与过期结果文件清理。"""
+
+        await self.fail_orphaned()
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        if self.result_ttl_hours > 0 and (self._cleanup_task is None or self._cleanup_task.done()):
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop(self) -> None:
+        """应用关闭时调用：停止心跳与清理，并取消本进程内未完成的任务（标记为失败）。"""
+
+        for background in (self._heartbeat_task, self._cleanup_task):
+            if background is not None:
+                background.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await background
+        self._heartbeat_task = None
+        self._cleanup_task = None
+
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        self._tasks.clear()
+
+    def stats(self) -> dict:
+        """运行指标（用于监控接口）。"""
+
+        return {
+            "active": len(self._tasks),
+            "maxConcurrency": self.max_concurrency,
+            "resultTtlHours": self.result_ttl_hours,
+            "expiredJobs": self._expired_jobs,
+            "interruptedJobs": self._interrupted_jobs,
+            "removedFiles": self._removed_files,
+        }
+
+
+job_runner = JobRunner(
+    max_concurrency=settings.JOB_MAX_CONCURRENCY,
+    stale_seconds=settings.JOB_STALE_SECONDS,
+    result_ttl_hours=settings.JOB_RESULT_TTL_HOURS,
+)
@@ -0,0 +1,227 @@
+"""
+日志归档（过期日志导出为压缩文件）。
+
+说明：
+- 由日志保留服务（app.services.log_retention）在删除过期日志前调用：先归档，再删除已归档的行；
+- 文件保存在 FILE_STORAGE_ROOT/archive/<表名>/ 下，格式由 LOG_ARCHIVE_FORMAT 决定：
+  - ndjson：每行一条 JSON，gzip 压缩（.ndjson.gz）；
+  - parquet：列式存储，zstd 压缩（需安装 pyarrow，未安装时回退为 ndjson）；
+- 每个归档文件旁写入同名 .manifest.json（行数、id 范围、时间范围、sha256 等），
+  manifest 最后写入，存在即表示归档文件完整；
+- 单个文件最多 LOG_ARCHIVE_FILE_MAX_ROWS 行，按主键顺序读取，内存占用与总行数无关。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from tortoise.fields import DatetimeField, IntField
+from tortoise.models import Model
+
+from app.core.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow 为可选依赖
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# 每次从数据库读取的行数
+_READ_BATCH_SIZE = 5000
+
+
+@dataclass(slots=True)
+class ArchivedFile:
+    """一个已完成的归档文件。"""
+
+    path: Path
+    manifest_path: Path
+    rows: int
+    max_id: int
+
+
+def _archive_format() -> str:
+    fmt = (settings.LOG_ARCHIVE_FORMAT or "ndjson").strip().lower()
+    if fmt == "parquet" and pa is None:
+        logger.warning("未安装 pyarrow，日志归档回退为 ndjson 格式")
+        return "ndjson"
+    return "parquet" if fmt == "parquet" else "ndjson"
+
+
+def _columns(model: type[Model]) -> list[str]:
+    return list(model._meta.db_fields)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"无法序列化的类型：{type(value).__name__}")
+
+
+def _parquet_schema(model: type[Model]) -> Any:
+    fields = []
+    for name in _columns(model):
+        field = model._meta.fields_map[name]
+        if isinstance(field, DatetimeField):
+            pa_type = pa.timestamp("us", tz="UTC")
+        elif isinstance(field, IntField):
+            pa_type = pa.int64()
+        else:
+            pa_type = pa.string()
+        fields.append(pa.field(name, pa_type))
+    return pa.schema(fields)
+
+
+class _ArchiveWriter:
+    """单个归档文件的写入器（同步 IO，由调用方放到线程中执行）。"""
+
+    def __init__(self, path: Path, fmt: str, model: type[Model]) -> None:
+        self.path = path
+        self.fmt = fmt
+        self._ndjson = None
+        self._parquet = None
+        if fmt == "parquet":
+            self._schema = _parquet_schema(model)
+            self._parquet = pq.ParquetWriter(path, self._schema, compression="zstd")
+        else:
+            self._ndjson = gzip.open(path, "wt", encoding="utf-8")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if self._parquet is not None:
+            self._parquet.write_table(pa.Table.from_pylist(rows, schema=self._schema))
+            return
+        for row in rows:
+            self._ndjson.write(json.dumps(row, ensure_ascii=False, default=_json_default))
+            self._ndjson.write("\n")
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._ndjson is not None:
+            self._ndjson.close()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LogArchiver:
+    """将早于指定时间的日志按主键顺序写入归档文件。"""
+
+    def __init__(self) -> None:
+        self._files = 0
+        self._rows = 0
+
+    async def archive_file(self, model: type[Model], cutoff: datetime) -> ArchivedFile | None:
+        """
+        归档一个文件（最多 LOG_ARCHIVE_FILE_MAX_ROWS 行），没有待归档数据时返回 None。
+
+        说明：
+        - 只写文件，不删除数据；调用方确认返回后再删除 id <= max_id 且早于 cutoff 的行；
+        - 写入失败时删除未完成的文件并抛出异常（不会留下 manifest）。
+        """
+
+        table = model._meta.db_table
+        columns = _columns(model)
+        max_rows = max(1, int(settings.LOG_ARCHIVE_FILE_MAX_ROWS))
+        fmt = _archive_format()
+
+        base = model.filter(created_at__lt=cutoff).order_by("id")
+        first = await base.limit(_READ_BATCH_SIZE).values(*columns)
+        if not first:
+            return None
+
+        started_at = datetime.now(UTC)
+        archive_dir = settings.FILE_STORAGE_ROOT / "archive" / table
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{table}_{started_at:%Y%m%d%H%M%S}_{first[0]['id']}"
+        path = archive_dir / (f"{stem}.parquet" if fmt == "parquet" else f"{stem}.ndjson.gz")
+        manifest_path = archive_dir / f"{stem}.manifest.json"
+
+        rows_written = 0
+        min_created: datetime | None = None
+        max_created: datetime | None = None
+        writer = await asyncio.to_thread(_ArchiveWriter, path, fmt, model)
+        try:
+            rows = first
+            while rows:
+                rows = rows[: max_rows - rows_written]
+                await asyncio.to_thread(writer.write, rows)
+                rows_written += len(rows)
+                last_id = int(rows[-1]["id"])
+                for row in rows:
+                    created = row["created_at"]
+                    if min_created is None or created < min_created:
+                        min_created = created
+                    if max_created is None or created > max_created:
+                        max_created = created
+
+                if rows_written >= max_rows or len(rows) < _READ_BATCH_SIZE:
+                    break
+                rows = await base.filter(id__gt=last_id).limit(_READ_BATCH_SIZE).values(*columns)
+
+            await asyncio.to_thread(writer.close)
+            manifest = {
+                "table": table,
+                "format": fmt,
+                "compression": "zstd" if fmt == "parquet" else "gzip",
+                "file": path.name,
+                "sha256": await asyncio.to_thread(_sha256, path),
+                "rows": rows_written,
+                "minId": int(first[0]["id"]),
+                "maxId": last_id,
+                "minCreatedAt": min_created.isoformat() if min_created else None,
+                "maxCreatedAt": max_created.isoformat() if max_created else None,
+                "cutoff": cutoff.isoformat(),
+                "columns": columns,
+                "createdAt": started_at.isoformat(),
+            }
+            await asyncio.to_thread(
+                manifest_path.write_text,
+                json.dumps(manifest, ensure_ascii=False, indent=2),
+                "utf-8",
+            )
+        except BaseException:
+            await asyncio.to_thread(writer.close)
+            path.unlink(missing_ok=True)
+            manifest_path.unlink(missing_ok=True)
+            raise
+
+        self._files += 1
+        self._rows += rows_written
+        logger.info("已归档日志：%s（%s 行）", path.name, rows_written)
+        return ArchivedFile(
+            path=path,
+            manifest_path=manifest_path,
+            rows=rows_written,
+            max_id=last_id,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """运行指标（本进程累计）。"""
+
+        return {
+            "enabled": bool(settings.LOG_ARCHIVE_ENABLED),
+            "format": settings.LOG_ARCHIVE_FORMAT,
+            "parquetAvailable": pa is not None,
+            "files": self._files,
+            "rows": self._rows,
+        }
+
+
+log_archiver = LogArchiver()
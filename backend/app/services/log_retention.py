@@ -0,0 +1,366 @@
+"""
+日志分区维护与过期清理（操作日志 / 登录日志）。
+
+说明：
+- PostgreSQL：两张日志表按 created_at 月分区（迁移 12），分区名为 `<表名>_pYYYYMM`，
+  另有 `<表名>_default` 兜底分区。本服务定期：
+  - 预建当月及之后 LOG_PARTITION_PREMAKE_MONTHS 个月的分区（避免新数据落入兜底分区）；
+  - 整月都已过期的分区直接 DROP（不产生逐行删除的 WAL 与表膨胀）。
+- 保留期边界所在的月份、兜底分区以及 SQLite/MySQL（单表，不分区）按 created_at
+  分批删除过期数据，每批 LOG_RETENTION_BATCH_SIZE 行，避免长事务与大量锁。
+- 开启 LOG_ARCHIVE_ENABLED 时，过期数据先由 app.services.log_archive 写入归档文件，
+  每完成一个文件再分批删除该文件覆盖的行；归档失败时本轮不删除该表的任何数据。
+- 保留天数为 0 时不清理该表（仍会预建分区）。
+- 多 worker 时分区维护通过 PostgreSQL advisory lock 保证同一时刻只有一个进程执行；
+  分批删除本身可重复执行，不需要加锁。
+- 归档 + 删除整轮持有跨 worker 锁（配置 REDIS_URL 时为 Redis 锁，否则 PostgreSQL 为
+  pg_try_advisory_lock），避免多个进程归档同一批数据产生重复文件；未拿到锁的进程跳过本轮归档。
+- 开启归档时，只有本进程在锁内完整执行完归档后才 DROP 过期分区；跳过归档或归档中途失败时
+  本轮只预建分区，避免未归档的数据随分区一起删除。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+from app.core.config import settings
+from app.models.log import LoginLog, OperationLog
+from app.services.log_archive import log_archiver
+from app.utils.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock 使用的锁编号（任意固定值，仅需在本项目内唯一）
+_PARTITION_LOCK_KEY = 7_310_018
+# 归档 + 删除整轮使用的锁编号（PostgreSQL advisory lock）与 Redis 锁前缀、过期时间（秒）
+_ARCHIVE_LOCK_KEY = 7_310_019
+_ARCHIVE_LOCK_PREFIX = "log_retention:archive:"
+_ARCHIVE_LOCK_TTL_SECONDS = 1800
+
+_PARTITION_NAME_RE = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def _add_months(d: date, months: int) -> date:
+    """月份加减（返回该月 1 日）。"""
+
+    idx = d.year * 12 + (d.month - 1) + months
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def _partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+async def _update_redis_lock(client: Redis, name: str, token: str, *, ttl: int | None) -> bool:
+    """
+    仅当锁仍由 token 持有时续期（ttl）或释放（ttl=None），返回是否成功。
+
+    说明：使用 WATCH + MULTI 保证“比较后再修改”的原子性，不依赖 Lua 脚本。
+    """
+
+    async with client.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(name)
+            if await pipe.get(name) != token:
+                return False
+            pipe.multi()
+            if ttl is None:
+                pipe.delete(name)
+            else:
+                pipe.expire(name, ttl)
+            await pipe.execute()
+        except WatchError:
+            return False
+    return True
+
+
+class LogRetentionService:
+    """日志分区维护与过期清理。"""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._running = asyncio.Lock()
+        self._last_run_at: datetime | None = None
+        self._last_result: dict[str, dict[str, int]] = {}
+        self._last_error: str | None = None
+
+    def _policies(self) -> list[tuple[type[Model], int]]:
+        return [
+            (OperationLog, int(settings.OPERATION_LOG_RETENTION_DAYS)),
+            (LoginLog, int(settings.LOGIN_LOG_RETENTION_DAYS)),
+        ]
+
+    async def run_once(self) -> dict[str, dict[str, int]]:
+        """
+        执行一轮维护，返回每张表的处理结果。
+
+        说明：结果包含 archivedRows / droppedPartitions / deletedRows，
+        以及 archiveSkipped（其他进程持有归档锁、本轮跳过归档时为 1）。
+        """
+
+        async with self._running:
+            result: dict[str, dict[str, int]] = {}
+            now = datetime.now(UTC)
+            for model, days in self._policies():
+                table = model._meta.db_table
+                cutoff = now - timedelta(days=days) if days > 0 else None
+                archived = deleted = dropped = skipped = 0
+                archive_done = not settings.LOG_ARCHIVE_ENABLED
+                if cutoff and settings.LOG_ARCHIVE_ENABLED:
+                    async with self._archive_lock(model) as keepalive:
+                        if keepalive is None:
+                            skipped = 1
+                            logger.info("其他进程正在归档 %s，跳过本轮归档", table)
+                        else:
+                            archived, deleted = await self._archive_expired(
+                                model,
+                                cutoff,
+                                keepalive=keepalive,
+                            )
+                            archive_done = True
+                if await self._is_partitioned(model):
+                    # 未完成归档时不删除过期分区（只预建）
+                    drop_cutoff = cutoff if archive_done else None
+                    dropped = await self._maintain_partitions(model, drop_cutoff)
+                if cutoff and not settings.LOG_ARCHIVE_ENABLED:
+                    deleted = await self._delete_expired(model, cutoff)
+                result[table] = {
+                    "archivedRows": archived,
+                    "droppedPartitions": dropped,
+                    "deletedRows": deleted,
+                    "archiveSkipped": skipped,
+                }
+
+            self._last_run_at = now
+            self._last_result = result
+            return result
+
+    async def _is_partitioned(self, model: type[Model]) -> bool:
+        db = model._meta.db
+        if db.capabilities.dialect != "postgres":
+            return False
+        rows = await db.execute_query_dict(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass($1)",
+            [model._meta.db_table],
+        )
+        return bool(rows) and rows[0]["relkind"] == "p"
+
+    async def _maintain_partitions(self, model: type[Model], cutoff: datetime | None) -> int:
+        """预建分区并删除整月过期的分区，返回删除的分区数（未拿到锁时跳过）。"""
+
+        table = model._meta.db_table
+        this_month = datetime.now().date().replace(day=1)
+        premake = max(0, int(settings.LOG_PARTITION_PREMAKE_MONTHS))
+
+        async with in_transaction(model._meta.default_connection) as conn:
+            rows = await conn.execute_query_dict(
+                "SELECT pg_try_advisory_xact_lock($1, hashtext($2)) AS locked",
+                [_PARTITION_LOCK_KEY, table],
+            )
+            if not rows or not rows[0]["locked"]:
+                return 0
+
+            rows = await conn.execute_query_dict(
+                "SELECT c.relname AS name FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = $1::regclass",
+                [table],
+            )
+            existing = {r["name"] for r in rows}
+
+            for offset in range(premake + 1):
+                month = _add_months(this_month, offset)
+                name = _partition_name(table, month)
+                if name in existing:
+                    continue
+                try:
+                    # 保存点：单个分区创建失败（如兜底分区已有该月数据）不影响其余操作
+                    async with in_transaction(model._meta.default_connection) as sp:
+                        await sp.execute_script(
+                            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                            f"FOR VALUES FROM ('{month.isoformat()}') "
+                            f"TO ('{_add_months(month, 1).isoformat()}')",
+                        )
+                except Exception:  # noqa: BLE001 - 建分区失败时数据落入兜底分区，不影响写入
+                    logger.warning("预建日志分区失败：%s", name, exc_info=True)
+
+            if cutoff is None:
+                return 0
+
+            dropped = 0
+            # 分区边界按数据库时区解释，这里多留 1 天余量，剩余过期行由分批删除处理
+            cutoff_day = cutoff.date() - timedelta(days=1)
+            for name in sorted(existing):
+                m = _PARTITION_NAME_RE.search(name)
+                if not m or not name.startswith(f"{table}_p"):
+                    continue
+                month = date(int(m.group(1)), int(m.group(2)), 1)
+                if _add_months(month, 1) > cutoff_day:
+                    continue
+                await conn.execute_script(f'DROP TABLE IF EXISTS "{name}"')
+                dropped += 1
+                logger.info("已删除过期日志分区：%s", name)
+            return dropped
+
+    @contextlib.asynccontextmanager
+    async def _archive_lock(
+        self,
+        model: type[Model],
+    ) -> AsyncIterator[Callable[[], Awaitable[None]] | None]:
+        """
+        归档 + 删除整轮的跨 worker 锁：拿到锁时产出续期函数，未拿到时产出 None。
+
+        说明：
+        - 配置 REDIS_URL 时使用 Redis 锁（SET NX + 过期时间，进程异常退出后自动释放；
+          每完成一个文件续期）；
+        - 否则 PostgreSQL 在单独的连接上持有会话级 pg_try_advisory_lock，整轮结束后释放；
+        - 其他数据库且未配置 Redis 时视为单实例部署，不加锁。
+        """
+
+        async def noop() -> None:
+            return None
+
+        table = model._meta.db_table
+        client = get_redis()
+        if client is not None:
+            name = _ARCHIVE_LOCK_PREFIX + table
+            token = secrets.token_hex(16)
+            if not await client.set(name, token, nx=True, ex=_ARCHIVE_LOCK_TTL_SECONDS):
+                yield None
+                return
+
+            async def renew() -> None:
+                if not await _update_redis_lock(
+                    client,
+                    name,
+                    token,
+                    ttl=_ARCHIVE_LOCK_TTL_SECONDS,
+                ):
+                    logger.warning("日志归档锁已失效（可能被其他进程获取）：%s", table)
+
+            try:
+                yield renew
+            finally:
+                with contextlib.suppress(Exception):
+                    await _update_redis_lock(client, name, token, ttl=None)
+            return
+
+        db = model._meta.db
+        if db.capabilities.dialect != "postgres":
+            yield noop
+            return
+
+        async with db.acquire_connection() as conn:
+            locked = await conn.fetchval(
+                "SELECT pg_try_advisory_lock($1, hashtext($2))",
+                _ARCHIVE_LOCK_KEY,
+                table,
+            )
+            if not locked:
+                yield None
+                return
+            try:
+                yield noop
+            finally:
+                await conn.execute(
+                    "SELECT pg_advisory_unlock($1, hashtext($2))",
+                    _ARCHIVE_LOCK_KEY,
+                    table,
+                )
+
+    async def _archive_expired(
+        self,
+        model: type[Model],
+        cutoff: datetime,
+        *,
+        keepalive: Callable[[], Awaitable[None]],
+    ) -> tuple[int, int]:
+        """逐个文件归档过期数据，每个文件完成后删除其覆盖的行，返回（归档行数, 删除行数）。"""
+
+        archived = deleted = 0
+        while True:
+            archived_file = await log_archiver.archive_file(model, cutoff)
+            if archived_file is None:
+                break
+            archived += archived_file.rows
+            deleted += await self._delete_expired(model, cutoff, max_id=archived_file.max_id)
+            await keepalive()
+        return archived, deleted
+
+    async def _delete_expired(
+        self,
+        model: type[Model],
+        cutoff: datetime,
+        *,
+        max_id: int | None = None,
+    ) -> int:
+        """分批删除 created_at 早于 cutoff（且 id 不超过 max_id）的数据，返回删除行数。"""
+
+        batch_size = max(1, int(settings.LOG_RETENTION_BATCH_SIZE))
+        expired = model.filter(created_at__lt=cutoff)
+        if max_id is not None:
+            expired = expired.filter(id__lte=max_id)
+        deleted = 0
+        while True:
+            ids = await expired.limit(batch_size).values_list("id", flat=True)
+            if not ids:
+                break
+            # 同时带上 created_at 条件，分区表上只需访问过期数据所在分区
+            deleted += await model.filter(id__in=list(ids), created_at__lt=cutoff).delete()
+            if len(ids) < batch_size:
+                break
+            # 让出事件循环，避免连续删除期间阻塞其他请求
+            await asyncio.sleep(0)
+        return deleted
+
+    async def _loop(self) -> None:
+        interval = max(60, int(settings.LOG_RETENTION_INTERVAL_SECONDS))
+        while True:
+            try:
+                await self.run_once()
+                self._last_error = None
+            except Exception as exc:  # noqa: BLE001 - 单轮失败不影响下一轮
+                logger.exception("日志分区维护/过期清理失败")
+                self._last_error = str(exc)[:500]
+            await asyncio.sleep(interval)
+
+    async def start(self) -> None:
+        """启动后台任务（应用启动时调用，启动后立即执行一轮）。"""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """停止后台任务（应用关闭时调用）。"""
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """运行指标（用于监控接口）。"""
+
+        return {
+            "lastRunAt": self._last_run_at.isoformat() if self._last_run_at else None,
+            "lastResult": self._last_result,
+            "lastError": self._last_error,
+            "archive": log_archiver.stats(),
+            "retentionDays": {model._meta.db_table: days for model, days in self._policies()},
+        }
+
+
+log_retention_service = LogRetentionService()
@@ -0,0 +1,104 @@
+"""
+操作日志关键字搜索（username / module / url / request_data）。
+
+说明：
+- PostgreSQL：迁移 13 为这几列建立 pg_trgm GIN 索引，索引表达式与 Tortoise 生成的
+  icontains 条件 `UPPER(CAST(col AS VARCHAR)) LIKE ...` 完全一致，因此查询仍使用
+  icontains（OR 连接），由 BitmapOr 走索引，不再顺序扫描；
+- SQLite：启动时创建 FTS5 trigram 虚拟表（外部内容表，指向 sys_operation_log），
+  由触发器在插入/更新/删除时同步；关键字不少于 3 个字符时使用 MATCH 子查询；
+- 其他情况（MySQL、SQLite 不支持 trigram、关键字过短）回退为 icontains。
+- trigram 为子串匹配，中文等无分词语言同样适用；不区分大小写。
+"""
+
+from __future__ import annotations
+
+import logging
+
+from tortoise.expressions import Q, RawSQL
+from tortoise.queryset import QuerySet
+
+from app.models.log import OperationLog
+
+logger = logging.getLogger(__name__)
+
+_SEARCH_COLUMNS = ("username", "module", "url", "request_data")
+
+# trigram 至少需要 3 个字符才能命中索引
+_FTS_MIN_CHARS = 3
+
+
+class OperationLogSearch:
+    """操作日志关键字搜索。"""
+
+    def __init__(self) -> None:
+        self._fts_ready = False
+
+    @property
+    def fts_table(self) -> str:
+        return f"{OperationLog._meta.db_table}_fts"
+
+    async def ensure_index(self) -> None:
+        """应用启动时调用：SQLite 下创建 FTS5 索引表与同步触发器（已存在时跳过）。"""
+
+        db = OperationLog._meta.db
+        if db.capabilities.dialect != "sqlite":
+            return
+
+        table = OperationLog._meta.db_table
+        fts = self.fts_table
+        cols = ", ".join(_SEARCH_COLUMNS)
+        new_cols = ", ".join(f"new.{c}" for c in _SEARCH_COLUMNS)
+        old_cols = ", ".join(f"old.{c}" for c in _SEARCH_COLUMNS)
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});"
+        )
+        insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});"
+
+        try:
+            rows = await db.execute_query_dict(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+                [fts],
+            )
+            await db.execute_script(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{cols}, content='{table}', content_rowid='id', tokenize='trigram');"
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+                f"BEGIN {insert_new} END;"
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+                f"BEGIN {delete_old} END;"
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} "
+                f"BEGIN {delete_old} {insert_new} END;",
+            )
+            if not rows:
+                # 首次创建：为已有数据建立索引
+                await db.execute_script(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        except Exception:  # noqa: BLE001 - SQLite 版本过低（< 3.34）时回退为 LIKE
+            logger.warning("创建操作日志全文索引失败，关键字搜索回退为 LIKE", exc_info=True)
+            return
+
+        self._fts_ready = True
+
+    def apply(self, qs: QuerySet[OperationLog], keyword: str) -> QuerySet[OperationLog]:
+        """在查询上追加关键字条件（任一列包含关键字即命中）。"""
+
+        keyword = keyword.strip()
+        if not keyword:
+            return qs
+
+        if self._fts_ready and len(keyword) >= _FTS_MIN_CHARS:
+            # FTS5 短语查询：双引号包裹避免关键字被解析为查询语法；再转义为 SQL 字符串字面量
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            literal = "'" + phrase.replace("'", "''") + "'"
+            fts = self.fts_table
+            # 直接以 id IN (子查询) 作为条件，SQLite 才能按 rowid 逐条定位而不是全表扫描
+            return qs.filter(
+                id__in=RawSQL(f"(SELECT rowid FROM {fts} WHERE {fts} MATCH {literal})"),
+            )
+
+        return qs.filter(
+            Q(*[Q(**{f"{col}__icontains": keyword}) for col in _SEARCH_COLUMNS], join_type="OR"),
+        )
+
+
+operation_log_search = OperationLogSearch()
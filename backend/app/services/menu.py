@@ -5,6 +5,8 @@
 - sys_role_menu 用于维护 角色 -> 菜单/按钮 的授权关系。
 - 前端动态路由（@vben/access）需要的是 RouteRecordStringComponent 结构，
   因此这里会把 Menu 模型转换为路由记录结构并过滤掉 button 类型节点。
+- 权限码与路由菜单树按“角色集合”缓存，
+  菜单/角色/授权变更时通过 invalidate_menu_cache() 递增版本失效。
 """
 
 from __future__ import annotations
@@ -16,6 +18,38 @@ from typing import Any
 from app.core.config import settings
 from app.models.menu import Menu
 from app.models.user import User
+from app.utils.cache import TTLCache
+
+# 菜单/授权数据版本号：菜单、角色或角色授权变更时递增
+_menu_version = 0
+
+# (版本号, 角色集合) -> 权限码集合
+_access_codes_cache = TTLCache(maxsize=1024, ttl=settings.PERMISSION_CACHE_TTL_SECONDS)
+
+# 路由菜单缓存：预编译菜单森林、单角色授权菜单 id、角色集合 -> 路由树（key 均带版本号）
+_route_cache = TTLCache(maxsize=1024, ttl=settings.PERMISSION_CACHE_TTL_SECONDS)
+
+
+def get_menu_version() -> int:
+    """获取当前 worker 的菜单/授权数据版本号。"""
+
+    return _menu_version
+
+
+def invalidate_menu_cache() -> None:
+    """
+    菜单、角色或角色授权变更后调用，使权限码与路由菜单缓存失效。
+
+    说明：
+    - 缓存 key 带版本号：变更前已开始计算的结果不会被写回为新版本；
+    - 仅对当前 worker 立即生效，其他 worker 最多延迟 PERMISSION_CACHE_TTL_SECONDS 生效。
+    """
+
+    global _menu_version
+
+    _menu_version += 1
+    _access_codes_cache.clear()
+    _route_cache.clear()
 
 
 def _as_int(value: Any, default: int = 0) -> int:
@@ -113,59 +147,147 @@ async def get_system_menu_tree() -> list[dict]:
     return _build_tree(menus, serializer=_serialize_system_menu)
 
 
-async def get_access_codes_for_roles(role_codes: list[str]) -> list[str]:
-    """根据角色编码返回权限码集合（按钮/菜单 authCode）。"""
+async def get_access_code_set(role_codes: Iterable[str]) -> frozenset[str]:
+    """
+    根据角色编码返回权限码集合（带缓存，用于接口权限校验）。
 
-    if settings.SUPERUSER_ROLE_CODE in role_codes:
+    说明：命中缓存时不访问数据库，权限校验退化为集合子集判断。
+    """
+
+    roles = frozenset(str(code) for code in role_codes)
+    key = (_menu_version, roles)
+    cached = _access_codes_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if settings.SUPERUSER_ROLE_CODE in roles:
         codes = (
             await Menu.exclude(auth_code=None).values_list("auth_code", flat=True)  # type: ignore[arg-type]
         )
-        return sorted({str(code) for code in codes if code})
+    elif roles:
+        codes = (
+            await Menu.filter(roles__code__in=list(roles))
+            .exclude(auth_code=None)
+            .values_list("auth_code", flat=True)  # type: ignore[arg-type]
+        )
+    else:
+        codes = []
 
-    codes = (
-        await Menu.filter(roles__code__in=role_codes)
-        .exclude(auth_code=None)
-        .values_list("auth_code", flat=True)  # type: ignore[arg-type]
-    )
-    return sorted({str(code) for code in codes if code})
+    result = frozenset(str(code) for code in codes if code)
+    _access_codes_cache.set(key, result)
+    return result
 
 
-async def get_routes_for_user(username: str) -> list[dict]:
+async def get_access_codes_for_roles(role_codes: list[str]) -> list[str]:
+    """根据角色编码返回权限码集合（按钮/菜单 authCode）。"""
+
+    return sorted(await get_access_code_set(role_codes))
+
+
+class _CompiledRouteMenus:
     """
-    获取用户可访问的路由菜单（用于 /menu/all）。
+    预编译的路由菜单森林（仅包含启用的非 button 节点）。
 
     说明：
-    - 过滤掉 button 类型节点；
-    - 对于非超级管理员：按角色授权过滤菜单，并自动补全父级目录节点。
+    - parent_of / children_of 为按 id 索引的父指针与已排序子节点；
+    - payloads 为预先序列化好的路由记录（不含 children），构建子树时只做拼装。
     """
 
-    user = await User.get_or_none(username=username, is_active=True)
-    if not user:
-        return []
+    def __init__(self, menus: Iterable[Menu]) -> None:
+        items = sorted(menus, key=_sort_key)
+        self.parent_of: dict[int, int | None] = {m.id: m.parent_id for m in items}
+        self.children_of: dict[int | None, list[int]] = defaultdict(list)
+        for m in items:
+            self.children_of[m.parent_id].append(m.id)
+        self.payloads: dict[int, dict] = {m.id: _serialize_route_menu(m, None) for m in items}
+
+    @property
+    def all_ids(self) -> set[int]:
+        return set(self.parent_of)
+
+    def with_ancestors(self, menu_ids: Iterable[int]) -> set[int]:
+        """补全父级目录节点（沿父指针向上，遇到已包含的节点即停止）。"""
+
+        include_ids: set[int] = set()
+        for mid in menu_ids:
+            current: int | None = mid
+            while current is not None and current in self.parent_of and current not in include_ids:
+                include_ids.add(current)
+                current = self.parent_of[current]
+        return include_ids
+
+    def build(self, include_ids: set[int]) -> list[dict]:
+        def build(parent_id: int | None) -> list[dict]:
+            result: list[dict] = []
+            for mid in self.children_of.get(parent_id, []):
+                if mid not in include_ids:
+                    continue
+                children = build(mid)
+                payload = self.payloads[mid]
+                result.append({**payload, "children": children} if children else payload)
+            return result
+
+        return build(None)
+
+
+async def _get_compiled_route_menus() -> _CompiledRouteMenus:
+    key = ("route_forest", _menu_version)
+    compiled = _route_cache.get(key)
+    if compiled is None:
+        menus = await Menu.filter(status=1).exclude(type="button").all()
+        compiled = _CompiledRouteMenus(menus)
+        _route_cache.set(key, compiled)
+    return compiled
+
+
+async def _get_role_menu_ids(role_code: str) -> frozenset[int]:
+    key = ("role_menus", _menu_version, role_code)
+    ids = _route_cache.get(key)
+    if ids is None:
+        values = await Menu.filter(roles__code=role_code).values_list("id", flat=True)
+        ids = frozenset(int(i) for i in values)
+        _route_cache.set(key, ids)
+    return ids
+
+
+async def get_routes_for_role_codes(role_codes: Iterable[str]) -> list[dict]:
+    """
+    根据角色集合获取路由菜单树（带缓存）。
 
-    roles = await user.roles.filter(status=1).all()
-    role_codes = [r.code for r in roles]
+    说明：
+    - 过滤掉 button 类型节点；
+    - 对于非超级管理员：按角色授权过滤菜单，并自动补全父级目录节点；
+    - 返回值为缓存对象，调用方不得修改。
+    """
 
-    base_qs = Menu.filter(status=1).exclude(type="button")
+    roles = frozenset(str(code) for code in role_codes)
+    key = ("routes", _menu_version, roles)
+    cached = _route_cache.get(key)
+    if cached is not None:
+        return cached
+
+    compiled = await _get_compiled_route_menus()
 
     # 超级管理员拥有全部菜单
-    if settings.SUPERUSER_ROLE_CODE in role_codes:
-        menus = await base_qs.all()
-        return _build_tree(menus, serializer=_serialize_route_menu)
+    if settings.SUPERUSER_ROLE_CODE in roles:
+        include_ids = compiled.all_ids
+    else:
+        permitted: set[int] = set()
+        for code in roles:
+            permitted |= await _get_role_menu_ids(code)
+        include_ids = compiled.with_ancestors(permitted)
 
-    permitted_ids = await base_qs.filter(roles__code__in=role_codes).values_list("id", flat=True)
-    permitted_id_set = {int(i) for i in permitted_ids}
-    if not permitted_id_set:
-        return []
+    routes = compiled.build(include_ids) if include_ids else []
+    _route_cache.set(key, routes)
+    return routes
 
-    all_menus = await base_qs.all()
-    menu_by_id = {m.id: m for m in all_menus}
 
-    include_ids: set[int] = set(permitted_id_set)
-    for mid in list(permitted_id_set):
-        parent_id = menu_by_id.get(mid).parent_id if menu_by_id.get(mid) else None
-        while parent_id:
-            include_ids.add(parent_id)
-            parent_id = menu_by_id.get(parent_id).parent_id if menu_by_id.get(parent_id) else None
+async def get_routes_for_user(username: str) -> list[dict]:
+    """获取用户可访问的路由菜单（用于 /menu/all）。"""
+
+    user = await User.get_or_none(username=username, is_active=True)
+    if not user:
+        return []
 
-    return _build_tree(all_menus, include_ids=include_ids, serializer=_serialize_route_menu)
+    role_codes = await user.roles.filter(status=1).values_list("code", flat=True)
+    return await get_routes_for_role_codes([str(code) for code in role_codes])
@@ -0,0 +1,171 @@
+"""
+操作日志异步批量写入。
+
+说明：
+- 请求路径只把日志放入内存有界队列，不再等待 INSERT；
+- 后台任务每攒够 OPERATION_LOG_BATCH_SIZE 条或每隔 OPERATION_LOG_FLUSH_MS 毫秒批量写入一次；
+- 队列满时的处理策略（OPERATION_LOG_OVERFLOW）：
+  - drop_oldest：丢弃最早的一条并计数（默认，请求延迟不受影响）；
+  - block：等待队列有空位（不丢日志，但数据库变慢时会拖慢请求）；
+- 应用关闭时会把队列中剩余日志全部写完再退出。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime
+
+from app.core.config import settings
+from app.models.log import OperationLog
+
+logger = logging.getLogger(__name__)
+
+
+class OperationLogWriter:
+    """操作日志写入器（有界队列 + 后台批量写库）。"""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        batch_size: int,
+        flush_ms: int,
+        overflow: str = "drop_oldest",
+    ) -> None:
+        self.batch_size = max(1, int(batch_size))
+        self.flush_seconds = max(1, int(flush_ms)) / 1000
+        self.overflow = "block" if (overflow or "").strip().lower() == "block" else "drop_oldest"
+        self._queue: asyncio.Queue[OperationLog] = asyncio.Queue(maxsize=max(1, int(maxsize)))
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._last_flush_ms: float | None = None
+        self._last_flush_at: datetime | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def submit(self, log: OperationLog) -> None:
+        """提交一条日志（后台任务未启动时直接写库）。"""
+
+        if not self.running:
+            await log.save()
+            self._written += 1
+            return
+
+        if self.overflow == "block":
+            await self._queue.put(log)
+        else:
+            while self._queue.full():
+                with contextlib.suppress(asyncio.QueueEmpty):
+                    self._queue.get_nowait()
+                    self._dropped += 1
+            self._queue.put_nowait(log)
+        self._enqueued += 1
+
+    async def _next_batch(self) -> list[OperationLog]:
+        """取下一批日志：等到第一条后，继续收集直到攒满一批或超过刷新间隔。"""
+
+        batch: list[OperationLog] = []
+        if self._stopping:
+            while not self._queue.empty() and len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+            return batch
+
+        try:
+            batch.append(await asyncio.wait_for(self._queue.get(), timeout=self.flush_seconds))
+        except TimeoutError:
+            return batch
+
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stopping:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: list[OperationLog]) -> None:
+        start = time.perf_counter()
+        try:
+            await OperationLog.bulk_create(batch)
+            self._written += len(batch)
+        except Exception:
+            # 日志写入失败不应影响正常业务：记录后丢弃本批
+            self._failed += len(batch)
+            logger.exception("操作日志批量写入失败（%s 条）", len(batch))
+        finally:
+            self._last_flush_ms = round((time.perf_counter() - start) * 1000, 2)
+            self._last_flush_at = datetime.now(UTC)
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            if batch:
+                await self._write(batch)
+            elif self._stopping:
+                return
+
+    async def start(self) -> None:
+        """启动后台写入任务（应用启动时调用）。"""
+
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台任务并写完队列中的剩余日志（应用关闭时调用，此时数据库连接仍可用）。"""
+
+        if self._task is None:
+            return
+
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout=max(5.0, self.flush_seconds * 10))
+        except TimeoutError:
+            logger.warning(
+                "操作日志写入任务未能在超时内退出，剩余 %s 条未写入",
+                self._queue.qsize(),
+            )
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """运行指标（用于监控接口）。"""
+
+        return {
+            "queueDepth": self._queue.qsize(),
+            "queueCapacity": self._queue.maxsize,
+            "overflow": self.overflow,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "lastFlushMs": self._last_flush_ms,
+            "lastFlushAt": self._last_flush_at.isoformat() if self._last_flush_at else None,
+        }
+
+
+operation_log_writer = OperationLogWriter(
+    maxsize=settings.OPERATION_LOG_QUEUE_SIZE,
+    batch_size=settings.OPERATION_LOG_BATCH_SIZE,
+    flush_ms=settings.OPERATION_LOG_FLUSH_MS,
+    overflow=settings.OPERATION_LOG_OVERFLOW,
+)
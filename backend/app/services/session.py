@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 from datetime import UTC, datetime
 
 from app.core.config import settings
 from app.models.config import Config
 from app.models.session import UserSession
 from app.models.user import User
+from app.services.heartbeat import heartbeat_buffer
+from app.services.session_store import SessionState, SessionStore, build_session_store
 from app.utils.user_agent import parse_browser, parse_os
 from app.ws.notice import notice_ws_manager
 
+logger = logging.getLogger(__name__)
+
 _VALID_LOGIN_MODES = {"single", "multi"}
 
 
@@ -24,6 +31,16 @@ def _normalize_login_mode(value: str | None) -> str | None:
 
 
 class SessionService:
+    def __init__(self) -> None:
+        # jti -> SessionState；撤销路径会同步写入存储（local 模式下其他 worker 由 TTL 兜底）
+        self._store: SessionStore = build_session_store()
+        self._flush_task: asyncio.Task | None = None
+
+    def configure_store(self, store: SessionStore) -> None:
+        """替换会话状态存储（用于测试注入 fake Redis 或运行期切换）。"""
+
+        self._store = store
+
     async def get_login_mode(self) -> str:
         """
         获取登录模式。
@@ -73,6 +90,10 @@ class SessionService:
                     revoke_reason="账号在其他地方登录，您已被迫下线",
                     revoked_by="system",
                 )
+                await self._store.revoke(
+                    [s.jti for s in revoked_sessions],
+                    reason="账号在其他地方登录，您已被迫下线",
+                )
                 await notice_ws_manager.broadcast_sessions(
                     [(s.username, s.jti) for s in revoked_sessions],
                     notice_ws_manager.build_event(
@@ -106,28 +127,42 @@ class SessionService:
         if not jti:
             return False, "登录信息无效，请重新登录"
 
-        session = await UserSession.get_or_none(jti=jti, username=username)
-        if not session:
+        state = await self._store.get(jti)
+        if state is None:
+            session = await UserSession.get_or_none(jti=jti, username=username)
+            if not session:
+                return False, "登录信息无效，请重新登录"
+            state = SessionState.from_model(session)
+            await self._store.put(jti, state)
+
+        if state.status != 1:
+            return False, state.revoke_reason or "已被强制下线，请重新登录"
+        if state.username != username:
             return False, "登录信息无效，请重新登录"
 
-        if session.status != 1:
-            return False, session.revoke_reason or "已被强制下线，请重新登录"
-
         now = _now()
-        if session.expires_at and session.expires_at <= now:
+        if state.expires_at and state.expires_at <= now:
             return False, "登录已过期，请重新登录"
 
-        # 更新最后活跃时间（做简单节流，避免每次请求都写库）
+        # 更新最后活跃时间（节流后只记入缓冲，由后台任务批量写库）
         try:
-            if not session.last_seen_at or (now - session.last_seen_at).total_seconds() >= 30:
-                session.last_seen_at = now
-                await session.save(update_fields=["last_seen_at"])
+            if await self._store.touch(jti, state, now):
+                heartbeat_buffer.record(jti, now)
         except Exception:
-            # 最后活跃时间写入失败不影响鉴权
+            # 最后活跃时间记录失败不影响鉴权
             pass
 
         return True, "ok"
 
+    async def get_expires_at(self, *, username: str, jti: str) -> datetime | None:
+        """获取会话过期时间（WebSocket 连接据此在到期后断开）。"""
+
+        state = await self._store.get(jti)
+        if state is not None and state.username == username:
+            return state.expires_at
+        session = await UserSession.get_or_none(jti=jti, username=username)
+        return session.expires_at if session else None
+
     async def revoke_sessions(
         self,
         *,
@@ -168,6 +203,7 @@ class SessionService:
             revoke_reason=reason,
             revoked_by=revoked_by,
         )
+        await self._store.revoke([jti for _, jti in affected_sessions], reason=reason)
 
         # 推送踢下线事件（用于前端提示与自动退出）
         if send_kickout_event and affected_sessions:
@@ -197,6 +233,7 @@ class SessionService:
             return False
 
         if session.status != 1:
+            await self._store.invalidate([session.jti])
             return True
 
         await self.revoke_sessions(
@@ -207,5 +244,40 @@ class SessionService:
         )
         return True
 
+    async def flush_heartbeats(self) -> int:
+        """将缓冲的最后活跃时间（本进程 + 存储层）批量写入数据库，返回写入条数。"""
+
+        return await heartbeat_buffer.flush(extra=await self._store.drain_heartbeats())
+
+    async def _heartbeat_flush_loop(self) -> None:
+        interval = max(1, int(settings.SESSION_HEARTBEAT_FLUSH_SECONDS))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_heartbeats()
+            except Exception:
+                logger.exception("会话心跳批量写库失败")
+
+    async def start(self) -> None:
+        """启动后台任务（应用启动时调用）。"""
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._heartbeat_flush_loop())
+
+    async def stop(self) -> None:
+        """停止后台任务并写入剩余心跳（应用关闭时调用，此时数据库连接仍可用）。"""
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        try:
+            await self.flush_heartbeats()
+        except Exception:
+            logger.exception("会话心跳写库失败（应用关闭）")
+        await self._store.close()
+
 
 session_service = SessionService()
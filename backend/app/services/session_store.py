@@ -0,0 +1,260 @@
+"""
+会话状态存储：用于会话校验（validate_session）的快速路径。
+
+说明：
+- sys_user_session 仍是会话的最终数据源（在线列表、审计、下线记录）；
+- 存储层只保存校验所需的最小状态，未命中时由调用方回源数据库；
+- local：进程内 TTL 缓存，适用于单进程部署；
+- redis：多 worker/多实例共享的状态与撤销集合，撤销对所有 worker 立即生效。
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.models.session import UserSession
+from app.utils.cache import TTLCache, get_redis
+
+# 最后活跃时间的写库节流间隔（秒）
+HEARTBEAT_INTERVAL_SECONDS = 30
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _dt_to_str(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt else None
+
+
+def _dt_from_str(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass
+class SessionState:
+    """会话校验所需的最小状态（按 jti 索引）。"""
+
+    username: str
+    status: int
+    expires_at: datetime | None
+    last_seen_at: datetime | None
+    revoke_reason: str | None
+
+    @classmethod
+    def from_model(cls, session: UserSession) -> SessionState:
+        return cls(
+            username=session.username,
+            status=int(session.status),
+            expires_at=session.expires_at,
+            last_seen_at=session.last_seen_at,
+            revoke_reason=session.revoke_reason,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "username": self.username,
+                "status": self.status,
+                "expiresAt": _dt_to_str(self.expires_at),
+                "lastSeenAt": _dt_to_str(self.last_seen_at),
+                "revokeReason": self.revoke_reason,
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> SessionState:
+        data = json.loads(raw)
+        return cls(
+            username=str(data.get("username") or ""),
+            status=int(data.get("status") or 0),
+            expires_at=_dt_from_str(data.get("expiresAt")),
+            last_seen_at=_dt_from_str(data.get("lastSeenAt")),
+            revoke_reason=data.get("revokeReason"),
+        )
+
+
+class LocalSessionStore:
+    """
+    进程内会话状态存储（TTL 缓存）。
+
+    说明：
+    - 本 worker 内的撤销会主动失效缓存；其他 worker 的撤销最多延迟 TTL 生效；
+    - 心跳只做节流，由调用方记入本进程的心跳缓冲后批量写库。
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, jti: str) -> SessionState | None:
+        return self._cache.get(jti)
+
+    async def put(self, jti: str, state: SessionState) -> None:
+        self._cache.set(jti, state)
+
+    async def revoke(self, jtis: Iterable[str], *, reason: str) -> None:
+        self._cache.delete_many(jtis)
+
+    async def invalidate(self, jtis: Iterable[str]) -> None:
+        self._cache.delete_many(jtis)
+
+    async def touch(self, jti: str, state: SessionState, now: datetime) -> bool:
+        """
+        记录一次活跃。
+
+        返回：
+        - True：已超过节流间隔，需要调用方记入心跳缓冲
+        - False：无需记录（节流窗口内或已由存储层缓冲）
+        """
+
+        if state.last_seen_at and (
+            (now - state.last_seen_at).total_seconds() < HEARTBEAT_INTERVAL_SECONDS
+        ):
+            return False
+        state.last_seen_at = now
+        return True
+
+    async def drain_heartbeats(self) -> dict[str, datetime]:
+        return {}
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+class RedisSessionStore:
+    """
+    Redis 会话状态存储（多 worker/多实例共享）。
+
+    Key 约定（prefix 默认 `session`）：
+    - {prefix}:state:{jti}    会话状态 JSON，过期时间与 token 一致
+    - {prefix}:revoked:{jti}  撤销集合（值为下线原因），保留到 token 自然过期
+    - {prefix}:seen:{jti}     心跳节流标记（SET NX EX）
+    - {prefix}:heartbeats     待写库的心跳缓冲（hash：jti -> ISO 时间）
+
+    说明：
+    - 校验路径只有一次 MGET（状态 + 撤销标记），O(1)；
+    - client 只依赖 redis.asyncio 的通用命令，测试时可直接传入 fakeredis 客户端。
+    """
+
+    def __init__(self, client: Redis, *, prefix: str = "session") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def _state_key(self, jti: str) -> str:
+        return f"{self._prefix}:state:{jti}"
+
+    def _revoked_key(self, jti: str) -> str:
+        return f"{self._prefix}:revoked:{jti}"
+
+    def _seen_key(self, jti: str) -> str:
+        return f"{self._prefix}:seen:{jti}"
+
+    @property
+    def _heartbeats_key(self) -> str:
+        return f"{self._prefix}:heartbeats"
+
+    @staticmethod
+    def _token_ttl_seconds() -> int:
+        # token 最长有效期，撤销标记保留到该时长后即可安全过期
+        return max(60, int(settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES) * 60)
+
+    async def get(self, jti: str) -> SessionState | None:
+        raw_state, revoked_reason = await self._client.mget(
+            self._state_key(jti),
+            self._revoked_key(jti),
+        )
+
+        state = SessionState.from_json(raw_state) if raw_state else None
+        if revoked_reason is not None:
+            if state is None:
+                state = SessionState(
+                    username="",
+                    status=0,
+                    expires_at=None,
+                    last_seen_at=None,
+                    revoke_reason=None,
+                )
+            state.status = 0
+            state.revoke_reason = revoked_reason or state.revoke_reason
+        return state
+
+    async def put(self, jti: str, state: SessionState) -> None:
+        ttl = self._token_ttl_seconds()
+        if state.expires_at:
+            ttl = int((state.expires_at - _now()).total_seconds())
+            if ttl <= 0:
+                return
+        await self._client.set(self._state_key(jti), state.to_json(), ex=ttl)
+
+    async def revoke(self, jtis: Iterable[str], *, reason: str) -> None:
+        keys = [j for j in jtis if j]
+        if not keys:
+            return
+
+        ttl = self._token_ttl_seconds()
+        async with self._client.pipeline(transaction=False) as pipe:
+            for jti in keys:
+                pipe.set(self._revoked_key(jti), reason or "", ex=ttl)
+                pipe.delete(self._state_key(jti))
+            await pipe.execute()
+
+    async def invalidate(self, jtis: Iterable[str]) -> None:
+        keys = [self._state_key(j) for j in jtis if j]
+        if keys:
+            await self._client.delete(*keys)
+
+    async def touch(self, jti: str, state: SessionState, now: datetime) -> bool:
+        acquired = await self._client.set(
+            self._seen_key(jti),
+            "1",
+            nx=True,
+            ex=HEARTBEAT_INTERVAL_SECONDS,
+        )
+        if acquired:
+            await self._client.hset(self._heartbeats_key, jti, now.isoformat())
+        return False
+
+    async def drain_heartbeats(self) -> dict[str, datetime]:
+        """原子地取出并清空心跳缓冲（多 worker 并发 drain 时每条心跳只会被取走一次）。"""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self._heartbeats_key)
+            pipe.delete(self._heartbeats_key)
+            raw, _ = await pipe.execute()
+
+        beats: dict[str, datetime] = {}
+        for jti, value in (raw or {}).items():
+            try:
+                beats[str(jti)] = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                continue
+        return beats
+
+    async def close(self) -> None:
+        return None
+
+
+SessionStore = LocalSessionStore | RedisSessionStore
+
+
+def build_session_store() -> SessionStore:
+    """根据配置 SESSION_STORE 创建会话状态存储。"""
+
+    backend = (settings.SESSION_STORE or "local").strip().lower()
+    if backend == "redis":
+        client = get_redis()
+        if client is None:
+            raise RuntimeError("SESSION_STORE=redis 需要配置 REDIS_URL。")
+        return RedisSessionStore(client)
+
+    return LocalSessionStore(
+        maxsize=settings.SESSION_CACHE_MAX_SIZE,
+        ttl=settings.SESSION_CACHE_TTL_SECONDS,
+    )
@@ -1,11 +1,105 @@
-"""Redis 缓存工具（占位实现）。"""
+"""缓存工具（进程内 TTL 缓存、Redis 客户端）。"""
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from redis.asyncio import Redis
+
 from app.core.config import settings
 
+_redis_client: Redis | None = None
+
 
 def get_redis_url() -> str | None:
     """获取 Redis 连接地址（未配置则返回 None）。"""
 
     return settings.REDIS_URL
+
+
+def get_redis() -> Redis | None:
+    """
+    获取全局 Redis 客户端（未配置 REDIS_URL 则返回 None）。
+
+    说明：
+    - 客户端懒加载创建，真正的连接在首次执行命令时建立；
+    - 统一使用 decode_responses=True，读写均为 str。
+    """
+
+    global _redis_client
+
+    url = get_redis_url()
+    if not url:
+        return None
+    if _redis_client is None:
+        _redis_client = Redis.from_url(url, decode_responses=True)
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """关闭全局 Redis 客户端（应用关闭时调用）。"""
+
+    global _redis_client
+
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.aclose()
+    finally:
+        _redis_client = None
+
+
+class TTLCache:
+    """
+    进程内 TTL 缓存（LRU 淘汰）。
+
+    说明：
+    - 仅在当前 worker 内有效，多 worker/多实例之间互不可见；
+    - 过期判断使用单调时钟，不受系统时间调整影响；
+    - 所有操作均为同步 O(1)，不包含 await，在 asyncio 单线程模型下无需加锁。
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = float(ttl)
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expire_at, value = item
+        if expire_at <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, *, ttl: float | None = None) -> None:
+        if self.ttl <= 0 and ttl is None:
+            return
+
+        expire_at = time.monotonic() + (self.ttl if ttl is None else float(ttl))
+        self._data[key] = (expire_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
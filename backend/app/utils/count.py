@@ -0,0 +1,111 @@
+"""
+列表总数统计策略。
+
+说明：
+- 日志等大表上每次翻页都执行 COUNT(*) 代价很高，这里提供“近似总数”模式：
+  - 无过滤条件且为 PostgreSQL：读取 pg_class.reltuples 统计估算值（不扫表；分区表为各分区之和）；
+  - 有过滤条件：在数据库内最多统计 COUNT_EXACT_MAX 行
+    （SELECT count(*) FROM (... LIMIT n+1) t），超过时返回上限并标记为近似（前端显示为 "10000+"）；
+  - 统计结果按查询语句缓存 COUNT_CACHE_TTL_SECONDS 秒，连续翻页不重复统计。
+- 近似模式仅建议用于日志类只增不改、允许总数有偏差的表；普通列表仍使用精确总数。
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pypika_tortoise.functions import Count
+from pypika_tortoise.terms import Star
+from tortoise.expressions import Subquery
+from tortoise.queryset import QuerySet
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 查询语句 -> (总数, 是否近似)
+_count_cache = TTLCache(maxsize=2048, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+
+# 分区表（relkind = 'p'）本身没有数据，reltuples 恒为 0/-1，需汇总各分区的估算值；
+# 从未 ANALYZE 的表/分区 reltuples 为 -1，不参与汇总
+_ESTIMATE_SQL = """
+SELECT CASE
+    WHEN c.relkind = 'p' THEN (
+        SELECT sum(ch.reltuples)::bigint
+        FROM pg_inherits i
+        JOIN pg_class ch ON ch.oid = i.inhrelid
+        WHERE i.inhparent = c.oid AND ch.reltuples >= 0
+    )
+    ELSE c.reltuples::bigint
+END AS estimate
+FROM pg_class c
+WHERE c.oid = $1::regclass
+"""
+
+
+async def _estimate_table_rows(qs: QuerySet[Any]) -> int | None:
+    """PostgreSQL 表行数估算值（无法估算或表/分区从未 ANALYZE 时返回 None）。"""
+
+    db = qs.model._meta.db
+    if db.capabilities.dialect != "postgres":
+        return None
+
+    try:
+        rows = await db.execute_query_dict(_ESTIMATE_SQL, [qs.model._meta.db_table])
+    except Exception:  # noqa: BLE001 - 估算失败回退为精确统计
+        logger.warning("读取表行数估算值失败：%s", qs.model._meta.db_table, exc_info=True)
+        return None
+
+    estimate = rows[0]["estimate"] if rows else None
+    if estimate is None or int(estimate) < 0:
+        return None
+    return int(estimate)
+
+
+async def _count_capped(qs: QuerySet[Any], cap: int) -> tuple[int, bool]:
+    """最多统计 cap 行：超过时返回 (cap, True)。计数在数据库内完成，不把主键取回应用。"""
+
+    if cap <= 0:
+        return await qs.count(), False
+
+    db = qs.model._meta.db
+    limited = Subquery(qs.limit(cap + 1).values_list("id", flat=True)).as_("t")
+    query = db.query_class.from_(limited).select(Count(Star()).as_("cnt"))
+    rows = await db.execute_query_dict(*query.get_parameterized_sql())
+    total = int(rows[0]["cnt"]) if rows else 0
+    if total > cap:
+        return cap, True
+    return total, False
+
+
+async def count_rows(qs: QuerySet[Any], *, approximate: bool = False) -> tuple[int, bool]:
+    """
+    统计查询结果总数，返回 (总数, 是否近似)。
+
+    参数：
+    - approximate：False 时始终精确统计；True 时按模块说明使用估算/上限/缓存。
+    """
+
+    if not approximate:
+        return await qs.count(), False
+
+    key = qs.sql(params_inline=True)
+    cached = _count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result: tuple[int, bool] | None = None
+    min_rows = int(settings.COUNT_ESTIMATE_MIN_ROWS)
+    if not qs._q_objects:
+        estimate = await _estimate_table_rows(qs)
+        # 小表估算值误差相对更大，且精确统计本身很快
+        if estimate is not None and estimate >= min_rows:
+            result = (estimate, True)
+
+    if result is None:
+        result = await _count_capped(qs, int(settings.COUNT_EXACT_MAX))
+
+    _count_cache.set(key, result)
+    return result
@@ -4,19 +4,33 @@ Excel 导入/导出通用工具。
 说明：
 - 当前统一使用 xlsx（Office Open XML）格式。
 - 该模块只负责“读写 Excel”，不耦合具体业务（用户/字典等）。
+- 大数据量导出使用 stream_xlsx：write_only 模式逐批写入临时文件（spooled），全部生成后
+  再分块输出；内存占用不随行数增长，但首字节时间随导出规模增长。
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import contextlib
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 from datetime import date, datetime
 from io import BytesIO
 from typing import Any
+from urllib.parse import quote
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 流式导出时每次输出的字节数
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -77,6 +91,17 @@ def _auto_width(columns: list[ExcelColumn], rows: list[dict[str, Any]]) -> list[
     return widths
 
 
+def _format_value(col: ExcelColumn, row: dict[str, Any]) -> Any:
+    v = row.get(col.key)
+    if col.formatter:
+        try:
+            v = col.formatter(v)
+        except Exception:
+            # 格式化失败不应导致整个导出失败，兜底使用原值
+            pass
+    return _to_cell_value(v)
+
+
 def _write_sheet(
     ws,
     *,
@@ -99,14 +124,7 @@ def _write_sheet(
     # 数据
     for row_idx, row in enumerate(rows, start=2):
         for col_idx, col in enumerate(columns, start=1):
-            v = row.get(col.key)
-            if col.formatter:
-                try:
-                    v = col.formatter(v)
-                except Exception:
-                    # 格式化失败不应导致整个导出失败，兜底使用原值
-                    pass
-            ws.cell(row=row_idx, column=col_idx, value=_to_cell_value(v))
+            ws.cell(row=row_idx, column=col_idx, value=_format_value(col, row))
 
     # 列宽
     widths = _auto_width(columns, rows)
@@ -140,6 +158,126 @@ def export_xlsx_bytes(
     return buf.getvalue()
 
 
+def _append_rows(ws, columns: list[ExcelColumn], rows: list[dict[str, Any]]) -> None:
+    for row in rows:
+        ws.append([_format_value(col, row) for col in columns])
+
+
+async def stream_xlsx(
+    *,
+    sheet_name: str,
+    columns: list[ExcelColumn],
+    batches: AsyncIterable[list[dict[str, Any]]],
+) -> AsyncIterator[bytes]:
+    """
+    先落盘再分块输出 xlsx（spooled，用于 StreamingResponse）。
+
+    - batches：按批产出的行数据（每行一个 dict，key 与 ExcelColumn.key 对应），
+      通常来自 keyset 分批查询
+
+    说明：
+    - 使用 openpyxl write_only 模式，行数据写入后即落到临时文件，内存只保留当前一批；
+    - 列宽根据第一批数据估算；
+    - xlsx 是 zip 格式，需在全部行写完后才能生成文件：整个工作簿先写入临时文件，之后才输出
+      第一个 64KB 分块。因此这不是增量流式输出，首字节时间随导出行数增长；
+    - 生成器被取消或提前关闭（客户端断开，见 xlsx_stream_response）时停止读取后续批次，
+      并删除 openpyxl 的工作表临时文件与打包用的临时文件；
+    - openpyxl 的写入/保存是同步 CPU 操作，放到线程池执行，避免阻塞事件循环。
+    """
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_name[:31] if sheet_name else "Sheet1")
+
+    header_font = Font(bold=True)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    total = 0
+    started = False
+    saved = False
+
+    def start_sheet(sample_rows: list[dict[str, Any]]) -> None:
+        # write_only 模式下列宽、冻结窗格必须在写入第一行之前设置
+        for i, w in enumerate(_auto_width(columns, sample_rows), start=1):
+            ws.column_dimensions[get_column_letter(i)].width = float(w)
+        ws.freeze_panes = "A2"
+
+        header: list[WriteOnlyCell] = []
+        for col in columns:
+            cell = WriteOnlyCell(ws, value=col.title)
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header.append(cell)
+        ws.append(header)
+
+    try:
+        async for rows in batches:
+            if not started:
+                start_sheet(rows)
+                started = True
+            if rows:
+                await run_in_threadpool(_append_rows, ws, columns, rows)
+                total += len(rows)
+
+        if not started:
+            start_sheet([])
+
+        if columns:
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{max(1, total + 1)}"
+
+        with tempfile.TemporaryFile() as tmp:
+            await run_in_threadpool(wb.save, tmp)
+            saved = True
+            tmp.seek(0)
+            while True:
+                chunk = await run_in_threadpool(tmp.read, _STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        # 中途退出：关闭分批查询，并删除 write_only 工作表的临时文件（正常保存时由 openpyxl 删除）
+        aclose = getattr(batches, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        if not saved:
+            _discard_write_only_sheet(ws)
+
+
+def _discard_write_only_sheet(ws) -> None:
+    writer = getattr(ws, "_writer", None)
+    if writer is None:
+        return
+    # 先结束行生成器再关闭写入器，顺序与 WriteOnlyWorksheet.close() 一致
+    with contextlib.suppress(Exception):
+        if ws._rows is not None:
+            ws._rows.close()
+        writer.close()
+    with contextlib.suppress(OSError, ValueError):
+        writer.cleanup()
+
+
+class _SpooledXlsxResponse(StreamingResponse):
+    """响应结束（含客户端断开导致的取消）后立即关闭 body 生成器，及时释放临时文件与查询。"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+def xlsx_stream_response(content: AsyncIterable[bytes], filename: str) -> StreamingResponse:
+    """
+    将 stream_xlsx 的输出包装为下载响应（分块传输）。
+
+    说明：客户端断开时 Starlette 会取消输出任务，生成器随之停止读取批次；
+    若此时生成器停在 yield 处，由本响应在结束时显式关闭，不等待垃圾回收。
+    """
+
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    return _SpooledXlsxResponse(content, media_type=XLSX_MEDIA_TYPE, headers=headers)
+
+
 def append_sheet(
     wb: Workbook,
     *,
@@ -153,48 +291,84 @@ def append_sheet(
     _write_sheet(ws, columns=columns, rows=rows)
 
 
-def parse_xlsx_rows(
-    *,
-    content: bytes,
-    columns: list[ExcelColumn],
-    sheet_name: str | None = None,
-) -> tuple[list[tuple[int, dict[str, Any]]], list[ExcelImportError]]:
+class ExcelRowReader:
     """
-    解析 xlsx，返回（行号, 行数据）列表 + 错误列表。
+    逐行解析 xlsx（只读模式 + 生成器，按需读取）。
 
     约定：
-    - 第一行必须为表头
+    - 第一行必须为表头（创建时即校验必填列，缺失则抛 ValueError）
     - 允许 Excel 额外列存在（不参与解析）
-    """
 
-    wb = load_workbook(BytesIO(content), data_only=True)
-    ws = wb[sheet_name] if sheet_name else wb.active
+    用法：
+        with ExcelRowReader(content=..., columns=...) as reader:
+            for row_idx, row_data in reader:
+                ...
+            errors = reader.errors  # 已迭代行的解析错误
 
-    errors: list[ExcelImportError] = []
+    说明：
+    - 基于 openpyxl read_only + iter_rows(values_only=True) 顺序读取，不会把整张表加载进内存；
+    - 某行存在错误时仍会产出该行（缺失出错列的 key），调用方可按 errors 中的行号跳过。
+    """
 
-    header_row = [c.value for c in ws[1]]
-    header_titles = [str(v).strip() if v is not None else "" for v in header_row]
-    title_to_index: dict[str, int] = {}
-    for idx, title in enumerate(header_titles):
-        if not title:
-            continue
-        title_to_index[title] = idx
-
-    # 校验必须字段是否存在
-    missing = [c.title for c in columns if c.required and c.title not in title_to_index]
-    if missing:
-        raise ValueError(f"缺少必填列：{', '.join(missing)}")
-
-    parsed: list[tuple[int, dict[str, Any]]] = []
-    for row_idx in range(2, ws.max_row + 1):
-        values = [c.value for c in ws[row_idx]]
-        # 空行直接跳过
-        if all(v is None or (isinstance(v, str) and not v.strip()) for v in values):
-            continue
+    def __init__(
+        self,
+        *,
+        content: bytes,
+        columns: list[ExcelColumn],
+        sheet_name: str | None = None,
+    ) -> None:
+        self.columns = columns
+        self.errors: list[ExcelImportError] = []
+
+        self._wb = load_workbook(BytesIO(content), read_only=True, data_only=True)
+        try:
+            self._ws = self._wb[sheet_name] if sheet_name else self._wb.active
+            self._rows = self._ws.iter_rows(values_only=True)
+
+            header_row = next(self._rows, None) or ()
+            self._title_to_index: dict[str, int] = {}
+            for idx, v in enumerate(header_row):
+                title = str(v).strip() if v is not None else ""
+                if title:
+                    self._title_to_index[title] = idx
+
+            # 校验必须字段是否存在
+            missing = [
+                c.title for c in columns if c.required and c.title not in self._title_to_index
+            ]
+            if missing:
+                raise ValueError(f"缺少必填列：{', '.join(missing)}")
+        except Exception:
+            self._wb.close()
+            raise
+
+    def __enter__(self) -> ExcelRowReader:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._wb.close()
+
+    @property
+    def estimated_rows(self) -> int | None:
+        """按工作表 dimension 估算的数据行数（不含表头，文件未记录 dimension 时为 None）。"""
+
+        max_row = self._ws.max_row
+        return max(0, int(max_row) - 1) if max_row else None
+
+    def __iter__(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        for row_idx, values in enumerate(self._rows, start=2):
+            # 空行直接跳过
+            if all(v is None or (isinstance(v, str) and not v.strip()) for v in values):
+                continue
+            yield row_idx, self._parse_row(row_idx, values)
 
+    def _parse_row(self, row_idx: int, values: tuple[Any, ...]) -> dict[str, Any]:
         row_data: dict[str, Any] = {}
-        for col in columns:
-            col_index = title_to_index.get(col.title)
+        for col in self.columns:
+            col_index = self._title_to_index.get(col.title)
             if col_index is None:
                 # 非必填列缺失时，按 None 处理
                 row_data[col.key] = None
@@ -205,14 +379,16 @@ def parse_xlsx_rows(
                 cell_val = cell_val.strip()
 
             if col.required and (cell_val is None or cell_val == ""):
-                errors.append(ExcelImportError(row=row_idx, column=col.title, message="不能为空"))
+                self.errors.append(
+                    ExcelImportError(row=row_idx, column=col.title, message="不能为空"),
+                )
                 continue
 
             if col.parser and cell_val not in (None, ""):
                 try:
                     cell_val = col.parser(cell_val)
                 except Exception as exc:  # noqa: BLE001 - 需要兜底记录错误
-                    errors.append(
+                    self.errors.append(
                         ExcelImportError(
                             row=row_idx,
                             column=col.title,
@@ -223,6 +399,21 @@ def parse_xlsx_rows(
 
             row_data[col.key] = cell_val
 
-        parsed.append((row_idx, row_data))
+        return row_data
+
+
+def parse_xlsx_rows(
+    *,
+    content: bytes,
+    columns: list[ExcelColumn],
+    sheet_name: str | None = None,
+) -> tuple[list[tuple[int, dict[str, Any]]], list[ExcelImportError]]:
+    """
+    解析 xlsx，返回（行号, 行数据）列表 + 错误列表。
+
+    说明：一次性返回全部行；大文件请直接使用 ExcelRowReader 逐行处理。
+    """
 
-    return parsed, errors
+    with ExcelRowReader(content=content, columns=columns, sheet_name=sheet_name) as reader:
+        parsed = list(reader)
+        return parsed, reader.errors
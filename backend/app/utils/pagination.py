@@ -0,0 +1,180 @@
+"""
+分页/遍历工具。
+
+说明：
+- 大批量遍历（导出、归档等）使用按主键的 keyset 分批读取，
+  避免 OFFSET 越往后越慢，也避免一次性加载全部数据。
+- 列表接口统一使用 paginate()：默认 page/pageSize（OFFSET + 总数），
+  传入 cursor 时切换为游标模式（keyset，不统计总数）。
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from tortoise.expressions import Q
+from tortoise.fields import DatetimeField
+from tortoise.queryset import QuerySet
+
+from app.utils.count import count_rows
+
+# 列表接口 cursor 参数说明（用于 Query(description=...)）
+CURSOR_QUERY_DESCRIPTION = "游标分页：首页传空字符串，之后传上一页返回的 nextCursor（不返回 total）"
+
+
+async def iter_by_keyset(
+    qs: QuerySet[Any],
+    *,
+    batch_size: int = 1000,
+    limit: int | None = None,
+    descending: bool = True,
+) -> AsyncIterator[list[Any]]:
+    """
+    按主键 keyset 分批遍历查询结果（每批一次查询）。
+
+    参数：
+    - qs：已带好过滤条件的 QuerySet（不要包含 order_by/offset/limit）
+    - batch_size：每批条数
+    - limit：最多返回的总条数（None 表示不限制）
+    - descending：是否按主键倒序（默认倒序，与列表页一致）
+    """
+
+    batch_size = max(1, int(batch_size))
+    last_id: Any = None
+    remaining = limit
+
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        page_qs = qs
+        if last_id is not None:
+            key_filter = {"id__lt": last_id} if descending else {"id__gt": last_id}
+            page_qs = page_qs.filter(**key_filter)
+        records = await page_qs.order_by("-id" if descending else "id").limit(size)
+        if not records:
+            return
+
+        yield records
+
+        last_id = records[-1].pk
+        if remaining is not None:
+            remaining -= len(records)
+        if len(records) < size:
+            return
+
+
+def _to_utc(value: datetime) -> datetime:
+    """
+    带时区的时间统一转换为 UTC（不带时区的保持原样）。
+
+    说明：Tortoise 以 UTC 写入时间，SQLite 按文本（isoformat）存储和比较，
+    游标中的时间必须与库中格式一致（同为 +00:00），否则比较结果错误、翻页不前进。
+    """
+
+    return value.astimezone(UTC) if value.tzinfo is not None else value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """将排序键的值编码为不透明的游标字符串（时间统一为 UTC）。"""
+
+    payload = [_to_utc(v).isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, qs: QuerySet[Any], ordering: Sequence[str]) -> list[Any]:
+    """解析游标字符串为排序键的值（格式不合法时抛 ValueError）。"""
+
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("无效的分页游标") from exc
+
+    if not isinstance(payload, list) or len(payload) != len(ordering):
+        raise ValueError("无效的分页游标")
+
+    fields_map = qs.model._meta.fields_map
+    values: list[Any] = []
+    for item, order in zip(payload, ordering, strict=True):
+        field = fields_map[order.lstrip("-")]
+        if isinstance(field, DatetimeField):
+            if not isinstance(item, str):
+                raise ValueError("无效的分页游标")
+            try:
+                values.append(_to_utc(datetime.fromisoformat(item)))
+            except ValueError as exc:
+                raise ValueError("无效的分页游标") from exc
+        elif isinstance(item, int) and not isinstance(item, bool):
+            values.append(item)
+        else:
+            raise ValueError("无效的分页游标")
+    return values
+
+
+def _after_cursor_q(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    生成“排在游标之后”的条件。
+
+    例：ordering=(-created_at, -id) 时为
+    created_at < v1 OR (created_at = v1 AND id < v2)
+    """
+
+    branches: list[Q] = []
+    for idx, order in enumerate(ordering):
+        name = order.lstrip("-")
+        op = "lt" if order.startswith("-") else "gt"
+        cond = {ordering[i].lstrip("-"): values[i] for i in range(idx)}
+        cond[f"{name}__{op}"] = values[idx]
+        branches.append(Q(**cond))
+    return Q(*branches, join_type="OR")
+
+
+async def paginate(
+    qs: QuerySet[Any],
+    *,
+    page: int,
+    page_size: int,
+    cursor: str | None = None,
+    ordering: Sequence[str] = ("-id",),
+    approximate_count: bool = False,
+) -> tuple[list[Any], dict[str, Any]]:
+    """
+    列表分页（页码模式 / 游标模式）。
+
+    参数：
+    - ordering：排序键，最后一个字段必须唯一（如 ("-id",) 或 ("-created_at", "-id")）
+    - cursor：None 表示页码模式；传入时（首页为空字符串）使用游标模式
+    - approximate_count：页码模式下允许近似总数（见 app.utils.count，适用于日志等大表）
+
+    返回：
+    - (当前页记录, 分页信息)；分页信息在页码模式为 {"total": n, "approximate": bool}，
+      游标模式为 {"nextCursor": str | None}，直接合并到响应即可。
+    """
+
+    if cursor is None:
+        total, approximate = await count_rows(qs, approximate=approximate_count)
+        records = await qs.order_by(*ordering).offset((page - 1) * page_size).limit(page_size)
+        return records, {"total": total, "approximate": approximate}
+
+    page_qs = qs
+    if cursor:
+        try:
+            values = decode_cursor(cursor, qs, ordering)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        page_qs = page_qs.filter(_after_cursor_q(ordering, values))
+
+    # 多取一条用于判断是否还有下一页
+    records = list(await page_qs.order_by(*ordering).limit(page_size + 1))
+    next_cursor = None
+    if len(records) > page_size:
+        records = records[:page_size]
+        last = records[-1]
+        next_cursor = encode_cursor([getattr(last, o.lstrip("-")) for o in ordering])
+    return records, {"nextCursor": next_cursor}
@@ -0,0 +1,257 @@
+"""
+WebSocket 广播总线（多 worker/多实例扇出）。
+
+说明：
+- 推送方只向总线发布消息，每个 worker 都订阅同一频道，收到后投递给本进程内的连接；
+- local：进程内实现，适用于单进程部署；多个管理器共享同一实例时即可模拟多 worker（测试用）；
+- redis：Redis Pub/Sub，所有 worker/实例共享；
+- 每个频道的消息带递增序号 seq（redis 下由 INCR 全局分配），接收方据此统计丢失/乱序，
+  客户端也可据此发现漏收的事件；Pub/Sub 不保证送达，断线期间的消息不会补发；
+- 各 worker 定期通过 report() 上报连接指标，reports() 汇总（用于监控接口）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.utils.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# 订阅回调：(频道, 消息)；消息格式为 {"seq": int, "origin": str, "payload": dict}
+BrokerHandler = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+# 当前进程标识（用于日志/统计区分消息来源）
+INSTANCE_ID = f"{os.getpid()}-{uuid4().hex[:8]}"
+
+# Redis 订阅断开后的重连间隔（秒）
+_RECONNECT_SECONDS = 1.0
+
+
+class _SeqTracker:
+    """按频道记录最近收到的序号，统计丢失与乱序。"""
+
+    def __init__(self) -> None:
+        self.last_seq: dict[str, int] = {}
+        self.received = 0
+        self.gaps = 0
+        self.reordered = 0
+
+    def observe(self, channel: str, seq: int) -> None:
+        self.received += 1
+        last = self.last_seq.get(channel)
+        if last is not None:
+            if seq > last + 1:
+                self.gaps += seq - last - 1
+            elif seq <= last:
+                self.reordered += 1
+                return
+        self.last_seq[channel] = seq
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "received": self.received,
+            "gaps": self.gaps,
+            "reordered": self.reordered,
+            "lastSeq": dict(self.last_seq),
+        }
+
+
+class LocalBroker:
+    """进程内广播总线。"""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[BrokerHandler]] = defaultdict(list)
+        self._seq: dict[str, itertools.count] = defaultdict(lambda: itertools.count(1))
+        self._tracker = _SeqTracker()
+        self._reports: dict[str, dict[str, Any]] = {}
+        self.published = 0
+
+    async def publish(self, channel: str, payload: dict[str, Any]) -> int:
+        """发布消息，返回该消息的序号。"""
+
+        seq = next(self._seq[channel])
+        message = {"seq": seq, "origin": INSTANCE_ID, "payload": payload}
+        self.published += 1
+        self._tracker.observe(channel, seq)
+        for handler in list(self._handlers.get(channel, ())):
+            try:
+                await handler(channel, message)
+            except Exception:
+                logger.exception("WebSocket 广播消息处理失败：%s", channel)
+        return seq
+
+    async def subscribe(self, channel: str, handler: BrokerHandler) -> None:
+        self._handlers[channel].append(handler)
+
+    async def unsubscribe(self, channel: str, handler: BrokerHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    async def report(self, instance: str, stats: dict[str, Any], *, ttl: float) -> None:
+        self._reports[instance] = stats
+
+    async def reports(self) -> dict[str, dict[str, Any]]:
+        return dict(self._reports)
+
+    async def close(self) -> None:
+        self._handlers.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "local", "published": self.published, **self._tracker.stats()}
+
+
+class RedisBroker:
+    """
+    Redis Pub/Sub 广播总线。
+
+    Key/频道约定（prefix 默认 `ws`）：
+    - {prefix}:ch:{channel}   Pub/Sub 频道
+    - {prefix}:seq:{channel}  频道序号计数器（INCR）
+    - {prefix}:worker:{id}    各 worker 上报的指标（JSON，带过期时间）
+
+    说明：
+    - 每个进程一个订阅连接（后台任务），断开后自动重连并重新订阅；
+    - client 只依赖 redis.asyncio 的通用命令，测试时可直接传入 fakeredis 客户端。
+    """
+
+    def __init__(self, client: Redis, *, prefix: str = "ws") -> None:
+        self._client = client
+        self._prefix = prefix
+        self._handlers: dict[str, list[BrokerHandler]] = defaultdict(list)
+        self._tracker = _SeqTracker()
+        self._listener: asyncio.Task | None = None
+        self._resubscribe = asyncio.Event()
+        self.published = 0
+        self.reconnects = 0
+
+    def _channel_key(self, channel: str) -> str:
+        return f"{self._prefix}:ch:{channel}"
+
+    def _seq_key(self, channel: str) -> str:
+        return f"{self._prefix}:seq:{channel}"
+
+    def _worker_key(self, instance: str) -> str:
+        return f"{self._prefix}:worker:{instance}"
+
+    async def publish(self, channel: str, payload: dict[str, Any]) -> int:
+        seq = int(await self._client.incr(self._seq_key(channel)))
+        message = {"seq": seq, "origin": INSTANCE_ID, "payload": payload}
+        await self._client.publish(
+            self._channel_key(channel),
+            json.dumps(message, ensure_ascii=False, separators=(",", ":")),
+        )
+        self.published += 1
+        return seq
+
+    async def report(self, instance: str, stats: dict[str, Any], *, ttl: float) -> None:
+        await self._client.set(
+            self._worker_key(instance),
+            json.dumps(stats, ensure_ascii=False, separators=(",", ":")),
+            ex=max(1, int(ttl)),
+        )
+
+    async def reports(self) -> dict[str, dict[str, Any]]:
+        prefix = self._worker_key("")
+        keys = [key async for key in self._client.scan_iter(match=f"{prefix}*")]
+        if not keys:
+            return {}
+        result: dict[str, dict[str, Any]] = {}
+        for key, raw in zip(keys, await self._client.mget(keys), strict=True):
+            if raw:
+                with contextlib.suppress(ValueError):
+                    result[str(key).removeprefix(prefix)] = json.loads(raw)
+        return result
+
+    async def subscribe(self, channel: str, handler: BrokerHandler) -> None:
+        self._handlers[channel].append(handler)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        else:
+            self._resubscribe.set()
+
+    async def unsubscribe(self, channel: str, handler: BrokerHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+        if handlers is not None and not handlers:
+            self._handlers.pop(channel, None)
+            self._resubscribe.set()
+
+    async def _listen(self) -> None:
+        prefix = f"{self._prefix}:ch:"
+        while self._handlers:
+            pubsub = self._client.pubsub()
+            try:
+                self._resubscribe.clear()
+                await pubsub.subscribe(*[self._channel_key(c) for c in self._handlers])
+                while not self._resubscribe.is_set():
+                    item = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if item is None or item.get("type") != "message":
+                        continue
+                    channel = str(item["channel"]).removeprefix(prefix)
+                    try:
+                        message = json.loads(item["data"])
+                        self._tracker.observe(channel, int(message["seq"]))
+                    except (KeyError, TypeError, ValueError):
+                        logger.warning("忽略无法解析的 WebSocket 广播消息：%s", channel)
+                        continue
+                    for handler in list(self._handlers.get(channel, ())):
+                        try:
+                            await handler(channel, message)
+                        except Exception:
+                            logger.exception("WebSocket 广播消息处理失败：%s", channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("WebSocket 广播订阅断开，稍后重连", exc_info=True)
+                self.reconnects += 1
+                await asyncio.sleep(_RECONNECT_SECONDS)
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+    async def close(self) -> None:
+        self._handlers.clear()
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "redis",
+            "published": self.published,
+            "reconnects": self.reconnects,
+            **self._tracker.stats(),
+        }
+
+
+WsBroker = LocalBroker | RedisBroker
+
+
+def build_ws_broker() -> WsBroker:
+    """根据配置 WS_BROKER 创建广播总线。"""
+
+    backend = (settings.WS_BROKER or "local").strip().lower()
+    if backend == "redis":
+        client = get_redis()
+        if client is None:
+            raise RuntimeError("WS_BROKER=redis 需要配置 REDIS_URL。")
+        return RedisBroker(client)
+
+    return LocalBroker()
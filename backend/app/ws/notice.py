@@ -1,12 +1,98 @@
-"""消息通知 WebSocket 管理器（开发期单进程实现）。"""
+"""消息通知 WebSocket 管理器。"""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import logging
 import time
-from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
+
+from app.core.config import settings
+from app.ws.broker import INSTANCE_ID, WsBroker, build_ws_broker
+from app.ws.registry import ConnectionRegistry
+
+logger = logging.getLogger(__name__)
+
+# 广播总线上的频道名
+NOTICE_CHANNEL = "notice"
+
+# 单次发送的超时时间（秒）：超时视为连接异常并断开
+_SEND_TIMEOUT_SECONDS = 10.0
+# 发送关闭帧的超时时间（秒）：对端不读数据时关闭也可能阻塞，超时后直接放弃
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+class WsConnection:
+    """
+    单个 WebSocket 连接及其发送队列。
+
+    说明：
+    - 事件先放入有界队列，由该连接独立的写任务逐条发送，慢客户端不会阻塞其他连接；
+    - 队列已满（客户端消费过慢）时由管理器立即注销该连接，并在后台关闭（慢消费者剔除）；
+    - last_seen 为最近一次收到客户端消息的时间（单调时钟），用于空闲清理；
+    - expires_at 为会话过期时间，到期后由心跳任务断开。
+    """
+
+    def __init__(
+        self,
+        username: str,
+        jti: str,
+        websocket: WebSocket,
+        *,
+        queue_size: int,
+        expires_at: datetime | None = None,
+    ) -> None:
+        self.username = username
+        self.jti = jti
+        self.websocket = websocket
+        self.expires_at = expires_at
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max(1, int(queue_size)))
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self._writer: asyncio.Task | None = None
+
+    def touch(self) -> None:
+        """记录一次客户端活跃（收到任意消息）。"""
+
+        self.last_seen = time.monotonic()
+
+    def start(self, on_error: Callable[[WsConnection], Awaitable[None]]) -> None:
+        self._writer = asyncio.create_task(self._write_loop(on_error))
+
+    async def _write_loop(self, on_error: Callable[[WsConnection], Awaitable[None]]) -> None:
+        while True:
+            text = await self.queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(text), _SEND_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 发送失败/超时通常意味着连接已断开或网络拥塞，断开并移除该连接
+                await on_error(self)
+                return
+
+    async def close(self, code: int, reason: str = "") -> None:
+        """停止写任务并关闭连接（可重复调用；发送关闭帧最多等待 _CLOSE_TIMEOUT_SECONDS）。"""
+
+        if self.closed:
+            return
+        self.closed = True
+        writer = self._writer
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writer
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                self.websocket.close(code=code, reason=reason),
+                _CLOSE_TIMEOUT_SECONDS,
+            )
 
 
 class NoticeWsManager:
@@ -14,74 +100,243 @@ class NoticeWsManager:
     WebSocket 连接管理器。
 
     说明：
-    - 当前实现为内存态，适用于单进程/单实例部署。
-    - 如果未来需要多实例扩展，可改造为 Redis PubSub / MQ 广播。
+    - 连接注册表为内存态，只包含本进程内的连接（见 ConnectionRegistry，无锁、写时复制）；
+    - send_to_* / broadcast_* 不直接发送，而是发布到广播总线（见 app.ws.broker），
+      每个 worker 收到后只投递给本进程内的目标连接，因此多 worker/多实例下同样可达；
+    - 推送给客户端的事件带 seq（频道内递增序号），客户端可据此发现漏收的事件；
+    - 投递时事件只序列化一次，然后放入各连接的发送队列即返回（见 WsConnection）；
+    - 后台心跳任务定期向每个连接发送 ping 事件（客户端回复任意消息即视为活跃），
+      并断开空闲超时与会话已过期的连接，同时把本 worker 的指标上报到广播总线。
     """
 
-    def __init__(self) -> None:
-        # username -> jti -> websockets
-        self._connections: dict[str, dict[str, set[WebSocket]]] = defaultdict(
-            lambda: defaultdict(set),
+    def __init__(self, broker: WsBroker | None = None, *, queue_size: int | None = None) -> None:
+        self._registry = ConnectionRegistry()
+        self._broker = broker
+        self._subscribed = False
+        self._queue_size = queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.enqueued = 0
+        self.evicted = 0
+        self.send_errors = 0
+        self.pings = 0
+        self.idle_reaped = 0
+        self.expired = 0
+        self._heartbeat: asyncio.Task | None = None
+        # 后台关闭中的连接（慢消费者剔除），保留引用避免任务被回收
+        self._closing: set[asyncio.Task] = set()
+
+    @property
+    def broker(self) -> WsBroker:
+        if self._broker is None:
+            self._broker = build_ws_broker()
+        return self._broker
+
+    async def start(self) -> None:
+        """订阅广播总线（应用启动时调用）。"""
+
+        if not self._subscribed:
+            await self.broker.subscribe(NOTICE_CHANNEL, self._on_message)
+            self._subscribed = True
+        if self._heartbeat is None and settings.WS_HEARTBEAT_INTERVAL_SECONDS > 0:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self) -> None:
+        """停止心跳、取消订阅并关闭广播总线（应用关闭时调用）。"""
+
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat
+            self._heartbeat = None
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        if self._subscribed:
+            await self.broker.unsubscribe(NOTICE_CHANNEL, self._on_message)
+            self._subscribed = False
+        if self._broker is not None:
+            await self._broker.close()
+
+    async def connect(
+        self,
+        username: str,
+        jti: str,
+        websocket: WebSocket,
+        *,
+        expires_at: datetime | None = None,
+    ) -> WsConnection:
+        conn = WsConnection(
+            username,
+            jti,
+            websocket,
+            queue_size=self._queue_size,
+            expires_at=expires_at,
         )
-        self._lock = asyncio.Lock()
+        self._registry.add(conn)
+        conn.start(self._on_send_error)
+        return conn
 
-    async def connect(self, username: str, jti: str, websocket: WebSocket) -> None:
-        async with self._lock:
-            self._connections[username][jti].add(websocket)
+    async def disconnect(self, conn: WsConnection) -> None:
+        await self._drop(conn, status.WS_1000_NORMAL_CLOSURE)
 
-    async def disconnect(self, username: str, jti: str, websocket: WebSocket) -> None:
-        async with self._lock:
-            user_conns = self._connections.get(username)
-            if not user_conns:
-                return
-            conns = user_conns.get(jti)
-            if not conns:
-                return
-            conns.discard(websocket)
-            if not conns:
-                user_conns.pop(jti, None)
-            if not user_conns:
-                self._connections.pop(username, None)
+    async def _drop(self, conn: WsConnection, code: int, reason: str = "") -> None:
+        self._registry.remove(conn)
+        await conn.close(code, reason)
 
-    async def send_to_user(self, username: str, event: dict) -> None:
-        async with self._lock:
-            user_conns = self._connections.get(username, {})
-            targets: list[WebSocket] = []
-            for conns in user_conns.values():
-                targets.extend(list(conns))
+    async def _on_send_error(self, conn: WsConnection) -> None:
+        self.send_errors += 1
+        await self._drop(conn, status.WS_1011_INTERNAL_ERROR)
 
-        if not targets:
+    def _evict(self, conn: WsConnection) -> None:
+        """
+        剔除慢消费者：发送队列已满，断开后客户端可重连并重新拉取未读消息。
+
+        说明：立即从注册表注销（后续事件不再投递），关闭连接放到后台任务执行，
+        不阻塞当前的投递（LocalBroker 下投递在 send_* 调用方的协程中执行）。
+        """
+
+        if not self._registry.remove(conn):
             return
+        self.evicted += 1
+        logger.warning("WebSocket 客户端消费过慢，已断开：%s", conn.username)
+        task = asyncio.create_task(conn.close(status.WS_1013_TRY_AGAIN_LATER))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
-        for ws in targets:
+    async def _heartbeat_loop(self) -> None:
+        interval = max(1.0, float(settings.WS_HEARTBEAT_INTERVAL_SECONDS))
+        while True:
+            await asyncio.sleep(interval)
             try:
-                await ws.send_json(event)
+                await self.heartbeat()
+                await self.broker.report(INSTANCE_ID, self.stats(), ttl=interval * 3)
             except Exception:
-                # 发送失败通常意味着连接已断开，交由 websocket 断开流程清理
-                continue
+                logger.exception("WebSocket 心跳检查失败")
+
+    async def heartbeat(self) -> None:
+        """
+        执行一轮心跳（由后台任务定期调用）。
+
+        说明：
+        - 会话已过期：发送关闭帧（1008），前端收到 1008 后不再自动重连（token 更新后重新连接）；
+        - 超过 WS_IDLE_TIMEOUT_SECONDS 未收到客户端消息：视为半开连接，断开（1001）；
+        - 其他连接发送 ping 事件；发送队列已满时按慢消费者剔除。
+        """
+
+        now = datetime.now(UTC)
+        idle_before = time.monotonic() - settings.WS_IDLE_TIMEOUT_SECONDS
+        ping = json.dumps(self.build_event("ping"), separators=(",", ":"), ensure_ascii=False)
+
+        for conns in self._registry.users().values():
+            for conn in conns:
+                if conn.closed:
+                    continue
+                if conn.expires_at is not None and conn.expires_at <= now:
+                    self.expired += 1
+                    await self._drop(conn, status.WS_1008_POLICY_VIOLATION, "登录已过期")
+                elif settings.WS_IDLE_TIMEOUT_SECONDS > 0 and conn.last_seen < idle_before:
+                    self.idle_reaped += 1
+                    await self._drop(conn, status.WS_1001_GOING_AWAY, "连接空闲超时")
+                else:
+                    try:
+                        conn.queue.put_nowait(ping)
+                        self.pings += 1
+                    except asyncio.QueueFull:
+                        self._evict(conn)
+
+    async def send_to_user(self, username: str, event: dict) -> None:
+        await self.broadcast_users([username], event)
 
     async def send_to_session(self, username: str, jti: str, event: dict) -> None:
         """仅向指定会话（同一 token 的多标签页）推送事件。"""
 
-        async with self._lock:
-            targets = list(self._connections.get(username, {}).get(jti, set()))
+        await self.broadcast_sessions([(username, jti)], event)
+
+    async def broadcast_users(self, usernames: list[str], event: dict) -> None:
+        if usernames:
+            await self._publish({"users": list(usernames), "event": event})
+
+    async def broadcast_sessions(self, sessions: list[tuple[str, str]], event: dict) -> None:
+        if sessions:
+            await self._publish(
+                {"sessions": [[username, jti] for username, jti in sessions], "event": event},
+            )
+
+    async def _publish(self, payload: dict[str, Any]) -> None:
+        try:
+            await self.broker.publish(NOTICE_CHANNEL, payload)
+        except Exception:
+            # 推送失败不影响业务操作（消息/下线记录已落库，客户端刷新后可见）
+            logger.exception("WebSocket 事件发布失败：%s", payload.get("event", {}).get("event"))
+
+    async def _on_message(self, _channel: str, message: dict[str, Any]) -> None:
+        """收到总线消息：投递给本进程内的目标连接。"""
+
+        payload = message.get("payload") or {}
+        event = {**(payload.get("event") or {}), "seq": message.get("seq")}
+
+        registry = self._registry
+        targets: list[WsConnection] = []
+        for username in payload.get("users") or ():
+            targets.extend(registry.user_connections(username))
+        for username, jti in payload.get("sessions") or ():
+            targets.extend(registry.session_connections(username, jti))
 
         if not targets:
             return
 
-        for ws in targets:
-            try:
-                await ws.send_json(event)
-            except Exception:
+        # 与 WebSocket.send_json 的序列化方式一致，每次广播只编码一次
+        text = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+        slow: list[WsConnection] = []
+        for conn in targets:
+            if conn.closed:
                 continue
+            try:
+                conn.queue.put_nowait(text)
+                self.enqueued += 1
+            except asyncio.QueueFull:
+                slow.append(conn)
 
-    async def broadcast_users(self, usernames: list[str], event: dict) -> None:
-        for username in usernames:
-            await self.send_to_user(username, event)
+        for conn in slow:
+            self._evict(conn)
 
-    async def broadcast_sessions(self, sessions: list[tuple[str, str]], event: dict) -> None:
-        for username, jti in sessions:
-            await self.send_to_session(username, jti, event)
+    def stats(self, *, top_users: int = 10) -> dict[str, Any]:
+        """本 worker 的运行指标（用于监控接口）。"""
+
+        users = self._registry.users()
+        per_user = sorted(((u, len(c)) for u, c in users.items()), key=lambda x: -x[1])
+        depths = [c.queue.qsize() for conns in users.values() for c in conns]
+        return {
+            "instance": INSTANCE_ID,
+            "users": len(users),
+            "connections": len(depths),
+            "topUsers": [{"username": u, "connections": n} for u, n in per_user[:top_users]],
+            "queue": {
+                "size": self._queue_size,
+                "queued": sum(depths),
+                "maxDepth": max(depths, default=0),
+                # 队列使用超过一半的连接数：持续增长说明客户端消费跟不上
+                "backlogged": sum(1 for d in depths if d * 2 > self._queue_size),
+            },
+            "enqueued": self.enqueued,
+            "evicted": self.evicted,
+            "sendErrors": self.send_errors,
+            "pings": self.pings,
+            "idleReaped": self.idle_reaped,
+            "expired": self.expired,
+            "broker": self.broker.stats(),
+        }
+
+    async def worker_stats(self) -> list[dict[str, Any]]:
+        """
+        各 worker 的运行指标。
+
+        说明：
+        - 其他 worker 的数据为其最近一次心跳时上报到广播总线的快照；
+        - local 总线下只能看到共享同一总线的管理器（通常即当前 worker）。
+        """
+
+        reports = await self.broker.reports()
+        reports[INSTANCE_ID] = self.stats()
+        return [reports[k] for k in sorted(reports)]
 
     @staticmethod
     def build_event(event: str, data: dict | None = None) -> dict:
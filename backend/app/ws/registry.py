@@ -0,0 +1,73 @@
+"""
+WebSocket 连接注册表（本进程内）。
+
+说明：
+- 按用户名、按会话 jti 各维护一份索引，值为不可变的 tuple（写时复制）；
+- 注册/注销只替换对应用户名/jti 的 tuple，读取方拿到的是快照，遍历期间不受并发注册/注销影响；
+- 所有方法均为同步方法（内部无 await），在事件循环中天然原子，因此无需加锁；
+  广播查找目标连接为 O(目标连接数)，不再与连接建立/断开争用同一把锁。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.ws.notice import WsConnection
+
+
+class ConnectionRegistry:
+    """连接注册表：username -> 连接，jti -> 连接。"""
+
+    def __init__(self) -> None:
+        self._by_user: dict[str, tuple[WsConnection, ...]] = {}
+        self._by_jti: dict[str, tuple[WsConnection, ...]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def user_count(self) -> int:
+        return len(self._by_user)
+
+    def add(self, conn: WsConnection) -> None:
+        self._by_user[conn.username] = (*self._by_user.get(conn.username, ()), conn)
+        self._by_jti[conn.jti] = (*self._by_jti.get(conn.jti, ()), conn)
+        self._count += 1
+
+    def remove(self, conn: WsConnection) -> bool:
+        """注销连接；连接不存在（已注销）时返回 False。"""
+
+        conns = self._by_user.get(conn.username, ())
+        if conn not in conns:
+            return False
+        _replace(self._by_user, conn.username, conns, conn)
+        _replace(self._by_jti, conn.jti, self._by_jti.get(conn.jti, ()), conn)
+        self._count -= 1
+        return True
+
+    def user_connections(self, username: str) -> tuple[WsConnection, ...]:
+        return self._by_user.get(username, ())
+
+    def session_connections(self, username: str, jti: str) -> tuple[WsConnection, ...]:
+        # jti 全局唯一；仍校验用户名，避免伪造的 (username, jti) 组合命中其他用户
+        return tuple(c for c in self._by_jti.get(jti, ()) if c.username == username)
+
+    def users(self) -> dict[str, tuple[WsConnection, ...]]:
+        """按用户名的连接快照（浅拷贝）。"""
+
+        return dict(self._by_user)
+
+
+def _replace(
+    index: dict[str, tuple[WsConnection, ...]],
+    key: str,
+    conns: tuple[WsConnection, ...],
+    conn: WsConnection,
+) -> None:
+    rest = tuple(c for c in conns if c is not conn)
+    if rest:
+        index[key] = rest
+    else:
+        index.pop(key, None)
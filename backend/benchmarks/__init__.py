@@ -0,0 +1,11 @@
+"""
+开发期基准测试脚本（不随应用部署，仅在开发/压测环境手动运行）。
+
+- index_advisor：写入压测数据后对各列表接口的查询执行 EXPLAIN，标记全表扫描。
+- data_scope：对比数据范围部门过滤的 IN 列表与递归 CTE 两种模式（1 万/10 万部门）。
+- user_import：生成 5 千/5 万行用户导入文件，测量导入吞吐（解析 + 校验 + 哈希 + 写库）。
+- log_search：写入 100 万条操作日志，对比关键字搜索的索引路径（FTS5/pg_trgm）与 LIKE 回退。
+- ws_registry：模拟大量 WebSocket 连接，测量连接建立/断开吞吐与广播耗时（无需数据库）。
+
+注意：脚本会向 DATABASE_URL 指向的数据库写入大量数据，请使用独立的压测库。
+"""
@@ -0,0 +1,158 @@
+"""
+数据范围基准：对比 DATA_SCOPE_QUERY_MODE=in（IN 列表）与 cte（递归 CTE 子查询）。
+
+用法（在 backend 目录下，数据库需已执行 `aerich upgrade`）：
+    DATABASE_URL=postgres://.../admin_bench uv run python -m benchmarks.data_scope
+    uv run python -m benchmarks.data_scope --depts 10000 100000 --repeat 10
+    uv run python -m benchmarks.data_scope --no-seed   # 复用已写入的部门树
+
+说明：
+- 每个规模写入一棵 --fanout 叉部门树（每个部门一个用户），以及一个挂在根部门、
+  数据范围为“本部门及子部门”的角色和用户；
+- 计时范围与用户列表接口一致：build_data_scope_q + 总数 + 第一页（20 条）；
+- 数据范围结果本身有缓存，两种模式都先预热一次，计时只包含查询部分。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from tortoise import Tortoise
+
+from app.core.config import settings
+from app.core.database import TORTOISE_ORM
+from app.core.security import get_password_hash
+from app.models.dept import Dept
+from app.models.role import DataScope, Role
+from app.models.user import User
+from app.schemas.user import CurrentUser
+from app.services.data_scope import build_data_scope_q, invalidate_data_scope_cache
+from app.services.dept_index import dept_index
+
+_BATCH_SIZE = 5000
+_PAGE_SIZE = 20
+_BENCH_PREFIX = "bench_ds"
+_MODES = ("in", "cte")
+
+
+def _prefix(size: int) -> str:
+    return f"{_BENCH_PREFIX}{size}_"
+
+
+async def seed(size: int, fanout: int) -> None:
+    """按层写入部门树（第 i 个部门的上级为第 (i-1)//fanout 个）与对应用户。"""
+
+    prefix = _prefix(size)
+    if await Role.exists(code=prefix + "role"):
+        print(f"{size} 个部门的数据已存在，跳过写入")
+        return
+
+    ids: list[int] = []
+    level_start = 0
+    level_end = 1
+    while level_start < size:
+        level_end = min(level_end, size)
+        names = [f"{prefix}{i}" for i in range(level_start, level_end)]
+        depts = [
+            Dept(name=name, parent_id=ids[(i - 1) // fanout] if i else None)
+            for i, name in enumerate(names, level_start)
+        ]
+        for start in range(0, len(depts), _BATCH_SIZE):
+            await Dept.bulk_create(depts[start : start + _BATCH_SIZE])
+        rows = dict(await Dept.filter(name__in=names).values_list("name", "id"))
+        ids.extend(int(rows[name]) for name in names)
+        level_start, level_end = level_end, level_end + (level_end - level_start) * fanout
+
+    password_hash = get_password_hash(_BENCH_PREFIX)
+    for start in range(0, size, _BATCH_SIZE):
+        await User.bulk_create(
+            [
+                User(
+                    username=f"{prefix}u{i}",
+                    password_hash=password_hash,
+                    real_name=f"压测用户{i}",
+                    dept_id=ids[i],
+                )
+                for i in range(start, min(size, start + _BATCH_SIZE))
+            ],
+        )
+
+    role = await Role.create(
+        name=f"压测角色{size}",
+        code=prefix + "role",
+        data_scope=DataScope.DEPT_AND_CHILDREN.value,
+    )
+    admin = await User.create(
+        username=prefix + "admin",
+        password_hash=password_hash,
+        real_name="压测管理员",
+        dept_id=ids[0],
+    )
+    await admin.roles.add(role)
+    print(f"已写入 {size} 个部门、{size + 1} 个用户")
+
+
+async def run_mode(size: int, mode: str, repeat: int) -> list[float]:
+    """返回每次（数据范围条件 + 总数 + 第一页）的耗时（毫秒）。"""
+
+    settings.DATA_SCOPE_QUERY_MODE = mode
+    prefix = _prefix(size)
+    timings: list[float] = []
+    for _ in range(repeat + 1):
+        user = CurrentUser(username=prefix + "admin", roles=[prefix + "role"])
+        started = time.perf_counter()
+        q = await build_data_scope_q(user, dept_field="dept_id", user_field="id")
+        qs = User.filter(q) if q is not None else User.all()
+        total = await qs.count()
+        await qs.order_by("-id").limit(_PAGE_SIZE)
+        timings.append((time.perf_counter() - started) * 1000)
+        if total < size:
+            raise SystemExit(f"数据范围内只有 {total} 个用户，压测数据不完整")
+    # 第一次包含数据范围计算与部门索引加载，不计入
+    return timings[1:]
+
+
+async def run(args: argparse.Namespace) -> None:
+    await Tortoise.init(config=TORTOISE_ORM)
+    original_mode = settings.DATA_SCOPE_QUERY_MODE
+    try:
+        dialect = Tortoise.get_connection("default").capabilities.dialect
+        if not args.no_seed:
+            for size in args.depts:
+                await seed(size, args.fanout)
+        invalidate_data_scope_cache()
+        dept_index.invalidate()
+
+        print(f"数据库：{dialect}，{args.fanout} 叉部门树，每次 = 数据范围条件 + 总数 + 第一页")
+        for size in args.depts:
+            results = {mode: await run_mode(size, mode, args.repeat) for mode in _MODES}
+            line = "，".join(
+                f"{mode} 中位数 {statistics.median(ms):.1f}ms / 最大 {max(ms):.1f}ms"
+                for mode, ms in results.items()
+            )
+            print(f"{size:>8} 个部门：{line}")
+    finally:
+        settings.DATA_SCOPE_QUERY_MODE = original_mode
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="数据范围查询模式基准（仅开发/压测环境使用）")
+    parser.add_argument(
+        "--depts",
+        type=int,
+        nargs="+",
+        default=[10000, 100000],
+        help="部门数（可多个）",
+    )
+    parser.add_argument("--fanout", type=int, default=10, help="每个部门的子部门数")
+    parser.add_argument("--repeat", type=int, default=5, help="每种模式的计时次数")
+    parser.add_argument("--no-seed", action="store_true", help="不写入数据，使用库中已有数据")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+索引顾问：对列表接口的查询执行 EXPLAIN，标记大表上的全表扫描。
+
+用法（在 backend 目录下，数据库需已执行 `aerich upgrade`）：
+    DATABASE_URL=postgres://.../admin_bench uv run python -m benchmarks.index_advisor
+    uv run python -m benchmarks.index_advisor --rows 1000000 --strict
+    uv run python -m benchmarks.index_advisor --no-seed   # 复用已写入的数据
+
+说明：
+- 默认先写入压测数据（操作/登录日志、用户、收件箱），再执行 ANALYZE 更新统计信息；
+- 查询与接口一致：过滤条件相同，并按 paginate() 的排序/分页方式生成 SQL（列表页 + 总数）；
+- PostgreSQL 使用 EXPLAIN (FORMAT JSON)，SQLite 使用 EXPLAIN QUERY PLAN；
+- 行数不少于 --min-rows 的表出现全表扫描即标记为 [SCAN]；--strict 时存在标记则退出码为 1。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.queryset import QuerySet
+
+from app.core.database import TORTOISE_ORM
+from app.core.security import get_password_hash
+from app.models.dept import Dept
+from app.models.log import LoginLog, OperationLog
+from app.models.notice import Notice, UserNotice
+from app.models.user import User
+from app.services.log_search import operation_log_search
+
+_BATCH_SIZE = 5000
+_PAGE_SIZE = 20
+_BENCH_PREFIX = "bench_"
+
+# SQLite：SCAN 后带这些说明时表示走索引或虚拟表，不算全表扫描
+_SQLITE_INDEXED_SCAN = (
+    "USING INDEX",
+    "USING COVERING INDEX",
+    "USING INTEGER PRIMARY KEY",
+    "VIRTUAL TABLE",
+)
+_SQLITE_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+
+@dataclass(slots=True)
+class Scenario:
+    """一个列表接口的查询场景。"""
+
+    name: str
+    build: Callable[[], QuerySet[Any]]
+    ordering: tuple[str, ...] = ("-id",)
+    paginated: bool = True
+    count: bool = True
+
+
+@dataclass(slots=True)
+class Finding:
+    scenario: str
+    kind: str
+    sql: str
+    scans: list[str]
+
+
+async def _bulk(model: type, objs: list[Any]) -> None:
+    for start in range(0, len(objs), _BATCH_SIZE):
+        await model.bulk_create(objs[start : start + _BATCH_SIZE])
+
+
+async def seed(rows: int) -> None:
+    """写入压测数据（时间均匀分布在最近一年）。"""
+
+    rnd = random.Random(20261018)
+    now = datetime.now(UTC)
+
+    def past() -> datetime:
+        return now - timedelta(seconds=rnd.randrange(365 * 86400))
+
+    depts = [Dept(name=f"{_BENCH_PREFIX}dept{i}") for i in range(20)]
+    await _bulk(Dept, depts)
+    dept_ids = await Dept.filter(name__startswith=_BENCH_PREFIX).values_list("id", flat=True)
+
+    user_count = max(100, rows // 100)
+    password_hash = get_password_hash(_BENCH_PREFIX)
+    await _bulk(
+        User,
+        [
+            User(
+                username=f"{_BENCH_PREFIX}u{i}",
+                password_hash=password_hash,
+                real_name=f"压测用户{i}",
+                dept_id=rnd.choice(dept_ids),
+                is_active=rnd.random() > 0.1,
+            )
+            for i in range(user_count)
+        ],
+    )
+    users = await User.filter(username__startswith=_BENCH_PREFIX).values_list("id", "username")
+    print(f"已写入 {len(users)} 个用户")
+
+    modules = ["用户管理", "角色管理", "菜单管理", "部门管理", "字典管理", "系统配置"]
+    for model, build in (
+        (
+            OperationLog,
+            lambda uid, name: OperationLog(
+                user_id=uid,
+                username=name,
+                module=rnd.choice(modules),
+                action="更新",
+                method="POST",
+                url=f"/api/v1/system/{rnd.randrange(1000)}",
+                ip="127.0.0.1",
+                request_data=json.dumps({"id": rnd.randrange(10**6)}),
+                status=1,
+                duration=rnd.randrange(200),
+                created_at=past(),
+            ),
+        ),
+        (
+            LoginLog,
+            lambda uid, name: LoginLog(
+                user_id=uid,
+                username=name,
+                ip="127.0.0.1",
+                status=1,
+                message="登录成功",
+                created_at=past(),
+            ),
+        ),
+    ):
+        for start in range(0, rows, _BATCH_SIZE):
+            size = min(_BATCH_SIZE, rows - start)
+            await model.bulk_create([build(*rnd.choice(users)) for _ in range(size)])
+        print(f"已写入 {rows} 条 {model._meta.db_table}")
+
+    notice_count = max(1, rows // len(users))
+    await _bulk(
+        Notice,
+        [
+            Notice(title=f"{_BENCH_PREFIX}notice{i}", message="压测消息", content="压测消息")
+            for i in range(notice_count)
+        ],
+    )
+    notice_ids = await Notice.filter(title__startswith=_BENCH_PREFIX).values_list("id", flat=True)
+    inbox: list[UserNotice] = []
+    for uid, _name in users:
+        for nid in notice_ids:
+            inbox.append(
+                UserNotice(
+                    user_id=uid,
+                    notice_id=nid,
+                    is_read=rnd.random() > 0.2,
+                    bell_hidden=rnd.random() > 0.9,
+                    created_at=past(),
+                ),
+            )
+        if len(inbox) >= _BATCH_SIZE:
+            await UserNotice.bulk_create(inbox)
+            inbox = []
+    await _bulk(UserNotice, inbox)
+    print(f"已写入 {len(users) * len(notice_ids)} 条 sys_user_notice")
+
+
+async def build_scenarios() -> list[Scenario]:
+    """按各列表接口的过滤方式构造查询（取压测数据中的样本值作为参数）。"""
+
+    sample = await User.filter(username__startswith=_BENCH_PREFIX).order_by("id").first()
+    if sample is None:
+        raise SystemExit("没有压测数据，请去掉 --no-seed 重新运行")
+    dept_user_ids = await User.filter(dept_id=sample.dept_id).values_list("id", flat=True)
+    now = datetime.now(UTC)
+    week_ago = now - timedelta(days=7)
+
+    return [
+        Scenario(
+            "操作日志：时间范围（startTime/endTime）",
+            lambda: OperationLog.filter(created_at__gte=week_ago, created_at__lt=now),
+        ),
+        Scenario(
+            "操作日志：数据范围（本部门用户）",
+            lambda: OperationLog.filter(user_id__in=list(dept_user_ids)),
+        ),
+        Scenario(
+            "操作日志：用户名",
+            lambda: OperationLog.filter(username__icontains=sample.username),
+        ),
+        Scenario(
+            "操作日志：关键字",
+            lambda: operation_log_search.apply(OperationLog.all(), sample.username),
+        ),
+        Scenario(
+            "登录日志：时间范围（startTime/endTime）",
+            lambda: LoginLog.filter(created_at__gte=week_ago, created_at__lt=now),
+        ),
+        Scenario(
+            "登录日志：数据范围（本部门用户）",
+            lambda: LoginLog.filter(user_id__in=list(dept_user_ids)),
+        ),
+        Scenario(
+            "消息铃铛",
+            lambda: UserNotice.filter(user_id=sample.id, is_read=False, bell_hidden=False),
+            ordering=("-created_at", "-id"),
+            paginated=False,
+            count=False,
+        ),
+        Scenario(
+            "消息收件箱",
+            lambda: UserNotice.filter(user_id=sample.id).select_related("notice"),
+            ordering=("-created_at", "-id"),
+        ),
+        Scenario(
+            "用户列表：部门 + 状态",
+            lambda: User.filter(dept_id=sample.dept_id, is_active=True),
+        ),
+    ]
+
+
+class Explainer:
+    """执行 EXPLAIN 并提取大表上的全表扫描。"""
+
+    def __init__(self, db: BaseDBAsyncClient, min_rows: int) -> None:
+        self.db = db
+        self.dialect = db.capabilities.dialect
+        self.min_rows = min_rows
+        self._row_counts: dict[str, int] = {}
+
+    async def _table_rows(self, table: str) -> int:
+        if table not in self._row_counts:
+            if self.dialect == "postgres":
+                rows = await self.db.execute_query_dict(
+                    "SELECT reltuples::bigint AS n FROM pg_class WHERE relname = $1",
+                    [table],
+                )
+            else:
+                rows = await self.db.execute_query_dict(f'SELECT COUNT(*) AS n FROM "{table}"')
+            self._row_counts[table] = int(rows[0]["n"]) if rows else 0
+        return self._row_counts[table]
+
+    async def seq_scans(self, sql: str) -> list[str]:
+        """返回 SQL 执行计划中的全表扫描（表名）。"""
+
+        if self.dialect == "postgres":
+            rows = await self.db.execute_query_dict(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = rows[0]["QUERY PLAN"]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            tables = list(self._pg_seq_scans(plan[0]["Plan"]))
+        elif self.dialect == "sqlite":
+            rows = await self.db.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+            tables = []
+            for row in rows:
+                detail = str(row["detail"])
+                m = _SQLITE_SCAN_RE.match(detail)
+                if m and not any(s in detail for s in _SQLITE_INDEXED_SCAN):
+                    tables.append(m.group(1))
+        else:
+            raise SystemExit(f"暂不支持的数据库：{self.dialect}")
+
+        return [t for t in tables if await self._table_rows(t) >= self.min_rows]
+
+    def _pg_seq_scans(self, node: dict[str, Any]):
+        if node.get("Node Type") == "Seq Scan":
+            yield node["Relation Name"]
+        for child in node.get("Plans", []):
+            yield from self._pg_seq_scans(child)
+
+
+async def analyze(db: BaseDBAsyncClient) -> None:
+    await db.execute_script("ANALYZE")
+
+
+async def run(args: argparse.Namespace) -> int:
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        db = Tortoise.get_connection("default")
+        await operation_log_search.ensure_index()
+        if not args.no_seed:
+            await seed(args.rows)
+        await analyze(db)
+
+        explainer = Explainer(db, args.min_rows)
+        findings: list[Finding] = []
+        for scenario in await build_scenarios():
+            queries: list[tuple[str, str]] = []
+            page_qs = scenario.build().order_by(*scenario.ordering)
+            if scenario.paginated:
+                page_qs = page_qs.limit(_PAGE_SIZE)
+            queries.append(("列表", page_qs.sql(params_inline=True)))
+            if scenario.count:
+                queries.append(("总数", scenario.build().count().sql(params_inline=True)))
+
+            for kind, sql in queries:
+                scans = await explainer.seq_scans(sql)
+                flag = "SCAN" if scans else " OK "
+                detail = f"（全表扫描：{', '.join(scans)}）" if scans else ""
+                print(f"[{flag}] {scenario.name} - {kind}{detail}")
+                if scans:
+                    findings.append(Finding(scenario.name, kind, sql, scans))
+                    if args.verbose:
+                        print(f"       {sql}")
+    finally:
+        await Tortoise.close_connections()
+
+    print(f"\n共 {len(findings)} 个查询存在全表扫描")
+    return 1 if findings and args.strict else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="列表查询索引顾问（仅开发/压测环境使用）")
+    parser.add_argument("--rows", type=int, default=200000, help="日志/收件箱写入行数")
+    parser.add_argument("--no-seed", action="store_true", help="不写入数据，使用库中已有数据")
+    parser.add_argument("--min-rows", type=int, default=10000, help="行数低于该值的表不检查")
+    parser.add_argument("--strict", action="store_true", help="存在全表扫描时退出码为 1")
+    parser.add_argument("-v", "--verbose", action="store_true", help="输出有问题的 SQL")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+操作日志关键字搜索基准：对比索引路径（SQLite FTS5 trigram / PostgreSQL pg_trgm）与 LIKE 回退。
+
+用法（在 backend 目录下；PostgreSQL 需已执行 `aerich upgrade`，SQLite 库不存在时自动建表）：
+    DATABASE_URL=sqlite://./bench_log_search.sqlite3 uv run python -m benchmarks.log_search
+    uv run python -m benchmarks.log_search --rows 1000000 --keywords 名称4242 user4242
+    uv run python -m benchmarks.log_search --no-seed   # 复用已写入的数据
+
+说明：
+- 写入 --rows 条操作日志：username 为 user0..user9999，request_data 含“名称N”（N < 10 万），
+  与 index_advisor 的压测数据互不影响（module 固定为压测标记）；
+- 计时范围与操作日志列表接口一致：关键字条件 + 总数 + 第一页（20 条，按 id 倒序）；
+- index 为 operation_log_search.apply()（SQLite 下先执行 ensure_index），
+  like 为未建立全文索引时的 icontains 回退；
+- PostgreSQL 上两种写法生成的 SQL 相同（都由迁移 13 的 trigram 索引提供支持），只统计 index。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from tortoise import Tortoise
+
+from app.core.database import TORTOISE_ORM
+from app.models.log import OperationLog
+from app.services.log_search import OperationLogSearch, operation_log_search
+
+_BATCH_SIZE = 5000
+_PAGE_SIZE = 20
+_BENCH_MODULE = "bench_log_search"
+_DEFAULT_KEYWORDS = ["名称4242", "user4242", "不存在的关键字"]
+
+
+async def seed(rows: int) -> None:
+    """写入压测日志（已有足够数据时跳过）。"""
+
+    existing = await OperationLog.filter(module=_BENCH_MODULE).count()
+    if existing >= rows:
+        print(f"已有 {existing} 条压测日志，跳过写入")
+        return
+
+    rnd = random.Random(20261018)
+    for start in range(existing, rows, _BATCH_SIZE):
+        size = min(_BATCH_SIZE, rows - start)
+        await OperationLog.bulk_create(
+            [
+                OperationLog(
+                    username=f"user{rnd.randrange(10000)}",
+                    module=_BENCH_MODULE,
+                    action="更新",
+                    method="POST",
+                    url=f"/api/v1/system/dict/{rnd.randrange(1000)}",
+                    ip="127.0.0.1",
+                    request_data=json.dumps(
+                        {"id": rnd.randrange(10**6), "name": f"名称{rnd.randrange(10**5)}"},
+                        ensure_ascii=False,
+                    ),
+                    status=1,
+                    duration=rnd.randrange(200),
+                )
+                for _ in range(size)
+            ],
+        )
+    print(f"已写入 {rows - existing} 条操作日志（共 {rows} 条）")
+
+
+async def run_keyword(
+    search: OperationLogSearch, keyword: str, repeat: int
+) -> tuple[list[float], int]:
+    """返回每次（关键字条件 + 总数 + 第一页）的耗时（毫秒）与命中总数。"""
+
+    timings: list[float] = []
+    total = 0
+    for _ in range(repeat + 1):
+        started = time.perf_counter()
+        qs = search.apply(OperationLog.all(), keyword)
+        total = await qs.count()
+        await qs.order_by("-id").limit(_PAGE_SIZE)
+        timings.append((time.perf_counter() - started) * 1000)
+    # 第一次包含页缓存预热，不计入
+    return timings[1:], total
+
+
+async def run(args: argparse.Namespace) -> None:
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        dialect = Tortoise.get_connection("default").capabilities.dialect
+        if dialect == "sqlite":
+            # 迁移文件按 PostgreSQL 生成，SQLite 压测库直接按模型建表
+            await Tortoise.generate_schemas(safe=True)
+        # 先建索引再写入：SQLite 下由触发器同步，与线上写入路径一致
+        await operation_log_search.ensure_index()
+        if not args.no_seed:
+            await seed(args.rows)
+
+        searches = {"index": operation_log_search}
+        if dialect != "postgres":
+            searches["like"] = OperationLogSearch()
+
+        print(f"数据库：{dialect}，每次 = 关键字条件 + 总数 + 第一页")
+        for keyword in args.keywords:
+            parts = []
+            for name, search in searches.items():
+                ms, total = await run_keyword(search, keyword, args.repeat)
+                parts.append(f"{name} 中位数 {statistics.median(ms):.1f}ms / 最大 {max(ms):.1f}ms")
+            print(f"{keyword}（命中 {total} 条）：{'，'.join(parts)}")
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="操作日志关键字搜索基准（仅开发/压测环境使用）")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="压测日志条数")
+    parser.add_argument(
+        "--keywords",
+        nargs="+",
+        default=_DEFAULT_KEYWORDS,
+        help="搜索关键字（可多个）",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="每个关键字的计时次数")
+    parser.add_argument("--no-seed", action="store_true", help="不写入数据，使用库中已有数据")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
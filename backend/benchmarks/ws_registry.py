@@ -0,0 +1,116 @@
+"""
+WebSocket 连接注册表基准：模拟大量连接，测量连接建立/断开吞吐与广播耗时。
+
+用法（在 backend 目录下，无需数据库）：
+    uv run python -m benchmarks.ws_registry
+    uv run python -m benchmarks.ws_registry --sockets 50000 --users 10000 --rounds 20
+
+说明：
+- 使用进程内广播总线（LocalBroker）与不做网络 IO 的模拟 WebSocket；
+- 广播耗时为 broadcast_users 返回的时间，即查找目标连接 + 序列化 + 入队，不含实际发送；
+- 广播期间同时有连接建立/断开（--churn），用于观察注册表变更与广播的相互影响。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.ws.broker import LocalBroker
+from app.ws.notice import NoticeWsManager, WsConnection
+
+
+class FakeWebSocket:
+    """模拟 WebSocket：发送立即完成。"""
+
+    sent = 0
+
+    async def send_text(self, _text: str) -> None:
+        FakeWebSocket.sent += 1
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:,.0f}/s" if seconds > 0 else "-"
+
+
+async def run(args: argparse.Namespace) -> None:
+    manager = NoticeWsManager(LocalBroker(), queue_size=args.rounds + 10)
+    await manager.start()
+    usernames = [f"u{i}" for i in range(args.users)]
+
+    started = time.perf_counter()
+    conns: list[WsConnection] = []
+    for i in range(args.sockets):
+        username = usernames[i % args.users]
+        conns.append(await manager.connect(username, f"{username}-{i}", FakeWebSocket()))
+    connect_seconds = time.perf_counter() - started
+    rate = _rate(args.sockets, connect_seconds)
+    print(f"建立连接：{args.sockets} 个，耗时 {connect_seconds:.3f}s（{rate}）")
+
+    churn: list[WsConnection] = []
+
+    async def churn_loop() -> None:
+        i = 0
+        while True:
+            username = usernames[i % args.users]
+            churn.append(await manager.connect(username, f"churn-{i}", FakeWebSocket()))
+            if len(churn) > 100:
+                await manager.disconnect(churn.pop(0))
+            i += 1
+            await asyncio.sleep(0)
+
+    churn_task = asyncio.create_task(churn_loop()) if args.churn else None
+
+    timings: list[float] = []
+    for r in range(args.rounds):
+        event = manager.build_event("notice:new", {"round": r})
+        started = time.perf_counter()
+        await manager.broadcast_users(usernames, event)
+        timings.append(time.perf_counter() - started)
+        # 让写任务把队列发送完，避免累积到慢消费者剔除
+        await asyncio.sleep(0)
+        while any(not c.queue.empty() for c in conns[:: max(1, args.sockets // 100)]):
+            await asyncio.sleep(0)
+
+    if churn_task is not None:
+        churn_task.cancel()
+        try:
+            await churn_task
+        except asyncio.CancelledError:
+            pass
+
+    ms = sorted(t * 1000 for t in timings)
+    print(
+        f"广播 {args.users} 个用户（{args.sockets} 个连接）× {args.rounds} 次："
+        f"中位数 {statistics.median(ms):.1f}ms，最大 {ms[-1]:.1f}ms",
+    )
+
+    started = time.perf_counter()
+    for conn in conns + churn:
+        await manager.disconnect(conn)
+    disconnect_seconds = time.perf_counter() - started
+    total = len(conns) + len(churn)
+    rate = _rate(total, disconnect_seconds)
+    print(f"断开连接：{total} 个，耗时 {disconnect_seconds:.3f}s（{rate}）")
+
+    stats = manager.stats()
+    print(f"已入队 {stats['enqueued']}，已发送 {FakeWebSocket.sent}，剔除 {stats['evicted']}")
+    await manager.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket 连接注册表基准（仅开发/压测环境使用）")
+    parser.add_argument("--sockets", type=int, default=50000, help="模拟连接数")
+    parser.add_argument("--users", type=int, default=10000, help="用户数（连接均分到各用户）")
+    parser.add_argument("--rounds", type=int, default=20, help="广播次数")
+    parser.add_argument("--churn", action="store_true", help="广播期间持续建立/断开连接")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
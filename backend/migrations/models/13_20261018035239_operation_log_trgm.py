@@ -0,0 +1,134 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 操作日志关键字搜索：pg_trgm GIN 索引（需有创建扩展的权限）
+    # 索引表达式需与 Tortoise icontains 生成的 UPPER(CAST(col AS VARCHAR)) 保持一致
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS "idx_sys_operat_username_trgm" ON "sys_operation_log" USING GIN ((UPPER(CAST("username" AS VARCHAR))) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_sys_operat_module_trgm" ON "sys_operation_log" USING GIN ((UPPER(CAST("module" AS VARCHAR))) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_sys_operat_url_trgm" ON "sys_operation_log" USING GIN ((UPPER(CAST("url" AS VARCHAR))) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_sys_operat_request_data_trgm" ON "sys_operation_log" USING GIN ((UPPER(CAST("request_data" AS VARCHAR))) gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sys_operat_username_trgm";
+DROP INDEX IF EXISTS "idx_sys_operat_module_trgm";
+DROP INDEX IF EXISTS "idx_sys_operat_url_trgm";
+DROP INDEX IF EXISTS "idx_sys_operat_request_data_trgm";"""
+
+
+MODELS_STATE = (
+    "eJztXWtzm0rS/isqf8pW+RwD4rpV+8HOZY+zSXwqcXa3Njml4jLYnEigFSiJ363893d6YG"
+    "BAgBiEBHbmi+LAtARPz6X76Z6e/52tIg8t418/xmhz9tfZ/85Ce4XwH6Xr57Mze70ursKF"
+    "xHaWpGH8EC+2tJUTJxvbTfB1317GCF/yUOxugnUSRCG0/rw1NMX8vNWVuYE/bUX+vNUM0/"
+    "m8nUuSAt/hRS7+kiC869Z8Gwb/3aJFEt2h5J68w6c/8OUg9NB3FNP/rr8s/AAtvdIrBh58"
+    "Abm+SB7W5Np1mLwiDeFJnIUbLbersGi8fkjuozBvHYQJXL1DIdrYCYKvTzZbeO1wu1xmCF"
+    "Ek0ictmqSPyMh4yLe3SwAPpOuwU9Ecv7qlKej6RRWrTMaNQtABfrKYvOwd/OIviqwaqjnX"
+    "VRM3IU+VXzF+pK9a4JAKEjTe3Z79IPftxE5bEEgLDN0Nghdf2Mkuli/wnSRYoXpAy5IVYL"
+    "1M9Ff6RxVmCmobzvRCAXTRKfchrSkyRlrD7XC303wdUPfVjpjjN/NuwuVDptoWgG+v3778"
+    "cHv59nf45lUc/3dJgLu8fQl3SAdfPVSuPtP/AtcjPNDSEZh/yexf17e/zeC/s//cvHtJcI"
+    "3i5G5DfrFod/ufM3gme5tEizD6trA9phfSqxQu3LJQ93bt9VR3WXJq6tZ1XwVFO9JPrO7s"
+    "4Rlt42md/L2j6+f39qZBz4xMRcsYtD567T9dsmuHpkpeR32u7O+LJQrvknv8X01q0ec/L9"
+    "8//+3y/TNNqujoXXZHIbd+lFBd23H8Ldp4i3s7vueBdkdwGHwPmiYdF48Vw5RgXVZdE6ZM"
+    "ye2Ds6JpHYDGrRqRJvfKUOORuVzw9uCS0PgQG4bsA9AWwp+WN59SV8a/s4m8rUuelgPiql"
+    "wvlLNpYBCQVaTY8OngT8MxJfjbdSbTj+2v2P7a8CBcSIyOrWbN8dqqSa4/GTzvoxVarO2E"
+    "a/otCY2OqmVZYKWYhvZ5a+LmGGHf7GqxHB/hIF5gPzD4WjPzXkXREtlhw8zAylVAdrDgsW"
+    "bf3KbYMQwVgFZVdPLpp0ZFN5hbUL26uXlTsgGvrm8r6H58e/Xy/TOZgI4bBUnqn2YeWYG0"
+    "h9bJgsuVZST2+7NH7sa6ouLJVnM1vLpZEjLB8EYd8R3CtwVywP9S69oCTLuovoo2KLgL/4"
+    "EeCLjX+Ins0K3rrhmD8iL7mkcC6g/aW+jV4tk29recRWE7EX5n/KYo7aAfXt7O3n188+aM"
+    "QOvY7pdvNjZZGzCOURzjx45rZolM8tU/3qOl3WAoMCTVh/SbTm6d5S7GYfCWhnSMwgT7ZE"
+    "ngogOReUe+5NQL/tyTiSMwT02qAZEZBBToLp2BGZZmmNsaEAxz/Ug9xw+Wh6Lz4SF+hb/l"
+    "5Aa4BAa4r0iD95k/I+dwSF5HzqlHEcNADoAIzMaREjGzcGl+3r21Ula1U/Ymqu1ib+3w4T"
+    "aCz47r4vuoUyc7Eh1kWp6CPxUDf2qygWcqw/U7OnwtSyR5t0UlhkLfdAMdDXkLll5LkYw2"
+    "RAlf0ANFOFtac/1kt2iwJbud3G+i7d196c4m+7XSqvz88sPzyxeEIlzsAE76xsoO7TtyDV"
+    "76x3n56WsiQ/St2iND9Gm6RIZYnbChHt+XzPdXl8/JX1ZjpIhXXESORORIRI5E5EhEjoaP"
+    "HPFy7tOh20uGgSp52DCwfGkadLuL11geVGn7seNwLKaGL+cRI1iZqVmmIhPYCsWA0WSoxH"
+    "WU0Oz1v25nxOJMV+9p6AGbtsm2xgZuNAEKgV6EW68OLteawIqD0delFH3ZlllWcyZBZzdl"
+    "Ho5zGCuBjdit7M0XvnAdlRidk9csCbKU3M4E5vF5eGJ+xW605po4ylKnm5RzznV3mdUMWG"
+    "DnOp4kzDkwSxpZeKET28vlhbuNk2h1AfLkY2GH3sK9D5beBoUXMVr2Cz51mTqU5qlDIVPH"
+    "DsfczIwO5qUDBkN46R3Z6yMtFk1aL0jtdBEp+uvf0o4wo8aYoUH0XNdUk2cB4fXwKUpVD5"
+    "+sXIvKGCw7+wyPXufsM1xAxdknd+h44XD22dlhhcK6dYy7l7zF3zNeLzHnnguss6ZdUNvB"
+    "0jXp+MQOfe1atdfoGuDur+tV9ms9dV2wTYfpmmYEP33ejr5pV/VWyLmqipvVy8/b5ZRuI2"
+    "1H+mYNbUf7bDttR/taJ9ouH367vFvZutcU26TWZ5qzYGhzObX0yyPXkBxrH913op8VNKGg"
+    "CQVNKGhCQRM+NZrwAOuTWXsKkpCuPcUaM4MHJpdxc8uQiE2qQ5a0SzJ0NKBe8DIkTYndIq"
+    "hyKIW2PyFNQM2TVsUYruEURoFsu3iJWUZ3FyB8gVYO8jzkXSyD8MuFs02SNAFgHIagvD2A"
+    "Ly110IzUA4YEY1gV+ah0SOhzMKks1QZzbI5Ir59DrrVt2P37/lEYMzdaraMQhTULUBvTzg"
+    "iNz0MqKkxJNtEIclVAG5Yc3QR+0iR7NlK9aJapzC6wxZ+gVTowlkGcAHuiyPrs+tUGg/LP"
+    "AH2bmI7SFGHuDO6K2Oh60n0XzAEPbG525todP6UYie2Rv200Na1sk/sFb4yqJDTyHMa6gr"
+    "tjpUwz5RPaBU3rw/PavOJO0ihXLx3JUpe1Bbdq1BG596PC+CX2rnpef7h5V68e2r6imY8h"
+    "Bu2TF7jJ+QxmjD9OPHJKBphMooU+ksHJ1/18btN9RPU4J85/+rdlWmZ+ZW4BkYRMmCkd1e"
+    "pBEtcpB/AsWeBUJ8/eXv67qq7nb26uqqY1fMGViDqeKuq4tjeQcs3F15RkRt9HYSgkpxjZ"
+    "Bjs4Todmyz6KFKhdZLl3UnSMMkwF1q47KUodqZb97bSVggY7d4HmSXV+IhiLdOeJhMiacp"
+    "+LyONuDKUl/5mJoB0cItsfQyFh3ZoYCg33tsdQaGy2SwyFDWi3BzNSfw5/QqaJQdZVw1Rr"
+    "gxkOLLSGKkEbRbfIjjBtT1RlvAcRcRYRZxFxFhFnEXGWpxZnOajMAbMeTS0dWzjkIg24ds"
+    "k5KA34GAWnHju7ke4OTl3EiVWJGIzdGKFOxCGwnpjdaMhe5N32f+oAzxEKcZSDlYOQPk+k"
+    "6z3NSghH6kXDEmTVHPfHzJU9lk0HTdRasfWDi1pjNiIcvNNgP7XGluxpKDvNVPTZX316ET"
+    "OtOatQq9gChlCv59VmDxvwt4EcvyJFeC7NhzQWjVDY+IpDW7aSbKf98f3E2qdS1dbMS8Ft"
+    "0utZp6CXBQsnWDjBwgkWTrBwj7Oc9kGh2kpB7TzVRrbIUqZBbMfRgP1wHI0mPqu+49MFTT"
+    "cQJLg5SJlSyvOfScCjlKz5uFnot9EXFM6uX6Q6gDoJ+LH6g6qrHUDV1UZQ4ValBOyaB9O0"
+    "9ejcnaGTpHFf065/nwaMxATDRjRfQnJZamRYwZr/5ZI+DPdwl5Uu411Wmgc83Cuj6myibx"
+    "kf1BVSRmT0bqp7qg9eK6m4r8OOkiL/sQ/GR8k1jWr4l2Z4o7rAyAjIqq5HljI3TYsBn8qb"
+    "DqZLO06wr4vCHjZjVXYAq3FQ5NP9USpJH0lz4j13zm9APhKDkQLT6iCg7+sAf10PZZclJ6"
+    "Zq00+zhlKajKo33yxk6GAjysgm5Z/wmwyUlv3o1P+0Isw5lwURZs3zFZa1grxE1QaaVZO6"
+    "xvcHDzp/xTZ1H2+8LDmxwcYygz/zXJoqabFBdsx3Ws2O4OhGCqtSbW7Bp456ZcUc6dildD"
+    "g4D/wwU6nRMWYNwTQOx9LzFQ5kIjwGQ9d3XDAYidOtGPvppdMtAC2pHdtaB5E7saNvwaRT"
+    "Itk1m4PpLry5HAcGnFujidlpDjWBxOKch/YYYli06xI9tD1gOmVTg7AwBPAMA5GtFZ5p0l"
+    "2I6W3NyUoKmXTnu2naQDFZRIydTCyS3kiutIcPT/vrIjFfhARFSFCEBEVIcPiQYBIkS75i"
+    "O1Rg/GAgu9oUO+t7OSGdmFKlhSlV6iodxDG2FnjAZUQmBq+qQQEKy5T7+RndHI02T6OmFn"
+    "2Y1MakbtH3hgWeEZkWvKaDCFnlaqzddDhD8vLft6VpaKcKRD4Vvbl593favFoaokt1rkaj"
+    "ijYfmw6s1OKSWct1Rmq56rBBWVXt2RwUouvp/8ZhAqEoGM/EQduPTlqYng/w+QCmpZL6J6"
+    "Q2DesBWJLEVefkBJNJjEJstyyXu5i3HhbLip3wrNhGt7B0WCw5BNEiBLiBUocN4rRpFnFP"
+    "/7wO8uGPkq0JODQXCGJlJlYkiFVBkbwNGTPY94BiE6ZuHjY0Tl0CKKNfuBTEykxYQcWIeM"
+    "wKIi53xMnBloVG32zX7/jWI3OxGUano2PHR7QrJ1vuPgccxrxBLgq+DrLPbqTjdWv5z8PQ"
+    "PnSj1N5dMM3cdRnIDntgOElshv1NjyROq4QajiPXBbsMBAyOhmxoo0OplzSGbzq+cwHmJi"
+    "TrWKoH/KluSfiG5uZl9cr5AB33xoz4VDWk96c8IJTh/IegwQUNLmhwQYMLGvxAGjyIIbum"
+    "ZpZsdf8Zqcl5//kaNCX/HtDqld1mTzS1rYD5505tc9ByubgPPK+2EkTbGKpITm0cqdglKR"
+    "txLDNQGHRTGmUMpD0G2670xMZck0X9M4+/1CHgY31KMuPn3h3iOw8dfnnkaYxpyCV1XkVK"
+    "4xRQHSy9cXfQD4Dm0yHLqniW5rgpJYzS0k41rBtT9amdcvNpqw5cm66ZRspkASelq/mRPF"
+    "lww9fm9NgebPIQXVhQY3lO/ERDgdi4MZfI7npoL9n7kkRP8ItdCsvECV6R05QahochtWXK"
+    "vHX1LlOOiL0lODbBsQmOTXBsgmPj5diYmbhrWhMjcsLDHZeRaxPWYXccM0tRNaOMSF2sgj"
+    "CILuJ5R2Uf+SjHaBPcBaGdVe7jAH5HcPx8yWyboeU6rG2RboHrhfYxNh6CScYNdkloAkAz"
+    "nXyyQKPvXNVosuajp0eyeLInkbC1rFQEf2uq4sx+nR1wwuLgs8kq4OvXtP3IqL+FJY2dr/"
+    "ugeZRaKnHwfzWAXgV3zeUVMokJcEzszGApsIHPlYqjD0kNNlMx+aqspe6FpSjzuaFIc93U"
+    "VMPQTCn3M3ZvtTkcV9d/B5+jpJBdsi++txVN5zJLcomRu/aH3y7xgzRkKLqVSq5zB7w92f"
+    "Vgo6YJJytZtulOqWBb5PyJ3ITUA+axVUpSU1g/fawA09XlGX6moqZMwWhkR0/rvpm3Lh+4"
+    "O53EeGfrfkFcS20hMfLguCIPkuJPzfIZ7BEDkA1NO2APwlFWg5/4yJHjnKOe0Xu85nhVbn"
+    "RsdwvydymDOp2iIIRJ5dVCSWiCKqg/E4E9I2raSnkKGwWqWhknWMwECjrCyEhMDsPDTvsQ"
+    "mzCG7q2DbsKodtsBgBzt6J5jH1BTBZgZtNxbXI4ZSX4RuMkLO7HPakLJ+b3zvWcF45bkDJ"
+    "2uAeXUw9dkwywfWMP6/+ldyzSsPbHiw76sdqsEdFOsVI903a/2ciu2S4hQrgjlilCuCOUO"
+    "UDWInVy7enQloWPRdJ1nTHZRYUO5hi9Dfp8p9ap0c6SS6w6qqUzRUg2ECkyBDGVWdlKjyX"
+    "CMfGXX9TmkfFnkFDFpfgAZfRTgU7OBA/hcYFrA59CaNMvO0lWtHOmdIPxxtKlZTZpjY1nz"
+    "08XGpNoVY25BOSFkdj2zYWA64mmVbJ/UoeBx8sBXLC8XGJ3A1E3CFfsS1Lm3TMvNDxslk7"
+    "LpOFJDGHEifOVPHB0ZLLC3w6yNx1jcprqoZSzIvfNOjEVCm3IyFuXkvSrJoCmSTtt05i36"
+    "fqWobix4CsFTCJ5C8BTD8xS8QedJJeEWa0ceUp6Ma8bL/QxL+/Rff0oLds705Au2ppBzYu"
+    "EYOGoXu/rUvGLh3x3v/C3hYzwRH+N5FPrB3VmNh5Hd2etfuEW7LrXs8pM6wYF2FRrHtGTY"
+    "4Gr4RTSTzck1fQ/KV5iqSw8jzM5IcSVy7qSh0ppy7Pd0CKiO/TjCqRFOjXBqhFMjnBrh1D"
+    "CVm5hVY4JODee+k0E3nPRffUpLMV6DHpUz0xBhbT7CZUIR1lJvluZuN1Db5qFjHNci3EXh"
+    "LtaaUtNwFytFWJ1tsEwC3hqSZcGplZBMa1tlE/SO/9V0N9sFLqsyic6SEBIkPFu6zrVHsG"
+    "177GElJyfi6b+J7oIQf5zV+Pr5vfN93v4SWsJnZ4dfJ+E+XyM14RBk0/ie0eyQ72kuHGbh"
+    "MAuH+WQO88nrew65dJdPKmKTdrKN5bZh9yi7MGj1VF4nlZUZ3Taqbq/tZyENnQEVrHkATV"
+    "uPDOX173kRR0Pt5egPDyPU6aLnB3VOqGZkxu+djCmRgmtI1UPWD8veO4qr72yib7XFf1tK"
+    "SRQio6OueypEQiwXMNYPPRbu2J08qvH4Wyqo1Ln7I0Csuh7ZKO+WA1hTBvrU9MqgE0mFYI"
+    "Fp2pqDv+kp2kyGFVCGa4o1Uir7CCdoDztl0ALXffrqYGeST8RPv1kD7hicBl+9dP98n78e"
+    "0dY8Pjs7wbBOOE3XtQnXAp+Vuy1Vrgf4SuH7C99f+P7C9xe+/wQW7Wn6/ngV3PJtPSskRo"
+    "e0tEbaUHhSM7Sux9EcGVhsMXByAYXEpIA9rLztEXostmWimlm2zXSnEuPH9k3HJ9FRlWRO"
+    "Aruiu57Wj0vpRKW0MClVZLcbrmIAWfMpYfrx/ZvpBJ0FqzrM9lz8VnFRQqprPk9VbvQ5tT"
+    "zyq6WoTHlOXDmVRPclNFAk/iiZP9hkXuMnQD10UhEcXSkaWeg0ZKl1StFVKGNhkmyg6apD"
+    "MIXHrMG53TQEdZqLcDIiowNsSnCoLHjpz1bxX06H4US4wQ8P8evIOathBbM75/v4wD+zRl"
+    "3qAJB5W5v7pHykT470tYs9gI4PddplXbso/gMUiuGoFlAohs+qq2yEtxcLONXvdjkWr/3s"
+    "u2LqYTYIiKPvBAspWMhSO7FlR2zZ6bJl5wuGksfNpO3Hd9rZhap64h0YgaYyI/Q4+r6ONs"
+    "lFXkY4uzAN5zQJEj7yNBeYlgImuGeqyatpq4nW4NYcEdyzNQo9QKqLc5O1vdhswxD+jbeu"
+    "i+L4wreDJep3At7gR7GtNxHMTjzuJCsycolE0/eITWBnR1dJv8iSNGbUKokSu4ZUbcQybz"
+    "+646hLYMjqhi5TZiQ/bgp8BwNpdB2eRnwQ90IYTIjHYyjJjNx1Nc9XyOYpKIWgQk23Avtx"
+    "EH3kSVIG8qC2hEEqUjrEeNQldMESTJ/p2a866sl2HyFugKdS/GKLfkfW1QpPShXF8Y6z7P"
+    "GmhHqvY3brZCeKOdn+58BCaXj90xDEqWpdiYnHeKoatqM3/RiEsuQADMKgavElEl1Ij/nm"
+    "IxAeCWFAwWgliPwgDOL7XvqtiE5MwXTG0/yfW8FP4QC+6hw6YuDqiRwS1w/RH7SfDHFI3D"
+    "ghwEu0Cdz7s5oQYHbnvC0EaBdt9kUAKfK7oP48efjNGJw46vUVbWLO/EtGZGR2tjuKxzfL"
+    "YWhwgJg1f5wAHqmicZigsMbWev3h5l3DYlyIVID8GOIX/ATBkPPZMoiTP6YJawuK8NYlS2"
+    "onBaqa7VQxkeALrsbOMPnx/6N7I3o="
+)
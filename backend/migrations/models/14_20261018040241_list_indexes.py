@@ -0,0 +1,140 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_sys_user_dept_id_f0a985" ON "sys_user" ("dept_id", "is_active");
+        CREATE INDEX IF NOT EXISTS "idx_sys_user_no_user_id_13c2ed" ON "sys_user_notice" ("user_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_user_no_user_id_192e7a" ON "sys_user_notice" ("user_id", "is_read", "bell_hidden", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_login_l_created_21a501" ON "sys_login_log" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_login_l_user_id_7abc81" ON "sys_login_log" ("user_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_operati_created_dc09da" ON "sys_operation_log" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_operati_user_id_74c756" ON "sys_operation_log" ("user_id", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_sys_operati_usernam_aa6713" ON "sys_operation_log" ("username", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sys_operati_usernam_aa6713";
+        DROP INDEX IF EXISTS "idx_sys_operati_user_id_74c756";
+        DROP INDEX IF EXISTS "idx_sys_operati_created_dc09da";
+        DROP INDEX IF EXISTS "idx_sys_login_l_user_id_7abc81";
+        DROP INDEX IF EXISTS "idx_sys_login_l_created_21a501";
+        DROP INDEX IF EXISTS "idx_sys_user_no_user_id_192e7a";
+        DROP INDEX IF EXISTS "idx_sys_user_no_user_id_13c2ed";
+        DROP INDEX IF EXISTS "idx_sys_user_dept_id_f0a985";"""
+
+
+MODELS_STATE = (
+    "eJztXVtzm0oS/isqP2WrfI4Bcd2qfbBz2eNsLqcSZ3drk5SKy2BzIoGOQEm8W/nvOz0wMC"
+    "BADEICO/OiODAtwddz6f66p+d/Z6vIQ8v41w8x2pz9dfa/s9BeIfxH6fr57Mxer4urcCGx"
+    "nSVpGN/Hiy1t5cTJxnYTfN23lzHClzwUu5tgnQRRCK0/bQ1NMT9tdWVu4E9bkT9tNcN0Pm"
+    "3nkqTAd3iRi78kCG+7Nd+GwZ9btEiiW5TckXf4+BlfDkIPfUcx/PcjfoZ1sgg8aB7EC/x8"
+    "wVd09hmarb8s/AAtvdKrpy3J9UVyvybXrsPkBWkIT+gs3Gi5XYVF4/V9cheFeesgTODqLQ"
+    "rRxk4QfH2y2QIc4Xa5zJCjCKVvUDRJH52R8ZBvb5cAKkjXYaqiOYbE0hR0/ayKYSbjRiHo"
+    "Bj9ZTF72Fn7xF0VWDdWc66qJm5Cnyq8YP9JXLXBIBQkab27OfpD7dmKnLQjUBYbuBsGLL+"
+    "xkF8tn+E4SrFA9oGXJCrBeJvor/aMKMwW1DWd6oQC66Kz7kNYUGSOt4Xa4O2q+Dqj7akfM"
+    "8Zt5b8PlfabaFoBvrl8/f39z+fp3+OZVHP+5JMBd3jyHO6Tjr+4rV5/of4HrER6A6cjMv2"
+    "T2r+ub32bw39l/3r55TnCN4uR2Q36xaHfznzN4JnubRIsw+rawPaYX0qsULtyyUPd27fVU"
+    "d1lyaurWdV8FRTvST6zu7OEZbePpnvy9o+und/amQc+MTEXLGLQ+eu0/XbJriqZKXkd9ru"
+    "zviyUKb5M7/F9NatHnPy/fPf3t8t0TTaro6E12RyG3fpRQXdtx/C3aeIs7O77jgXZHcBh8"
+    "D5omHRePFcOUYL1WXROmTMntg7OiaR2Axq0akSb3ylDjkblc8PbgktD4EBuG7APQFsKflj"
+    "efUlfGv7OJvK1LnpYD4qpcL5SzaWAQkFWk2PDp4E/DMSX423Um04/tr9j+2vAgXEiMjq1m"
+    "zfHaqkmuPxk876IVWqzthGv6LQmNjqplWWClmIb2aWvi5hhh3+xqsRwf4cL/2kH4KoqWyA"
+    "4bZgZWrgKygwWPNfvmNsWOYagAtKqik08/NSq6wdyC6tXbt69KNuDV9U0F3Q+vr56/eyIT"
+    "0HGjIEn908wjK5BmnN6Oriwjsd+fPXI31hUVT7aaq+HVzZKQCYY36ojvEL4tkAP+l1rXFm"
+    "DaRfVFtEHBbfgPdE/AvcZPZIduXXfNmJVn2dc8EFB/0N5CrxbPtrG/5SwK24nwO+M3RWkH"
+    "ff/8Zvbmw6tXZwRax3a/fLOxydqAcYziGD92XDNLZJIv/vEOLe0GQ4Ehr96n33Ry6yx3MQ"
+    "6DtzSkYxQm2CdLAhcdiMwb8iWnXvDnnkwcgXlqUg2IzCCgQHfpDMywNMPc1oBgmOtH6jl+"
+    "sDwUnff38Qv8LSc3wCUwwH1FGrzP/BE5h0PyMnJOPYoYBnIARGA2jpSImYVL8/PurZWyqp"
+    "2yN1FtF3tth/c3EXx2XBffRZ062ZHoINPyFPypGPhTkw08Uxmu39Hha1kiybstKrEV+qYb"
+    "6GjIW7D0WopktCFK+ILuKcLZ0prrJ7tFgzDZ7eRuE21v70p3NtmvlVblp5fvn14+IxThYg"
+    "dw0jdWdmjfkmvw0j/Oy09fEzGib9UeMaJP0yVixOqEDQH5vmS+u7p8Sv6yGiNIvOL7I0oi"
+    "ciQiRyJyJCJHInLEGzni5dynQ7eXDANV8rBhYPnSNOh2F6+xPKjS9mPH4VhMDV/OI0awMl"
+    "OzTEUmsBWKAaPJUInrKKHZy3/dzIjFma7e09ADNm2TbY0N3GgCFAK9CLdeHVyuNYEVB6Ov"
+    "Syn6si2zrOZMgs5uyjwc5zBWAhuxW9mbL3zhOioxOievWRJkL7mdCczj8/DE/IrdaM01cZ"
+    "SlTjcp55zr7jKrGbDAznU8SZhzYJY0svBCJ7aXywt3GyfR6gLkycfCDr2FexcsvQ0KL2K0"
+    "7Bd86jJ1KM1Th0Kmjh2OuZkZHcxLBwyG8NI7stdHWiyatF6Q2ukiUvTXv6UdYUaNMUOD6L"
+    "muqSbPAsLr4VOUqh4+WbkWlTFYdvYZHr3O2We4gIqzT+7Q8cLh7LOzwwqFdesYdy95jb9n"
+    "vF5izj0XWGdNu6C2g6Vr0vGJHfratWqv0TXA3V/Xq+zXeuq6YJsO0zXNFH78vB19067qrZ"
+    "BzVRU3q5eft8sp3UbajvTNGtqO9tl22o72tU60XT78dnm3snWvKbZJrc80Z8HQ5nJq6ZdH"
+    "riE51j6670Q/K2hCQRMKmlDQhIImfGw04QHWJ7P2FCQhXXuKNWYGD0wu4+aWIRGbVIcsaZ"
+    "dk6GhAveBlSJoSu0VQ5VAKbX9CmoCaJ62KMVzDKYwC2XbxErOMbi9A+AKtHOR5yLtYBuGX"
+    "C2ebJGkCwDgMQXl7AF9a6qAZqQcMCcawKvJR6ZDQ52BSWaoN5tgckV4/h1xr27D79/2jMG"
+    "ZutFpHIQprFqA2pp0RGp+HVFSYkmyiEeSqgDYsOboJ/KRJ9myketEsU5ldYIs/Qat0YCyD"
+    "OAH2RJH12fWLDQblnwH6NjEdpSnC3BncFbHR9aT7LpgDHtjc7My1O35KMRLbI3/baGpa2S"
+    "Z3C94YVUlo5DmMdQV3x0qZZsontAua1ofntXnFnaRRrl46kqUuawtu1agjcu9HhfFL7F31"
+    "vHz/9k29emj7imY+hBi0j17gJuczmDE+n3jklAwwmUQLfSSDk6/7+dym+4jqcU6c//Rvy7"
+    "TM/MrcAiIJmTBTOqrVgySuUw7gWbLAqU6evL78d1VdT1+9vaqa1vAFVyLqeKqo49reQMo1"
+    "F19Tkhl9H4WhkJxiZBvs4Dgdmi37KFKgdpHl3knRMcowFVi77qQodaRa9rfTVgoa7NwFmi"
+    "fV+ZFgLNKdJxIia8p9LiKPuzGUlvxnJoJ2cIhsfwyFhHVrYig03NseQ6Gx2S4xFDag3R7M"
+    "SP05/AmZJgZZVw1TrQ1mOLDQGqoEbRTdIjvCtD1RlfEeRMRZRJxFxFlEnEXEWR5bnOWgMg"
+    "fMejS1dGzhkIs04Nol56A04GMUnHro7Ea6Ozh1ESdWJWIwdmOEOhGHwHpidqMhe5F32/+p"
+    "AzxHKMRRDlYOQvo8kq73OCshHKkXDUuQVXPcHzJX9lA2HTRRa8XWDy5qjdmIcPBOg/3UGl"
+    "uyp6EcNVPRZ39V6kXMtOasTq1iCxhCvZ5Xmz1swN8GcvyKFOG5NB/SWDRCYeMrDm3ZSrKd"
+    "9se7VM5mq7ZmXgpuk17POgW9LFg4wcIJFk6wcIKFe5jltA8K1VYKauepNrJFljINYjuOBu"
+    "yH42g08Vn1HZ8uaLqBIMHNQcqUUp7/SAIepWTNx81Cv4m+oHB2/SzVAdRJwI/VH1Rd7QCq"
+    "rjaCCrcqJWDXPJimrUfn7gydJI37mnb9+zRgJCYYNqL5EpLLUiPDCtb8L5f0YbiHu6x0Ge"
+    "+y0jzg4V4ZVWcTfcv4oK6QMiKjd1PdU33wWknFfR12lBT5j30wPkquaVTDvzTDG9UFRkZA"
+    "VnU9spS5aVoM+FTedDBd2nGCfV0U9rAZq7IDWI2DIp/uj1JJ+kiaE++5c34D8oEYjBSYVg"
+    "cBfV8H+Ot6KLssOTFVm36aNZTSZFS9+WYhQwcbUUY2Kf+E32SgtOwHp/7HFWHOuSyIMGue"
+    "r7CsFeQlqjbQrJrUNb4/eND5K7ap+3jjZcmJDTaWGfyZ59JUSYsNsmO+02p2BEc3UliVan"
+    "MLPnXUKyvmSMcupcPBueeHmUqNjjFrCKZxOJaer3AgE+ExGLq+44LBSJxuxdhPL51uAWhJ"
+    "7djWOojciR19CyadEsmu2RxMd+HN5Tgw4NwaTcxOc6gJJBbnPLTHEMOiXZfooe0B0ymbGo"
+    "SFIYBnGIhsrfBMk+5CTG9rTlZSyKQ7303TBorJImLsZGKR9EZypT18eNpfF4n5IiQoQoIi"
+    "JChCgsOHBJMgWfIV26EC4wcD2dWm2FnfywnpxJQqLUypUlfpII6xtcADLiMyMXhVDQpQWK"
+    "bcz8/o5mi0eRo1tejDpDYmdYO+NyzwjMi04DUdRMgqV2PtpsMZkuf/vilNQztVIPKp6NXb"
+    "N3+nzaulIbpU52o0qmjzsenASi0umbVcZ6SWqw4blFXVns1BIbqe/m8cJhCKgvFMHLT96K"
+    "SF6fkAnw9gWiqpf0Jq07AegCVJXHVOTjCZxCjEdstyuYt562GxrNgJz4ptdAtLh8WSQxAt"
+    "QoAbKHXYIE6bZhH39M/rIB/+KNmagENzgSBWZmJFglgVFMnbkDGDfQ8oNmHq5mFD49QlgD"
+    "L6hUtBrMyEFVSMiIesIOJyR5wcbFlo9M12/Y5vPTIXm2F0Ojp2fES7crLl7nPAYcwb5KLg"
+    "6yD77EY6XreW/zwM7UM3Su3dBdPMXZeB7LAHhpPEZtjf9EjitEqo4ThyXbDLQMDgaMiGNj"
+    "qUeklj+KbjOxdgbkKyjqV6wJ/qloRvaG5eVq+cD9Bxb8yIT1VDen/MA0IZzp9rt9Fk4zCI"
+    "IWCc7rRCy+XiLvC8dJ8mQ8tW99iwtwSpLkh1QaoLUl2Q6rykOjP1cpAJjNTkuIR8RZsSWw"
+    "Bo9cqVsyeaKFfA/HMnylXsFY4xVJGc2jhSsYNTNglZnqEwD6c0yhhIewy2XemJjbkm+/xn"
+    "Hn+pe8HHIZVkxs/kO8QTHzqY88CTItMATuoKiwTJKaA6WLLk7qAfAM3HQ71V8SzNcVNKP6"
+    "WFomo4PKaGVDuB59NWHZg7XTONlBcDhktX8wN+slCJr83pIUDY5CG6sKBi85z4iYYCkXZj"
+    "LpG9+tBesvelnJ7gF7uUqYkTvCKnCTpVFq3MglfvMsWNBMcmODbBsfGZrYJjExxbdWdqPh"
+    "N3TZJiRE54VOQycm3COuyOY2YpquanEamLVRAG0UU876jsIx8MGW2C2yC0szqAHMDvCI6f"
+    "fZltWrRch7Ut0g11vdA+xjZGMMm4wS4JTQBoppNPFmj0nau2TdZ89GRLFk/2XBO2MpaK4G"
+    "9NVZzZr7MDzmscfDZZBXz9mrYfGfXXsKSx83UfNI9SmSUO/lsD6FVw21ysIZOYAMfEzgyW"
+    "AtsBXak4SJFUdDMVk69mW+peWIoynxuKNNdNTTUMzZRyP2P3VpvDcXX9d/A5SgrZJfviO1"
+    "vRdC6zJJcYuWu//+0SP0hDvqNbqQs7d8Dbk10Ptn2acE6TZZvulMq/Rc4fyE1IdWEeW6Uk"
+    "NYX108cKMF1dnuFnKirUFIxGdpC17pt56/LxvdNJs3e27hfEtdQWEiMPjivyICn+1CyfwY"
+    "4zANnQtAN2NBxlNfiJDzA5zqnsGb3Ha45X5UbHdre8f5eiqtMpMUKYVF4tlIQmqIL6ExbY"
+    "E6emrZTHsO2gqpVxgsVMoKAjjIzE5DA87OwQsaVj6N466JaOarcdAMjRDgI69nE3VYCZQc"
+    "u9YeaYkeRngZs8sxP7rCaUnN8733vyMG5JTuTpGlBOPXxNNszy8Tes/5/etUzD2hMrPuzL"
+    "ajdeQDfFSvVI1/1qL7e7my9EKFeEckUo968ilNuibhHKPasJ5ZYm164eXUnoWDRd5xmTXV"
+    "TYUK7hy5DfZ0q96uYcqYC7g2rqXLTUFqECUyBDmZWdVHwyHCNf2XV9DilfFjmTTJofQEYf"
+    "BfjUbOAAPheYFvA5tCbNsrN0VStHeicIfxxtalaT5thY1vx0sTGpdsWYW1CcCJldT4AYmI"
+    "54XAXgJ3XEeJzc85XeywVGJzB1k3DFvgRV8y3TcvOjS8mkbDqO1BBGnAhf+RNHRwYL7O0w"
+    "a+MxFjepLmoZC3LvvBNjkdCmnIxFOXmvSjJoiqTTNp15i75fKWolC55C8BSCpxA8xfA8BW"
+    "/QeVJJuMXakYeUJ+Oa8XI/w9I+/def0oKdMz35gq0p5NRZOFSO2sWuPjWvWPh3xzvNS/gY"
+    "j8THeBqFfnB7VuNhZHf2+hdu0a5LZbz83E9woF2FxjEtGTa4Gn4RzWRzck3fg/IVpurSow"
+    "2zE1dciZxiaai0Qh37PR0CqmM/jnBqhFMjnBrh1AinRjg1TOUmZtWYoFPDue9k0A0n/Vef"
+    "0lKM16AH5cw0RFibD4SZUIS11JuludsN1LZ56BiHvwh3UbiLtabUNNzFShFWZxssk4C3hm"
+    "RZcGolJNPaVtkEveN/Nd3NdoHLqkyisySEBAnPlq5z7RFs2x57WMnJiXj6r6LbIMQfZzW+"
+    "fn7vfJ+3v4SW8NnZ4ddJuM/XSE04BNk0vmc0O+R7mncpZSWqwAvPWnjWp/WsT14IdMg1vn"
+    "xAEpvdk+1Atw27R32GQcus8nqzrMzoRlR1H24/U2roVKlgzQNo2npkKK9/z6s9GmovRmB4"
+    "GKGgFz22qHPmNSMzfu9kbI4UXEOqnu1+WJrfUTgBZxN9q60S3FJzohAZHXXdUyFkYrmAsX"
+    "7oaXTH7uRRDTXQUmqljhcYAWLV9ciOercc6Zoy0KfmYQadSCpMDEzT1hwcU0/RZjKsgDJc"
+    "U6yRct5HOLh72CmDVsLu01cHOwp9Ig792zXgjsFpcOpL98/3OfYRbc3j3LMTDOut07xem5"
+    "Ay8Fm521IOe4CvHJAkoLeoKS0IBEEgCALhXBAIgkAQBAJeSrd8G90KidEhLS20NpS51Ayt"
+    "6+E3RwYWmx2chEIhMSlgDyume4Qeiw2iqGaWbbP/qcT4mQSm45NYrEryNIGi0V1P60fIdO"
+    "JjWuiYKrLbDVfpgaz5lDD98O5Vv056jBC3oGaH2QyM3youClZ1zR6qyo0+p5ZHfrXwlSnP"
+    "iT+oklwCCQ0U9z9KnhE2mdf4CVAPnVQER1eKRhY6DVlqnVJ0FYpmmCT3aLrqEHTjMSt+bj"
+    "cNkaHmkp+MyOgAmxIcYQte+pNV/JfTYTgRgvH9ffwycs5qqMXszvk+UvGPrFGXqgNk3tbm"
+    "PilW6ZMDhO1ix6HjQ1V4Wdcuiv8AhWI4qgUUiuGz6iob4e2lCU71u51JycaT9oqph9mOIF"
+    "hIwUIKFrLUTmwQEhuEumwQ+oKh5HEzafvxnXZ2oaqerwdGoKnMCD2Ovq+jTXKRFy3OLkzD"
+    "OU2ChI88zQWmpYAJ7tBq8mraKrA1uDVHBPdsjUIPkOri3GRtLzbbMIR/463roji+8O1gif"
+    "qdtzf4wW/rTQSzE487yYqMXJDR9D1iE9jZQVnSL7IkjRm1SqLEriFVG7HM24/uOOoSGLK6"
+    "ocuUGckPtwLfwUAaXYenER/EvRAGE+LxGEoyI3ddzfMVslULCi+oUEGuwH4cRB94ppWBPK"
+    "hkYZD6lw4xHnUJXbAE0yd60qyOerLdR4gb4KkUv9ii3wF5tcKTUkVxmOQse7wpod7rUN86"
+    "2YliTjYbOrBQGl7/NARxhltXYuIhnuGG7ehNPwahLDkAgzCoWnyJRBfSQ8X5CIQHQhhQMF"
+    "oJIj8Ig/iul34rohNTMJ3xNP/nVvBjOO6vOoeOGLh6JEfS9UP0B+0nQxxJN04I8BJtAvfu"
+    "rCYEmN05bwsB2kWbfRFAivwuqD9PibxmDE4c9fqKNjFn/iUjMjI72x3F45vlMDQ4QMyaP0"
+    "wAj1Q/OUxQWGNrvXz/9k3DYlyIVID8EOIX/AjBkPPZMoiTz9OEtQVFeOuSJbWTAlXNdqqY"
+    "SPAFV2NnmPz4PzIPajs="
+)
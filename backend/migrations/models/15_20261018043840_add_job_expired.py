@@ -0,0 +1,128 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        COMMENT ON COLUMN "sys_job"."status" IS '状态：pending/running/success/failed/expired';
+        CREATE INDEX IF NOT EXISTS "idx_sys_job_status_83e112" ON "sys_job" ("status", "finished_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sys_job_status_83e112";
+        COMMENT ON COLUMN "sys_job"."status" IS '状态：pending/running/success/failed';"""
+
+
+MODELS_STATE = (
+    "eJztXVtzm0oS/isqP2WrfI4Acd2qfbBz2eNsLqcSZ3drk5SKy2BzIoGOQEm8W/nvOz0wMC"
+    "DADEICO/OiODAtwddz6f66p+d/Z+vIQ6v41w8x2p79dfa/s9BeI/xH6fr57MzebIqrcCGx"
+    "nRVpGN/Fyx1t5cTJ1nYTfN23VzHClzwUu9tgkwRRCK0/7QxNMT/tdGVh4E9bkT/tNMN0Pu"
+    "0WkqTAd3iRi78kCG+6Nd+FwZ87tEyiG5Tcknf4+BlfDkIPfUcx/PcjfoZNsgw8aB7ES/x8"
+    "wVd09hmabb4s/QCtvNKrpy3J9WVytyHXrsLkBWkIT+gs3Wi1W4dF481dchuFeesgTODqDQ"
+    "rR1k4QfH2y3QEc4W61ypCjCKVvUDRJH52R8ZBv71YAKkjXYaqiBYbE0hR09ayKYSbjRiHo"
+    "Bj9ZTF72Bn7xF0VWDdVc6KqJm5Cnyq8YP9JXLXBIBQkab67PfpD7dmKnLQjUBYbuFsGLL+"
+    "1kH8tn+E4SrFE9oGXJCrBeJvor/aMKMwW1DWd6oQC66Kz3Ia0pMkZaw+1wd9R8HVD31Y6Y"
+    "4zfz3oaru0y1LQBfX71+/v764vXv8M3rOP5zRYC7uH4Od0jHX99Vrj7R/wLXIzwA05GZf8"
+    "nsX1fXv83gv7P/vH3znOAaxcnNlvxi0e76P2fwTPYuiZZh9G1pe0wvpFcpXLhloe7dxuup"
+    "7rLk1NSt674Kinakn1jd2cMz2sbTPfl7T9dPb+1tg54ZmYqWMWh99Np/umTXFE2VvI76XN"
+    "vflysU3iS3+L+a1KLPf168e/rbxbsnmlTR0ZvsjkJu/SihurHj+Fu09Za3dnzLA+2e4DD4"
+    "HjRNOi4eK4YpwXqtuiZMmZLbB2dF0zoAjVs1Ik3ulaHGI3O15O3BJaHxITYM2QegLYQ/LW"
+    "8xpa6Mf2cbeTuXPC0HxFW5Xihn08AgIKtIseHTwZ+GY0rwt+tMph/bX7H9teVBuJAYHVvN"
+    "WuC1VZNcfzJ43kZrtNzYCdf0WxIaHVXLssBKMQ3t087EzTHCvtnVYjk+woX/tYfwZRStkB"
+    "02zAysXAVkBwsea/bNbYo9w1ABaFVFJ59+alR0g7kF1cu3b1+VbMDLq+sKuh9eXz5/90Qm"
+    "oONGQZL6p5lHViDNOL0dXVlG4n5/9sjdWFdUPNlqroZXN0tCJhjeqCO+Q/i2QA74X2pdW4"
+    "BpH9UX0RYFN+E/0B0B9wo/kR26dd01Y1aeZV/zQED9QXsLvVo829b+lrMobCfC74zfFKUd"
+    "9P3z69mbD69enRFoHdv98s3GJmsDxjGKY/zYcc0skUm++Mc7tLIbDAWGvHqfftPJrbPcxT"
+    "gM3tKQjlGYYJ8sCVx0IDJvyJecesFfeDJxBBapSTUgMoOAAt2lMzDD0gwLWwOCYaEfqef4"
+    "wepQdN7fxS/wt5zcAJfAAPcVafA+80fkHA7Jy8g59ShiGMgBEIHZOFIiZhYuzc/7t9bKun"
+    "bK3ka1Xey1Hd5dR/DZcV18F3XqZEeig0zLU/CnYuBPTTbwTGW4fkeHr2WJJO+2rMRW6Jtu"
+    "oaMhb8nSaymS0ZYo4Qu6owhnS2uun+wWDcJkt5PbbbS7uS3d2Wa/VlqVn168f3rxjFCEyz"
+    "3ASd9Y26F9Q67BS/84Lz99TcSIvlV7xIg+TZeIEasTNgTk+5L57vLiKfnLaowg8YrfH1ES"
+    "kSMRORKRIxE5EpEj3sgRL+c+Hbq9ZBiokocNA8uXpkG3u3iN5UGVth87DsdiavhyHjGClZ"
+    "maZSoyga1QDBhNhkpcRwnNXv7rekYsznT1noYesGmb7Gps4EYToBDoRbj16uByrQmsOBh9"
+    "XUrRl22ZZTVnEnR2U+bhOIexEtiI3drefuEL11GJ0Tl5zZIge8ntTGAen4cn5lfsRhuuia"
+    "MsdbpJOedc95dZzYAFdqHjScJcALOkkYUXOrG9Ws3dXZxE6znIk4+lHXpL9zZYeVsUzmO0"
+    "6hd86jJ1KM1Th0Kmjj2OuZkZHcxLBwyG8NI7stdHWiyatF6Q2ukiUvTXv6UdYUaNMUOD6L"
+    "muqSbPAsLr4VOUqh4+WbmWlTFYdvYZHr3O2We4gIqzT+7Q8cLh7LOzwxqFdesYdy95jb9n"
+    "vF5iLjwXWGdNm1PbwdI16fjEDn3tWrXX6Brg7q/rdfZrPXVdsE2H6ZpmCj9+3o6+aVf1Vs"
+    "i5qoqb1cvP2+WUbiNtR/pmDW1H+2w7bUf7WifaLh9++7xb2brXFNuk1meas2BoCzm19Msj"
+    "15Ac6z6670Q/K2hCQRMKmlDQhIImfGw04QHWJ7P2FCQhXXuKNWYGD0wu4+aWIRGbVIcsaZ"
+    "dk6GhAveBlSJoSu0VQ5VAKbX9CmoCaJ62KMVzDKYwC2XbxErOKbuYgPEdrB3ke8uarIPwy"
+    "d3ZJkiYAjMMQlLcH8KWlDpqResCQYAyrIh+VDgl9ASaVpdpgji0Q6fULyLW2Dbt/3z8KY+"
+    "ZG600UorBmAWpj2hmh8XlIRYUpySYaQa4KaMOSo5vAT5pkz0aqF80yldkcW/wJWqcDYxXE"
+    "CbAniqzPrl5sMSj/DNC3iekoTRHmzuCuiI2uJ913wRzwwOZmZ6798VOKkdge+dtGU9PKLr"
+    "ld8saoSkIjz2GsK7g/Vso0Uz6hzWlaH57XFhV3kka5eulIlrqsLbhVo47IvR8Vxi+x99Xz"
+    "8v3bN/Xqoe0rmvkQYtA+eoGbnM9gxvh84pFTMsBkEi30kQxOvu7nc5vuI6rHBXH+078t0z"
+    "LzKwsLiCRkwkzpqFYPkrhOOYBnyQKnOnny+uLfVXU9ffX2smpawxdciqjjqaKOG3sLKddc"
+    "fE1JZvR9FIZCcoqRbbCD43RotuyjSIHaR5Z7J0XHKMNUYO26k6LUkWrZ305bKWiwcx9onl"
+    "TnR4KxSHeeSIisKfe5iDzux1Ba8p+ZCNrBIbL7YygkrFsTQ6Hh3vYYCo3NdomhsAHt9mBG"
+    "6s/hT8g0Mci6aphqbTDDgYXWUCVoo+gW2RGm3RNVGe9BRJxFxFlEnEXEWUSc5bHFWQ4qc8"
+    "CsR1NLxxYOuUgDrl1yDkoDPkbBqYfObqS7g1MXcWJVIgZjN0aoE3EIrCdmNxqyF3m3/Z86"
+    "wHOEQhzlYOUgpM8j6XqPsxLCkXrRsARZNcf9IXNlD2XTQRO1Vmz94KLWmI0IB+80uJ9aY0"
+    "v2NJSjZir63F+VehkzrTmrU6vYAoZQr+fVZg8b8LeBHL8iRXguzYc0Fo1Q2PiKQ1u2kmyn"
+    "/fEulbPZqq2Zl4LbpNezTkEvCxZOsHCChRMsnGDhHmY57YNCtZWC2nmqjWyRpUyD2I6jAf"
+    "vhOBpNfFZ9x6cLmm4gSHBzkDKllOc/koBHKVnzcbPQr6MvKJxdPUt1AHUS8GP1B1VXO4Cq"
+    "q42gwq1KCdgND6Zp69G5O0MnSeO+pl39Pg0YiQmGjWi+hOSy1MiwgjX/ywV9GO7hLitdxr"
+    "usNA94uFdG1dlG3zI+qCukjMjo3VT3VB+8VlJxX4cdJUX+Yx+Mj5JrGtXwL83wRnWBkRGQ"
+    "VV2PLGVumhYDPpU3HUxXdpxgXxeFPWzGquwAVuOgyKf7o1SSPpLmxHvugt+AfCAGIwWm1U"
+    "FA3zcB/roeyi5LTkzVpp9mDaU0GVVvvlnI0MFGlJFNyj/hNxkoLfvBqf9xRZhzLgsizJrn"
+    "KyxrBXmJqg00qyZ1je8PHnT+im3qPt54WXJig41lBn/muTRV0nKL7JjvtJo9wdGNFFal2s"
+    "KCTx31yoo50rFL6XBw7vhhplKjY8wagmkcjqXnKxzIRHgMhq7vuGAwEqdbMe6nl063ALSk"
+    "duxqHUTuxI6+BZNOiWTXbA6mu/DmchwYcG6NJmanOdQEEotzHtpjiGHRrkv00PaA6ZRNDc"
+    "LCEMAzDES2VnimSXchprc1JyspZNKd76ZpA8VkETF2MrFIeiO50h4+PO2vi8R8ERIUIUER"
+    "EhQhweFDgkmQrPiK7VCB8YOB7GpT7Kzv5YR0YkqVFqZUqat0EMfYWuABlxGZGLyqBgUoLF"
+    "Pu52d0czTaPI2aWvRhUhuTukbfGxZ4RmRa8JoOImSVq7F20+EMyfN/X5emob0qEPlU9Ort"
+    "m7/T5tXSEF2qczUaVbT52HRgpRaXzFquM1LLVYcNyqpqzxagEF1P/zcOEwhFwXgmDtp+dN"
+    "LC9HyAzwcwLZXUPyG1aVgPwJIkrjonJ5hMYhRiu2W12se89bBYVuyEZ8U2uoWlw2LJIYgW"
+    "IcANlDpsEKdNs4h7+ud1kA9/lGxNwKG5QBArM7EiQawKiuRtyJjBvgcUmzB187ChceoSQB"
+    "n9wqUgVmbCCipGxENWEHG5I04Otiw0+ma7fse3HpmLzTA6HR07PqJdOdly9zngMOYtclHw"
+    "dZB9diMdr1vLfx6G9qEbpe7dBdPMXZeB7LAHhpPEZtjf9EjitEqo4ThyXbDLQMDgaMiGNj"
+    "qUeklj+KbjO3MwNyFZx1I94E91S8I3NDcvq1fOB+i4N2bEp6ohvT/mAaEM58+122iycRjE"
+    "EDBOd1qh1Wp5G3heuk+ToWWre2zYW4JUF6S6INUFqS5IdV5SnZl6OcgERmpyXEK+ok2JLQ"
+    "C0euXK2RNNlCtg/rkT5Sr2CscYqkhObRyp2MEpm4Qsz1CYh1MaZQykPQbbvvTExlyTff4z"
+    "j7/UveDjkEoy42fyHeKJDx3MeeBJkWkAJ3WFRYLkFFAdLFlyf9APgObjod6qeJbmuCmln9"
+    "JCUTUcHlNDqp3A82mrDsydrplGyosBw6Wr+QE/WajE1xb0ECBs8hBdWFCxeUH8REOBSLux"
+    "kMhefWgv2felnJ7gF7uUqYkTvCKnCTpVFq3MglfvMsWNBMcmODbBsfGZrYJjExxbdWdqPh"
+    "N3TZJiRE54VOQqcm3COuyPY2YpquanEan5OgiDaB4vOir7yAdDRtvgJgjtrA4gB/B7guNn"
+    "X2abFi3XYW2LdENdL7SPsY0RTDJusEtCEwCa6eSTBRp956ptkzUfPdmSxZM914StjKUi+F"
+    "tTFWf26+yA8xoHn03WAV+/pu1HRv01LGnsfN0HzaNUZomD/9YAehncNBdryCQmwDGxM4Ol"
+    "wHZAVyoOUiQV3UzF5KvZlroXlqIsFoYiLXRTUw1DM6Xcz9i/1eZwXF79HXyOkkL2yb741l"
+    "Y0ncssySVG7trvf7vAD9KQ7+hW6sIuHPD2ZNeDbZ8mnNNk2aY7pfJvkfMHchNSXZjHVilJ"
+    "TWH99LECTFeXZ/iZigo1BaORHWSt+2beunx873TS7J2d+wVxLbWFxMiD45I8SIo/NctnsO"
+    "MMQDY07YAdDUdZDX7iA0yOcyp7Ru/xmuNVudGx3S/v36Wo6nRKjBAmlVcLJaEJqqD+hAX2"
+    "xKlpK+UxbDuoamWcYDETKOgIIyMxOQwPOztEbOkYurcOuqWj2m0HAHK0g4COfdxNFWBm0H"
+    "JvmDlmJPlZ4CbP7MQ+qwkl5/fO7z15GLckJ/J0DSinHr4mG2b5+BvW/0/vWqZh3RMrPuzL"
+    "ajdeQDfFSvVI1/1qr3b7my9EKFeEckUo968ilNuibhHKPasJ5ZYm164eXUnoWDRd5xmTXV"
+    "TYUK7hy5DfZ0q96uYcqYC7g2rqXLTUFqECUyBDmZWdVHwyHCNf2XV9ASlfFjmTTFocQEYf"
+    "BfjUbOAAPheYFvA5tCbNsrN0VStHeicIfxxta1aT5thY1vx0sTGpdsVYWFCcCJldT4AYmI"
+    "54XAXgJ3XEeJzc8ZXeywVGJzB1k3DFvgRV8y3TcvOjS8mkbDqO1BBGnAhf+RNHRwYL7O0x"
+    "a+MxFtepLmoZC3LvvBNjkdCmnIxFOXmvSjJoiqTTNp15i75fKWolC55C8BSCpxA8xfA8BW"
+    "/QeVJJuMXakYeUJ+Oa8XI/w9I+/def0oKdMz35gq0p5NRZOFSO2sWuPjWvWPh3xzvNS/gY"
+    "j8THeBqFfnBzVuNhZHfu9S/col2Xynj5uZ/gQLsKjWNaMmxwNfwimsnm5Jq+B+UrTNWlRx"
+    "tmJ664EjnF0lBphTr2ezoEVMd+HOHUCKdGODXCqRFOjXBqmMpNzKoxQaeGc9/JoBtO+q8+"
+    "paUYr0EPyplpiLA2HwgzoQhrqTdLC7cbqG3z0DEOfxHuonAXa02pabiLlSKszi5YJQFvDc"
+    "my4NRKSKa1rbIJes//arqb7QKXVZlEZ0kICRKeLV3n2iPYtj32sJKTE/H0X0U3QYg/zmp8"
+    "/fze+X3e/gpawmdnh18n4T5fIzXhEGTT+J7R7JDf07xLKStRBV541sKzPq1nffJCoEOu8e"
+    "UDktjsnmwHum3YPeozDFpmldebZWVGN6Kq+3D7mVJDp0oFGx5A09YjQ3n1e17t0VB7MQLD"
+    "wwgFveixRZ0zrxmZ8XsnY3Ok4BpS9Wz3w9L8jsIJONvoW22V4JaaE4XI6KjrngohE8sFjP"
+    "VDT6M7diePaqiBllIrdbzACBCrrkd21LvlSNeUgT41DzPoRFJhYmCathbgmHqKNpNhBZTh"
+    "mmKNlPM+wsHdw04ZtBJ2n7462FHoE3Ho324AdwxOg1Nfun9+n2Mf0dY8zj07wbDeOs3rtQ"
+    "kpA5+Vuy3lsAf4ygFJAnqLmtKCQBAEgiAQzgWBIAgEQSDgpXTHt9GtkBgd0tJCa0OZS83Q"
+    "uh5+c2RgsdnBSSgUEpMC9rBiukfosdggimpm2Tb7n0qMn0lgOj6JxaokTxMoGt31tH6ETC"
+    "c+poWOqSK723KVHsiaTwnTD+9e9eukxwhxC2p2mM3A+K3iomBV1+yhqtzoc2p55FcLX5ny"
+    "gviDKsklkNBAcf+j5Blhk3mDnwD10ElFcHSlaGSh05Cl1ilFV6Fohklyj6arDkE3HrPi52"
+    "7bEBlqLvnJiIwOsCnBEbbgpT9Zx385HYYTIRjf38UvI+eshlrM7pzfRyr+kTXqUnWAzNva"
+    "wifFKn1ygLBd7Dh0fKgKL+vavPgPUCiGo1pAoRg+q66yEd5emuBUv9uZlGw8aa+YepjtCJ"
+    "U7fhAG8a0gKAVBKQhKsXdI7B3quXfoC4aSxwOl7cf359k1rHr0HtiHpjIjzDn6vom2yTyv"
+    "Z5xdmIbfmgQJH6+aC0xLARPcvNXk8LQVZ2vweI4I7tkGhR4g1cXvydrOt7swhH/jneuiOJ"
+    "77drBC3hx37GCL+h3JN/jZcJttBLMUj8fJioxcs9H0PWIb2NlZWtIvsiSNGdhKosSu4V0b"
+    "sczbj+5b6hIYtLqhy5Q8yc+/AvfCQBpdj6cRQsS9EAYV4vEcSjIjd13N8xWymwtqM6hQZK"
+    "7AfhxEH3gyloE8KHZhkBKZDjEidQnNWQ7qEz2MVkc9CfEjhBbwVIpfbNnvDL1a4Umpojhv"
+    "cpY93pRQ73Xub53sRDEn+xEdWCgNr3+mgjjmrStB8RCPecP29LYfk1CWHIBJGFQtvkQCEO"
+    "m543xEwgMhDigYrUQRy8By6rciOjEF0xlP839uBT+GEwGrc+iIsa1HcmpdP0R/0H4yxKl1"
+    "40QJL9A2cG/PaqKE2Z3ztiihXbS5L0hIkd8H9eepoteMwYmjX1/RNuZM0WRERmZpu6N4fL"
+    "MchgYHiFnzhwngkUoshwkKa2ytl+/fvmlYjAuRCpAfQvyCHyEocj5bBXHyeZqwtqAIb12y"
+    "pPaypKoJURUTCb7gcuwklB//B6xKdlU="
+)
@@ -0,0 +1,133 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "sys_job" ADD "owner" VARCHAR(64);
+        ALTER TABLE "sys_job" ADD "heartbeat_at" TIMESTAMPTZ;
+        COMMENT ON COLUMN "sys_job"."owner" IS '执行实例 ID';
+COMMENT ON COLUMN "sys_job"."heartbeat_at" IS '执行实例最近心跳时间';
+        CREATE INDEX IF NOT EXISTS "idx_sys_job_status_b91b9e" ON "sys_job" ("status", "heartbeat_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sys_job_status_b91b9e";
+        ALTER TABLE "sys_job" DROP COLUMN "owner";
+        ALTER TABLE "sys_job" DROP COLUMN "heartbeat_at";"""
+
+
+MODELS_STATE = (
+    "eJztXWmTm0jS/iuK/jQb0TPNfWzE+6Hbx057fUzY7d2NHU8oOIpuxhJoBbLdu+H//lYWFB"
+    "QI1BQCQbfri9yGSgmerCPzyays/52tYx+tkl8+Jmh79tfF/84iZ43wH5Xr54szZ7Mpr8KF"
+    "1HFXpGFynyx3tJWbpFvHS/H1wFklCF/yUeJtw00axhG0/rQzdcX6tDMU1cSfjiJ/2umm5X"
+    "7aqZKkwHf4sYe/JIxuuzXfReF/dmiZxrcovSPv8Psf+HIY+egbSuC/v+Nn2KTL0IfmYbLE"
+    "zxd+QWd/QLPN52UQopVfefWsJbm+TO835Np1lL4kDeEJ3aUXr3brqGy8uU/v4qhoHUYpXL"
+    "1FEdo6KYKvT7c7gCParVY5chSh7A3KJtmjMzI+CpzdCkAF6SZMNaRiSGxdQdfP6xjmMl4c"
+    "gW7wkyXkZW/hF39WZM3ULNXQLNyEPFVxxfyevWqJQyZI0Hh7c/ad3HdSJ2tBoC4x9LYIXn"
+    "zppPtYPsd30nCNmgGtStaA9XPRX+gfdZgpqIdwphdKoMvO+hDSuiJjpHXcDndHPTAA9UDr"
+    "iDl+M/9dtLrPVXsA4JvrNy8+3Fy++Q2+eZ0k/1kR4C5vXsAd0vHX97WrPxl/gesxHoDZyC"
+    "y+ZPHP65tfF/Dfxb/fvX1BcI2T9HZLfrFsd/PvM3gmZ5fGyyj+unR8phfSqxQu3LJU927j"
+    "91R3VXJu6jaMQANFu9IPrO784Rlt4+me/L2n62d3zrZFz4xMTcsYtD567T9dsmuKrkl+R3"
+    "2unW/LFYpu0zv8X106oM9/XL5/9uvl+590qaajt/kdhdz6XkF14yTJ13jrL++c5I4H2j3B"
+    "YfA9app0PTxWTEuC9VrzLJgyJa8PzoqudwAat2pFmtyrQo1H5mrJ24MrQtNDbJpyAEDbCH"
+    "/avjqnrox/Zxv7O488LQfEdbleKOfTwCAga0hx4NPFn6ZrSfC3586mHztfsP215UG4lJgc"
+    "W91W8dqqS14wGzzv4jVabpyUa/qtCE2Oqm3bYKVYpv5pZ+HmGOHA6mqxjI9w6X/tIXwVxy"
+    "vkRC0zAytXA9nFgmPNvoVNsWcYKgCtphjkM8iMim4wH0D16t271xUb8Or6pobuxzdXL97/"
+    "JBPQcaMwzfzT3CMrkWac3o6uLCPxsD87cjc2FA1Ptrqn49XNlpAFhjfqiO8Qvi2QA8HnRt"
+    "cWYNpH9WW8ReFt9Hd0T8C9xk/kRF5Td82Zlef51zwSUL/T3kKvls+2db4WLArbifA74zdF"
+    "WQf98OJm8fbj69dnBFrX8T5/dbDJ2oJxgpIEP3bSMEvkki///h6tnBZDgSGvPmTfdHLrrH"
+    "AxjoO3MqQTFKXYJ0tDDx2JzFvyJade8FVfJo6AmplUAyIzCCjQXToDMyzNoDo6EAyqMVLP"
+    "CcLVseh8uE9e4m85uQEugQEeKNLgfebP2D0eklexe+pRxDCQAyACs3GsxMwsXJmf92+tlX"
+    "XjlL2NG7vYGye6v4nhs+O6+D7u1MlGooMs21fwp2LiT1028UxlekFHh+/AEknebVmLrdA3"
+    "3UJHQ/6SpdcyJOMtUcJndE8RzpfWQj/5LRqEyW+nd9t4d3tXubPNf62yKj+7/PDs8jmhCJ"
+    "d7gJO+sXYi55Zcg5f+fl59+oaIEX2rwxEj+jRdIkasTtgQUBBI1vury2fkL7s1gsQr/nBE"
+    "SUSORORIRI5E5EhEjngjR7yc+3zo9ophoEk+NgzsQJoH3e7hNZYHVdp+6jgci6kZyEXECF"
+    "ZmapZpyAK2QjFhNJkacR0ltHj1z5sFsTiz1XseesCmbbprsIFbTYBSoBfh1quDy40msOJi"
+    "9A0pQ192ZJbVXEjQ2S2Zh+McxkpgI3ZrZ/uZL1xHJSbn5HVbguwlrzOBOT4PT8yvxIs3XB"
+    "NHVep0k3LBue4vs7oJC6xq4EnCUoFZ0snCC53YWa0uvF2SxusLkCcfSyfyl95duPK3KLpI"
+    "0Kpf8KnL1KG0Tx0KmTr2OOZ2ZnQwLx0wGMJL78hej7RYtGm9JLWzRaTsr/+XdYQFNcZMHa"
+    "Lnhq5ZPAsIr4dPUap7+GTlWtbGYNXZZ3j0Jmef4QJqzj65Q8cLh7PPzg5rFDWtY9y95A3+"
+    "nul6iaX6HrDOun5BbQfb0KXxiR362o1qb9A1wN1f1+v813rqumSbjtM1zRR++rwdfdOu6q"
+    "2Rc3UVt6uXn7crKN1W2o70zQbajvbZw7Qd7WudaLti+O3zblXrXlcci1qfWc6CqatyZulX"
+    "R64pufZDdN+JflbQhIImFDShoAkFTfjUaMIjrE9m7SlJQrr2lGvMAh6YXMbNbVMiNqkBWd"
+    "IeydDRgXrBy5A0J3aLoMqhFNr+hDQBNU8OKsb0TLc0CmTHw0vMKr69AOELtHaR7yP/YhVG"
+    "ny/cXZpmCQDTMATV7QF8aamDZqQeMSQYw6rMR6VDwlDBpLI1B8wxFZFer0KutWM6/fv+KI"
+    "yZF683cYSihgXoENPOCE3PQyoaTEkO0QjyNEAblhzDAn7SIns2Mr3otqUsLrDFn6J1NjBW"
+    "YZICe6LIxuL65RaD8o8QfZ2ZjrIUYe4M7prY5HoyAg/MAR9sbnbm2h8/lRiJ45O/HTQ3re"
+    "zSuyVvjKoiNPEcxrqC+2OlSjMVE9oFTevD85pacydplKuXjmSpy9qCW7XqiNz7XmP8Umdf"
+    "Pa8+vHvbrB7avqaZjxEG7Xc/9NLzBcwYf5x45FQMMJlECwMkg5NvBMXcZgSI6lElzn/2t2"
+    "3ZVnFFtYFIQhbMlK5m9yCJm5QDeFYscKqTn95c/quurmev313VTWv4gisRdTxV1HHjbCHl"
+    "mouvqchMvo/CVEhOMXJMdnCcDs0D+ygyoPaR5d5J0THKMBdYu+6kqHSkRva301YKGuzcB5"
+    "on1fmJYCzSnWcSImvLfS4jj/sxlAP5z0wE7egQ2cMxFBLWbYih0HDv4RgKjc12iaGwAe3D"
+    "wYzMn8OfkGliknXVtLTGYIYLC62pSdBGMWyyI0x/IKoy3YOIOIuIs4g4i4iziDjLU4uzHF"
+    "XmgFmP5paOLRxykQbcuOQclQY8RsGpx85uZLuDMxdxZlUiBmM3JqgTcQysJ2Y3WrIXebf9"
+    "nzrAM0IhjmqwchDS54l0vadZCWGkXjQsQVbPcX/MXNlj2XTQRq2VWz+4qDVmI8LROw0ept"
+    "bYkj0t5aiZij4PV6VeJkxrzurUGraAIdTr+43Zwyb8bSI3qEkRnksPII1FJxQ2vuLSlgdJ"
+    "ttP+eJfK2WzV1txLwW2y63mnoJcFCydYOMHCCRZOsHCPs5z2UaHaWkHtItVGtslSpkNsx9"
+    "WB/XBdnSY+a4Eb0AXNMBEkuLlImVPK859pyKOUvPm0Weg38WcULa6fZzqAOgn4sfqDamgd"
+    "QDW0VlDhVq0E7IYH06z15NydaZCk8UDXr3+bB4zEBMNGNF9CclVqYljBmv/5kj4M93CXlS"
+    "7jXVbaBzzcq6LqbuOvOR/UFVJGZPJuavhaAF4rqbhvwI6SMv+xD8aj5JrGDfxLO7xxU2Bk"
+    "AmQ1zydLmZelxYBP5c8H05WTpNjXRVEPm7EuO4DVOCjy2f4ojaSPZDnxvqfyG5CPxGCkwB"
+    "x0ENC3TYi/roeyq5IzU7UVZFlDGU1G1VtsFjINsBFl5JDyT/hNBkrLfnTqf1oR5oLLggiz"
+    "7gcKy1pBXqLmAM2qS13j+4MHnb9gm7qPN16VnNlgY5nBH3kuzZS03CIn4TutZk9wciOFVa"
+    "mu2vBpoF5ZMSMdu5QNB/eeH2YqNTnGrCGYxeFYer7GgcyEx2Do+o4LBiNxuhXjYXrpdAvA"
+    "gdSOXaODyJ3Y0bdg0imR7JrNwXQX3lyOIwPOB6OJ+WkODYHE8pyHwzHEqGzXJXro+MB0yp"
+    "YOYWEI4JkmIlsrfMuiuxCz27qblxSy6M53y3KAYrKJGDuZ2CS9kVw5HD487a+LxHwREhQh"
+    "QRESFCHB4UOCaZiu+IrtUIHpg4HsalPurO/lhHRiSpUDTKnSVOkgSbC1wAMuIzIzeDUdCl"
+    "DYltzPz+jmaBzyNBpq0UdpY0zqBn1rWeAZkXnBa7mIkFWeztpNxzMkL/51U5mG9qpAFFPR"
+    "63dv/0ab10tDdKnO1WpU0eZT04G1Wlwya7kuSC1XAzYoa5qzUEEhhpH9bxomEIqC8UwctP"
+    "3kpIXlBwBfAGDaGql/QmrTsB6ALUlcdU5OMJkkKMJ2y2q1j/nBw2JZsROeFdvqFlYOiyWH"
+    "INqEADdR5rBBnDbLIu7pnzdBPvxRsg0Bh/YCQazMzIoEsSook7chYwb7HlBswjKs44bGqU"
+    "sA5fQLl4JYmRkrqBwRj1lBxOWOOTnYqtDkm+36Hd86MhebY3Q6OnZ6RLtystXuc8RhzFvk"
+    "ofDLIPvsJjpet5H/PA7tYzdKPbgLpp27rgLZYQ8MJ4nNsL/ZkcRZlVDTdeWmYJeJgMHRkQ"
+    "NtDCj1ksXwLTdwL8DchGQdW/OBPzVsCd/QvaKsXjUfoOPemAmfqoH0/r0ICOU4/9G4jSYf"
+    "h2ECAeNspxVarZZ3oe9n+zQZWra+x4a9JUh1QaoLUl2Q6oJU5yXVmamXg0xgpGbHJRQr2p"
+    "zYAkCrV66cM9NEuRLmHztRrmavcIyhmuTcxpGGHZyqScjyDKV5OKdRxkDaY7DtS89szLXZ"
+    "5z/y+MvcCz4OqSIzfSbfMZ740MGcR54UmQVwMldYJEjOAdXBkiX3B/0AaD4d6q2OZ2WOm1"
+    "P6KS0U1cDhMTWkDhN4AW3VgbkzdMvMeDFguAytOOAnD5UEukoPAcImD9GFDRWbVeInmgpE"
+    "2k1VInv1ob3kPJRyeoJf7FKmJknxipwl6NRZtCoLXr/LFDcSHJvg2ATHxme2Co5NcGz1na"
+    "nFTNw1SYoROeFRkavYcwjrsD+OmaWonp9GpC7WYRTGF4naUdkjHwwZb8PbMHLyOoAcwO8J"
+    "Tp99mW9atD2XtS2yDXW90B5jGyOYZNxgV4RmADTTyWcLNPrGVdsmbz55siWLJ3uuCVsZS0"
+    "Pwt64p7uKXxRHnNQ4+m6xDvn5N20+M+htY0tj5ug+ao1RmScL/NgB6Fd62F2vIJWbAMbEz"
+    "g63AdkBPKg9SJBXdLMXiq9mWuRe2oqiqqUiqYemaaeqWVPgZ+7cOORxX138Dn6OikH2yL7"
+    "lzFN3gMksKiYm79odfL/GDtOQ7erW6sKoL3p7s+bDt04JzmmzH8uZU/i12/0ReSqoL89gq"
+    "Fak5rJ8BVoDlGfICP1NZoaZkNPKDrI3AKlpXj++dT5q9u/M+I66ltpSYeHBckQfJ8Kdm+Q"
+    "J2nAHIpq4fsaNhlNXgBz7AZJxT2XN6j9ccr8tNju1+ef8uRVXnU2KEMKm8WqgIzVAFzScs"
+    "sCdOzVspT2HbQV0r0wSLmUBBRxgZidlheNzZIWJLx9C9ddAtHfVuOwCQkx0ENPZxN3WAmU"
+    "HLvWFmzEjy89BLnzupc9YQSi7unT948jBuSU7k6RpQzjx8XTat6vE3rP+f3bUt034gVnzc"
+    "lzVuvIBuipXqk677xVnt9jdfiFCuCOWKUO5fRSj3gLpFKPesIZRbmVy7enQVobFous4zJr"
+    "uosKFcM5Ahv8+SetXNGamAu4sa6lwcqC1CBeZAhjIrO6n4ZLpmsbIbhgopXzY5k0xSjyCj"
+    "RwE+Mxs4gC8E5gV8Aa1Fs+xsQ9Orkd4Zwp/E24bVpD02ljc/XWxMalwxVBuKEyGr6wkQA9"
+    "MRT6sA/KyOGE/Se77Se4XA5ASmYRGuOJCgar5t2V5xdCmZlC3XlVrCiDPhK3/g6Mhggb09"
+    "Zm06xuIm00UjY0HunXdiLFLalJOxqCbv1UkGXZEM2qYzb9H3K0WtZMFTCJ5C8BSCpxiep+"
+    "ANOs8qCbdcO4qQ8mxcM17uZ1jap//6U1mwC6anWLB1hZw6C4fKUbvYM+bmFQv/brzTvISP"
+    "8UR8jGdxFIS3Zw0eRn7nQf/CK9t1qYxXnPsJDrSn0DimLcMGVzMoo5lsTq4V+FC+wtI8er"
+    "RhfuKKJ5FTLE2NVqhjv6dDQHXqxxFOjXBqhFMjnBrh1AinhqncxKwaM3RqOPedDLrhpP/q"
+    "U1mK8Rr0qJyZlghr+4EwM4qwVnqzpHrdQD00D41x+ItwF4W72GhKzcNdrBVhdXfhKg15a0"
+    "hWBedWQjKrbZVP0Hv+V9vdfBe4rMkkOktCSJDwbBsG1x7BQ9tjjys5ORNP/3V8G0b446zB"
+    "1y/unT/k7a+gJXx2dvgNEu4LdFITDkE2TeCb7Q75A827lLISVeCFZy0869N61icvBDrkGl"
+    "89IInN7sl3oDum06M+w6BlVnm9WVZmciOqvg+3nyk1dKpUuOEBNGs9MZTXvxXVHk2tFyMw"
+    "PIxQ0IseW9Q585qRmb53MjZHBq4p1c92Py7NbxROwN3GXxurBB+oOVGKTI664WsQMrE9wN"
+    "g49jS6sTt53EANHCi10sQLTACx5vlkR71XjXTNGehT8zCDTiQ1JgamaVsFx9RX9IUMK6AM"
+    "1xR7opz3CQ7uHnbKoJWw+/TVwY5Cn4lD/24DuGNwWpz6yv3zhxz7mLbmce7ZCYb11mler0"
+    "NIGfis3T1QDnuArxyQJKC3qCktCARBIAgC4VwQCIJAEAQCXkp3fBvdSonJIa0stA6UudRN"
+    "vevhNyMDi80OTkKhlJgVsMcV0x2hx2KDKG6YZQ/Z/1Ri+kwCyw1ILFYjeZpA0Rier/cjZD"
+    "rxMQfomDqyuy1X6YG8+Zww/fj+db9OOkaIW1Czw2wGxm+VlAWrumYP1eUmn1OrI79e+MqS"
+    "VeIPaiSXQEIDxf1HyTPCJvMGPwHqoZOa4ORK0clCpyNba1KKoUHRDIvkHs1XHYJuHLPi52"
+    "7bEhlqL/nJiEwOsCXBEbbgpf+0Tv5yOgxnQjB+uE9exe5ZA7WY3zl/iFT8M2/UpeoAmbd1"
+    "NSDFKgNygLBT7jh0A6gKLxv6RfkfoFBMV7OBQjEDVl1VI/xwaYJT/W5nUrL1pL1y6mG2I9"
+    "TuBGEUJneNt+6Qs01d/JWCvBTkpSAvxb4isa+oi7r39hV9xlDyeKe0/fS+Pru+1Y/lA9vR"
+    "UhaEVUffNvE2vShqHecX5uHTpmHKx7kWAvNSwAw3drU5Q4cKt7V4QyOCe7ZBkQ9IdfGJ8r"
+    "YX210Uwb/JzvNQklwETrhC/gXu2OEW9Tuub/Bz4zbbGGYpHm+UFZm4nqMV+MQ2cPJztqSf"
+    "ZUmaMuiVxqnTwMm2Ylm0n9zvNCQwaA3TkCmxUpyNBa6HiXS6Hs8jvIh7IQwqxOM5VGQm7r"
+    "q6HyhkpxfUbdCgAF2J/TSIPvJELRP5UAjDJOUzXWJEGhK6YPmpT/SgWgP1JMtHCDvgqRS/"
+    "2LLf+XqNwrNSRXkW5SJ/vDmh3utM4CbZmWJO9iq6sFCafv8sBnEEXFeC4jEeARd/jfgy+g"
+    "uByaE3FMOkRZGy4ulaYLmLzpTcyGemVtjPPYAPszR12QF4mvGRhwkIDHBsl4O3GXgqLLyB"
+    "yk/lPBLqhgJ2kKrDDuu2H1VXlZxZF9ADiUT/PPfHVi8b/uDUb010ZgqmJoUe/NgKfgrHcd"
+    "aNlAkDy0/kyMh+iH6n/WSIIyOnCdFfom3o3Z01hOjzO+eHQvRO2eahCD1Ffh/UH6eEZTsG"
+    "Jw4vf0HbhDM/mhGZOAzSHcXx/V4YGhwg5s0fJ4Aj1TePUhQ12FqvPrx727IYlyI1ID9G+A"
+    "V/h6jj+WIVJukf84T1AIrw1hVLai9FsZ6NWDOR4Auups4A+/7/PPORiA=="
+)
@@ -0,0 +1,58 @@
+"""测试公共夹具：SQLite 内存库与 fakeredis。"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from tortoise import Tortoise
+
+from app.core.database import TORTOISE_ORM
+
+_MODELS = [m for m in TORTOISE_ORM["apps"]["models"]["models"] if m != "aerich.models"]
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[None]:
+    """每个测试一个独立的 SQLite 内存库（按模型直接建表，不走迁移；时区设置与应用一致）。"""
+
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": _MODELS},
+        use_tz=TORTOISE_ORM["use_tz"],
+        timezone=TORTOISE_ORM["timezone"],
+    )
+    await Tortoise.generate_schemas()
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
+
+
+@pytest.fixture
+def redis_server() -> FakeServer:
+    """同一 FakeServer 上的多个客户端共享数据，可模拟多 worker。"""
+
+    return FakeServer()
+
+
+@pytest.fixture
+async def redis(redis_server: FakeServer) -> AsyncIterator[FakeRedis]:
+    client = FakeRedis(server=redis_server, decode_responses=True)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+@pytest.fixture
+async def redis_peer(redis_server: FakeServer) -> AsyncIterator[FakeRedis]:
+    """连接同一 FakeServer 的另一个客户端（模拟另一个 worker）。"""
+
+    client = FakeRedis(server=redis_server, decode_responses=True)
+    try:
+        yield client
+    finally:
+        await client.aclose()
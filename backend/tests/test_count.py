@@ -0,0 +1,39 @@
+"""列表总数统计：带上限的精确统计。"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.config import settings
+from app.models.log import LoginLog
+from app.utils import count
+from app.utils.count import count_rows
+
+
+@pytest.fixture(autouse=True)
+def no_count_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(count._count_cache, "get", lambda _key: None)
+
+
+async def _seed(n: int) -> None:
+    await LoginLog.bulk_create(
+        [LoginLog(username=f"u{i % 2}", status=1, message="ok") for i in range(n)],
+    )
+
+
+async def test_capped_count_under_cap_is_exact(db: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "COUNT_EXACT_MAX", 10)
+    await _seed(12)
+
+    assert await count_rows(LoginLog.filter(username="u0"), approximate=True) == (6, False)
+
+
+async def test_capped_count_over_cap_is_approximate(
+    db: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "COUNT_EXACT_MAX", 5)
+    await _seed(12)
+
+    assert await count_rows(LoginLog.filter(username="u0"), approximate=True) == (5, True)
+    assert await count_rows(LoginLog.filter(username="u0")) == (6, False)
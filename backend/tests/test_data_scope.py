@@ -0,0 +1,71 @@
+"""数据范围：批量访问校验。"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.user import CurrentUser
+from app.services import data_scope
+from app.services.data_scope import DataScopeResult, assert_can_access_many
+
+_SCOPE = DataScopeResult(
+    allow_all=False,
+    allow_self=True,
+    user_id=7,
+    dept_id=1,
+    dept_ids=frozenset({1, 2}),
+)
+
+
+@pytest.fixture
+def computed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """记录实际计算数据范围的次数（绕过跨请求缓存）。"""
+
+    calls: list[str] = []
+
+    async def compute(current_user: CurrentUser) -> DataScopeResult:
+        calls.append(current_user.username)
+        return _SCOPE
+
+    monkeypatch.setattr(data_scope, "_compute_data_scope_result", compute)
+    data_scope.invalidate_data_scope_cache()
+    return calls
+
+
+def _file(dept_id: int | None, creator_id: int | None) -> SimpleNamespace:
+    return SimpleNamespace(dept_id=dept_id, creator_id=creator_id)
+
+
+async def test_batch_check_computes_scope_once(computed: list[str]) -> None:
+    user = CurrentUser(username="alice", roles=["staff"])
+    records = [_file(1, None), _file(2, 99), _file(None, 7), _file(5, 7)]
+
+    await assert_can_access_many(records, user)
+    await assert_can_access_many(records[:1], user)
+
+    assert computed == ["alice"]
+
+
+async def test_batch_check_rejects_any_record_out_of_scope(computed: list[str]) -> None:
+    user = CurrentUser(username="alice", roles=["staff"])
+
+    with pytest.raises(HTTPException) as exc:
+        await assert_can_access_many([_file(1, None), _file(3, 8)], user)
+
+    assert exc.value.status_code == 403
+
+
+async def test_batch_check_custom_fields(computed: list[str]) -> None:
+    user = CurrentUser(username="alice", roles=["staff"])
+    records = [
+        SimpleNamespace(owner_dept=2, user_id=None),
+        SimpleNamespace(owner_dept=9, user_id=7),
+    ]
+
+    await assert_can_access_many(records, user, dept_field="owner_dept", owner_field="user_id")
+
+    with pytest.raises(HTTPException):
+        await assert_can_access_many(records, user)
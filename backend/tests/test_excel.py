@@ -0,0 +1,103 @@
+"""Excel 导出：spooled 输出、提前结束时的临时文件清理。"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from io import BytesIO
+from typing import Any
+
+from openpyxl import load_workbook
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
+
+from app.utils.excel import ExcelColumn, stream_xlsx, xlsx_stream_response
+
+_COLUMNS = [ExcelColumn(title="编号", key="id"), ExcelColumn(title="名称", key="name")]
+
+
+class _Batches:
+    """按批产出行数据；记录已产出的批次数以及是否被关闭。"""
+
+    def __init__(self, count: int, *, block_after: int | None = None) -> None:
+        self.count = count
+        self.block_after = block_after
+        self.produced = 0
+        self.closed = False
+        self.blocked = asyncio.Event()
+
+    async def __call__(self) -> AsyncIterator[list[dict[str, Any]]]:
+        try:
+            for i in range(self.count):
+                if self.block_after is not None and i == self.block_after:
+                    self.blocked.set()
+                    await asyncio.Event().wait()
+                self.produced += 1
+                yield [{"id": i * 10 + j, "name": f"n{i}-{j}"} for j in range(10)]
+        finally:
+            self.closed = True
+
+
+async def test_stream_xlsx_writes_all_batches() -> None:
+    batches = _Batches(3)
+
+    content = b"".join(
+        [
+            chunk
+            async for chunk in stream_xlsx(sheet_name="导出", columns=_COLUMNS, batches=batches())
+        ]
+    )
+
+    rows = list(load_workbook(BytesIO(content), read_only=True).active.iter_rows(values_only=True))
+    assert rows[0] == ("编号", "名称")
+    assert len(rows) == 31
+    assert batches.closed
+    assert not ALL_TEMP_FILES
+
+
+async def test_cancelled_export_stops_and_removes_temp_files() -> None:
+    batches = _Batches(5, block_after=2)
+
+    async def consume() -> None:
+        async for _chunk in stream_xlsx(sheet_name="导出", columns=_COLUMNS, batches=batches()):
+            pass
+
+    task = asyncio.create_task(consume())
+    await asyncio.wait_for(batches.blocked.wait(), timeout=3)
+    assert ALL_TEMP_FILES  # write_only 工作表已落到临时文件
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert batches.produced == 2
+    assert batches.closed
+    assert not ALL_TEMP_FILES
+
+
+async def test_response_closes_body_when_client_disconnects() -> None:
+    closed = asyncio.Event()
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            for _ in range(100):
+                yield b"x" * 1024
+        finally:
+            closed.set()
+
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            # 第一个分块发出后客户端断开，之后的发送不再返回
+            disconnected.set()
+            await asyncio.Event().wait()
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.3"}, "method": "GET"}
+    await asyncio.wait_for(
+        xlsx_stream_response(body(), "导出.xlsx")(scope, receive, send), timeout=3
+    )
+
+    assert closed.is_set()
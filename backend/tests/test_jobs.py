@@ -0,0 +1,193 @@
+"""后台任务：用户导入任务、过期结果文件清理、执行进程心跳。"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import UTC, datetime, timedelta
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from app.api.v1.endpoints.system.user import _user_import_columns, _user_import_job_handler
+from app.core import security
+from app.core.config import settings
+from app.models.job import JobStatus, SysJob
+from app.models.user import User
+from app.schemas.user import CurrentUser
+from app.services.job import JobContext, JobRunner, job_to_out
+from app.utils.excel import append_sheet
+
+
+@pytest.fixture
+def storage_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "FILE_STORAGE_ROOT", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def fast_hash(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(security, "get_password_hash", lambda password: f"hashed:{password}")
+
+
+def _import_file(rows: list[dict]) -> bytes:
+    wb = Workbook()
+    wb.remove(wb.active)
+    append_sheet(wb, sheet_name="用户导入", columns=_user_import_columns(), rows=rows)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+async def test_user_import_job_writes_error_report(db: None, storage_root: Path) -> None:
+    await User.create(username="exists", password_hash="x", real_name="已存在")
+    content = _import_file(
+        [
+            {"username": "alice", "password": "Alice@123456", "realName": "Alice"},
+            {"username": "exists", "password": "Exists@123456", "realName": "重复"},
+        ],
+    )
+    job = await SysJob.create(kind="user_import", title="导入用户")
+    ctx = JobContext(job)
+
+    actor = CurrentUser(username="admin", roles=[settings.SUPERUSER_ROLE_CODE])
+    await _user_import_job_handler(content, actor=actor)(ctx)
+
+    assert await User.exists(username="alice")
+    assert job.message == "共 2 条，成功 1 条，失败 1 条"
+    assert job.processed == job.total == 2
+    assert job.result_object_key is not None
+
+    wb = load_workbook(storage_root / job.result_object_key, read_only=True)
+    rows = list(wb.active.iter_rows(values_only=True))
+    assert rows[0] == ("行号", "列", "原因")
+    assert [r[0] for r in rows[1:]] == [3]
+
+
+async def test_user_import_job_without_errors_has_no_result_file(
+    db: None,
+    storage_root: Path,
+) -> None:
+    content = _import_file([{"username": "bob", "password": "Bob@123456", "realName": "Bob"}])
+    job = await SysJob.create(kind="user_import", title="导入用户")
+    ctx = JobContext(job)
+
+    actor = CurrentUser(username="admin", roles=[settings.SUPERUSER_ROLE_CODE])
+    await _user_import_job_handler(content, actor=actor)(ctx)
+
+    assert job.message == "共 1 条，成功 1 条，失败 0 条"
+    assert job.result_object_key is None
+    assert not (storage_root / "jobs").exists()
+
+
+async def test_cleanup_expires_old_results(db: None, storage_root: Path) -> None:
+    runner = JobRunner(max_concurrency=1, stale_seconds=600, result_ttl_hours=24)
+    old = datetime.now(UTC) - timedelta(hours=25)
+
+    def result_file(name: str, *, mtime: datetime) -> str:
+        object_key = f"jobs/2026/01/01/{name}.xlsx"
+        path = storage_root / object_key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+        os.utime(path, (mtime.timestamp(), mtime.timestamp()))
+        return object_key
+
+    expired_key = result_file("expired", mtime=old)
+    fresh_key = result_file("fresh", mtime=old)
+    orphan_key = result_file("orphan", mtime=old)
+
+    async def finished_job(object_key: str, finished_at: datetime) -> SysJob:
+        job = await SysJob.create(
+            kind="user_export",
+            title="导出",
+            status=JobStatus.SUCCESS,
+            result_object_key=object_key,
+        )
+        # 与 JobRunner._finish 相同的写法（SQLite 下按 UTC 文本存储）
+        job.finished_at = finished_at
+        await job.save()
+        return job
+
+    expired = await finished_job(expired_key, old)
+    fresh = await finished_job(fresh_key, datetime.now(UTC))
+
+    assert await runner.cleanup_expired() == 1
+
+    await expired.refresh_from_db()
+    await fresh.refresh_from_db()
+    assert expired.status == JobStatus.EXPIRED
+    assert expired.result_object_key is None
+    assert job_to_out(expired).downloadUrl is None
+    assert fresh.status == JobStatus.SUCCESS
+    assert (storage_root / fresh_key).exists()
+    assert not (storage_root / expired_key).exists()
+    assert not (storage_root / orphan_key).exists()
+    assert runner.stats()["removedFiles"] == 2
+
+    # 重复执行不会重复计数
+    assert await runner.cleanup_expired() == 0
+    assert runner.stats()["removedFiles"] == 2
+
+
+async def test_only_jobs_with_stale_heartbeat_are_interrupted(db: None) -> None:
+    runner = JobRunner(max_concurrency=1, stale_seconds=600, result_ttl_hours=0)
+    now = datetime.now(UTC)
+    stale = now - timedelta(seconds=601)
+
+    async def job(status: str, *, heartbeat_at: datetime | None, updated_at: datetime) -> SysJob:
+        job = await SysJob.create(kind="user_export", title="导出", status=status, owner="other")
+        await SysJob.filter(id=job.id).update(heartbeat_at=heartbeat_at, updated_at=updated_at)
+        return job
+
+    # 其他进程排队中/长时间处理中的任务：心跳正常，即使很久没有更新进度
+    waiting = await job(JobStatus.PENDING, heartbeat_at=now, updated_at=stale)
+    busy = await job(JobStatus.RUNNING, heartbeat_at=now, updated_at=stale)
+    orphaned = await job(JobStatus.RUNNING, heartbeat_at=stale, updated_at=stale)
+    legacy = await job(JobStatus.PENDING, heartbeat_at=None, updated_at=stale)
+    done = await job(JobStatus.SUCCESS, heartbeat_at=stale, updated_at=stale)
+
+    assert await runner.fail_orphaned() == 2
+
+    statuses = dict(await SysJob.all().values_list("id", "status"))
+    assert statuses == {
+        waiting.id: JobStatus.PENDING,
+        busy.id: JobStatus.RUNNING,
+        orphaned.id: JobStatus.FAILED,
+        legacy.id: JobStatus.FAILED,
+        done.id: JobStatus.SUCCESS,
+    }
+    assert runner.stats()["interruptedJobs"] == 2
+
+
+async def test_interrupted_job_keeps_failed_status(db: None) -> None:
+    runner = JobRunner(max_concurrency=1, stale_seconds=600, result_ttl_hours=0)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(ctx: JobContext) -> None:
+        started.set()
+        await release.wait()
+        ctx.set_result(message="完成")
+
+    job = await runner.submit(kind="user_export", title="导出", creator_name="", handler=handler)
+    queued = await runner.submit(kind="user_export", title="导出", creator_name="", handler=handler)
+    await asyncio.wait_for(started.wait(), timeout=3)
+
+    # 排队中的任务同样由本进程刷新心跳
+    await SysJob.all().update(heartbeat_at=datetime.now(UTC) - timedelta(hours=1))
+    await runner.heartbeat()
+    assert await runner.fail_orphaned() == 0
+
+    # 心跳停止后被判定中断：处理函数随后结束也不会把状态改回成功，排队的任务不再执行
+    await SysJob.all().update(heartbeat_at=datetime.now(UTC) - timedelta(hours=1))
+    assert await runner.fail_orphaned() == 2
+    release.set()
+    await asyncio.gather(*runner._tasks.values())
+
+    for item in (job, queued):
+        await item.refresh_from_db()
+        assert item.status == JobStatus.FAILED
+        assert item.message == "执行进程已停止，任务已中断"
+    assert queued.started_at is None
@@ -0,0 +1,153 @@
+"""日志过期清理：归档 + 删除的跨 worker 锁（Redis）、归档未完成时不删除过期分区。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from app.core.config import settings
+from app.models.log import OperationLog
+from app.services import log_retention
+from app.services.log_archive import log_archiver
+from app.services.log_retention import (
+    _ARCHIVE_LOCK_PREFIX,
+    LogRetentionService,
+    _update_redis_lock,
+)
+
+_LOCK_NAME = _ARCHIVE_LOCK_PREFIX + OperationLog._meta.db_table
+
+
+@pytest.fixture
+async def expired_log(
+    db: None,
+    redis: FakeRedis,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> OperationLog:
+    monkeypatch.setattr(log_retention, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "FILE_STORAGE_ROOT", tmp_path)
+    monkeypatch.setattr(settings, "LOG_ARCHIVE_ENABLED", True)
+    monkeypatch.setattr(settings, "LOG_ARCHIVE_FORMAT", "ndjson")
+    monkeypatch.setattr(settings, "OPERATION_LOG_RETENTION_DAYS", 30)
+    monkeypatch.setattr(settings, "LOGIN_LOG_RETENTION_DAYS", 0)
+
+    log = await OperationLog.create(method="GET", url="/api/v1/ping")
+    await OperationLog.filter(id=log.id).update(created_at=datetime.now(UTC) - timedelta(days=60))
+    return log
+
+
+@pytest.fixture
+def partition_drops(monkeypatch: pytest.MonkeyPatch) -> list[datetime | None]:
+    """模拟分区表（SQLite 不支持分区），记录每次分区维护收到的删除截止时间。"""
+
+    cutoffs: list[datetime | None] = []
+
+    async def is_partitioned(self: LogRetentionService, model: Any) -> bool:
+        return True
+
+    async def maintain_partitions(
+        self: LogRetentionService,
+        model: Any,
+        cutoff: datetime | None,
+    ) -> int:
+        if model is OperationLog:
+            cutoffs.append(cutoff)
+        return 0
+
+    monkeypatch.setattr(LogRetentionService, "_is_partitioned", is_partitioned)
+    monkeypatch.setattr(LogRetentionService, "_maintain_partitions", maintain_partitions)
+    return cutoffs
+
+
+async def test_archive_skipped_while_another_worker_holds_lock(
+    expired_log: OperationLog,
+    redis: FakeRedis,
+    redis_peer: FakeRedis,
+) -> None:
+    assert await redis_peer.set(_LOCK_NAME, "other-worker", nx=True, ex=60)
+
+    result = await LogRetentionService().run_once()
+
+    stats = result[OperationLog._meta.db_table]
+    assert stats["archiveSkipped"] == 1
+    assert stats["archivedRows"] == stats["deletedRows"] == 0
+    assert await OperationLog.exists(id=expired_log.id)
+    # 未拿到锁的进程不会释放别人的锁
+    assert await redis.get(_LOCK_NAME) == "other-worker"
+
+
+async def test_archive_runs_and_releases_lock(
+    expired_log: OperationLog,
+    redis: FakeRedis,
+    tmp_path: Path,
+) -> None:
+    result = await LogRetentionService().run_once()
+
+    stats = result[OperationLog._meta.db_table]
+    assert stats == {
+        "archivedRows": 1,
+        "droppedPartitions": 0,
+        "deletedRows": 1,
+        "archiveSkipped": 0,
+    }
+    assert not await OperationLog.exists(id=expired_log.id)
+    assert list((tmp_path / "archive").rglob("*.manifest.json"))
+    assert not await redis.exists(_LOCK_NAME)
+
+
+async def test_lock_update_requires_owner_token(redis: FakeRedis) -> None:
+    await redis.set(_LOCK_NAME, "owner", ex=60)
+
+    assert not await _update_redis_lock(redis, _LOCK_NAME, "stale", ttl=None)
+    assert await redis.get(_LOCK_NAME) == "owner"
+
+    assert await _update_redis_lock(redis, _LOCK_NAME, "owner", ttl=600)
+    assert await redis.ttl(_LOCK_NAME) > 60
+    assert await _update_redis_lock(redis, _LOCK_NAME, "owner", ttl=None)
+    assert not await redis.exists(_LOCK_NAME)
+
+
+async def test_no_partition_dropped_while_lock_held_elsewhere(
+    expired_log: OperationLog,
+    redis_peer: FakeRedis,
+    partition_drops: list[datetime | None],
+) -> None:
+    assert await redis_peer.set(_LOCK_NAME, "other-worker", nx=True, ex=60)
+
+    await LogRetentionService().run_once()
+
+    # 仍会预建分区，但不删除任何过期分区
+    assert partition_drops == [None]
+
+
+async def test_no_partition_dropped_when_archive_fails(
+    expired_log: OperationLog,
+    partition_drops: list[datetime | None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def broken_archive(*args: Any, **kwargs: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(log_archiver, "archive_file", broken_archive)
+
+    with pytest.raises(OSError):
+        await LogRetentionService().run_once()
+
+    assert partition_drops == []
+    assert await OperationLog.exists(id=expired_log.id)
+
+
+async def test_partitions_dropped_after_archive_completes(
+    expired_log: OperationLog,
+    partition_drops: list[datetime | None],
+) -> None:
+    await LogRetentionService().run_once()
+
+    assert len(partition_drops) == 1
+    assert partition_drops[0] is not None
+    assert not await OperationLog.exists(id=expired_log.id)
@@ -0,0 +1,120 @@
+"""操作日志关键字搜索：SQLite FTS5 索引与触发器同步、关键字转义、短关键字回退。"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from tortoise import Tortoise
+
+from app.models.log import OperationLog
+from app.services.log_search import OperationLogSearch
+
+
+async def _log(
+    url: str, *, username: str = "alice", request_data: str | None = None
+) -> OperationLog:
+    return await OperationLog.create(
+        method="POST",
+        url=url,
+        username=username,
+        module="用户管理",
+        request_data=request_data,
+    )
+
+
+async def _search(search: OperationLogSearch, keyword: str) -> list[int]:
+    return list(
+        await search.apply(OperationLog.all(), keyword).order_by("id").values_list("id", flat=True)
+    )
+
+
+async def _fts_rowids(search: OperationLogSearch, keyword: str) -> list[int]:
+    """直接查询 FTS 表（不经过 id IN 子查询与主表的关联），用于确认索引内容本身。"""
+
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        f"SELECT rowid FROM {search.fts_table} WHERE {search.fts_table} MATCH ? ORDER BY rowid",
+        ['"' + keyword.replace('"', '""') + '"'],
+    )
+    return [r["rowid"] for r in rows]
+
+
+@pytest.fixture
+async def search(db: None) -> OperationLogSearch:
+    search = OperationLogSearch()
+    await search.ensure_index()
+    return search
+
+
+async def test_ensure_index_creates_table_and_triggers(db: None) -> None:
+    existing = await _log("/api/v1/system/user/export")
+    search = OperationLogSearch()
+
+    await search.ensure_index()
+    # 重复执行不报错，也不会重复索引已有数据
+    await search.ensure_index()
+
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        "SELECT type, name FROM sqlite_master WHERE name LIKE ? ORDER BY name",
+        [f"{search.fts_table}%"],
+    )
+    names = {(r["type"], r["name"]) for r in rows}
+    assert ("table", search.fts_table) in names
+    for suffix in ("ai", "ad", "au"):
+        assert ("trigger", f"{search.fts_table}_{suffix}") in names
+
+    # 首次创建时为已有数据建立索引
+    assert await _fts_rowids(search, "user/export") == [existing.id]
+    assert await _search(search, "user/export") == [existing.id]
+
+
+async def test_index_follows_insert_update_and_delete(search: OperationLogSearch) -> None:
+    log = await _log("/api/v1/system/dict/export")
+    other = await _log("/api/v1/system/dept/list", username="bob")
+
+    assert await _fts_rowids(search, "dict/export") == [log.id]
+    assert await _search(search, "DICT/EXPORT") == [log.id]  # 不区分大小写
+
+    log.url = "/api/v1/system/role/export"
+    await log.save()
+    assert await _fts_rowids(search, "dict/export") == []
+    assert await _fts_rowids(search, "role/export") == [log.id]
+
+    await OperationLog.filter(id=log.id).delete()
+    assert await _fts_rowids(search, "role/export") == []
+    assert await _fts_rowids(search, "system") == [other.id]
+    assert await _search(search, "system") == [other.id]
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    ['"name": ["it\'s', "it's", "a OR b", "NEAR(x y)", "foo*", "col:val"],
+)
+async def test_keyword_is_quoted_as_phrase(search: OperationLogSearch, keyword: str) -> None:
+    values = ["it's", "a OR b", "NEAR(x y)", "foo*", "col:val"]
+    hit = await _log("/api/v1/system/config", request_data=json.dumps({"name": values}))
+    await _log("/api/v1/system/config", request_data=json.dumps({"name": ["a", "b", "foobar"]}))
+
+    # 关键字按字面子串匹配，查询语法字符不会报错也不会被解释
+    assert await _search(search, keyword) == [hit.id]
+
+
+async def test_short_keyword_falls_back_to_like(search: OperationLogSearch) -> None:
+    hit = await _log("/api/v1/system/ab")
+    await _log("/api/v1/system/user")
+
+    qs = search.apply(OperationLog.all(), "ab")
+    assert "MATCH" not in qs.sql()
+    assert await _search(search, "ab") == [hit.id]
+    assert "MATCH" in search.apply(OperationLog.all(), "abc").sql()
+
+
+async def test_without_index_falls_back_to_like(db: None) -> None:
+    hit = await _log("/api/v1/system/dict/export")
+    search = OperationLogSearch()
+
+    qs = search.apply(OperationLog.all(), "dict/export")
+    assert "MATCH" not in qs.sql()
+    assert await _search(search, "dict/export") == [hit.id]
+    # 空白关键字不追加条件
+    assert len(await _search(search, "   ")) == 1
@@ -0,0 +1,47 @@
+"""分页工具：游标模式。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from app.models.notice import Notice, UserNotice
+from app.models.user import User
+from app.utils.pagination import paginate
+
+
+async def test_cursor_walks_all_pages_by_created_at(db: None) -> None:
+    """(-created_at, -id) 排序：逐页翻到底，每条记录恰好出现一次（含创建时间相同的记录）。"""
+
+    user = await User.create(username="alice", password_hash="x", real_name="Alice")
+    rows = []
+    for i in range(23):
+        notice = await Notice.create(title=f"t{i}", message="m", content="c")
+        rows.append(await UserNotice.create(user=user, notice=notice))
+
+    # 每 3 条共用一个创建时间，覆盖“时间相同按 id 继续”的分支
+    base = datetime(2026, 10, 18, 4, 17, 50, 123456, tzinfo=UTC)
+    for i, row in enumerate(rows):
+        created_at = base + timedelta(seconds=i // 3)
+        await UserNotice.filter(id=row.id).update(created_at=created_at)
+
+    qs = UserNotice.filter(user_id=user.id)
+    expected = [r.id for r in await qs.order_by("-created_at", "-id")]
+
+    seen: list[int] = []
+    cursor = ""
+    for _ in range(len(rows)):
+        page, info = await paginate(
+            qs,
+            page=1,
+            page_size=4,
+            cursor=cursor,
+            ordering=("-created_at", "-id"),
+        )
+        seen.extend(r.id for r in page)
+        cursor = info["nextCursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert seen == expected
+    assert len(seen) == len(rows)
@@ -0,0 +1,66 @@
+"""密码哈希线程池：批量哈希的并发上限与登录预留线程。"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core import security
+from app.core.config import settings
+
+
+@pytest.fixture
+def hash_pool(monkeypatch):
+    """单线程配置 + 可观测并发数的假哈希函数。"""
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_BULK_CONCURRENCY", 0)
+    security.shutdown_password_executor()
+
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_hash(password: str) -> str:
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(security, "get_password_hash", slow_hash)
+    monkeypatch.setattr(security, "verify_password", lambda plain, hashed: hashed == plain)
+    yield state
+    security.shutdown_password_executor()
+
+
+async def test_concurrent_bulk_hashing_shares_one_limit(hash_pool) -> None:
+    first = [f"a{i}" for i in range(5)]
+    second = [f"b{i}" for i in range(5)]
+
+    results = await asyncio.gather(
+        security.ahash_passwords(first),
+        security.ahash_passwords(second),
+    )
+
+    assert results == [[f"hashed:{p}" for p in first], [f"hashed:{p}" for p in second]]
+    # 线程池至少 2 个线程，批量哈希合计只占其中 1 个
+    assert security._get_hash_executor()._max_workers == 2
+    assert hash_pool["peak"] == 1
+
+
+async def test_login_is_not_blocked_by_bulk_hashing(hash_pool) -> None:
+    bulk = asyncio.create_task(security.ahash_passwords([f"p{i}" for i in range(50)]))
+    await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    assert await security.averify_password("x", "x") is True
+    # 50 个哈希串行约需 1 秒；登录校验使用预留线程，不需要排队等待
+    assert time.perf_counter() - started < 0.2
+    assert not bulk.done()
+
+    await bulk
@@ -0,0 +1,171 @@
+"""会话状态存储（Redis）与心跳缓冲。"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.security import get_password_hash
+from app.models.session import UserSession
+from app.models.user import User
+from app.services.heartbeat import HeartbeatBuffer
+from app.services.session_store import RedisSessionStore, SessionState
+
+
+def _state(**overrides) -> SessionState:
+    data = {
+        "username": "alice",
+        "status": 1,
+        "expires_at": datetime.now(UTC) + timedelta(hours=1),
+        "last_seen_at": None,
+        "revoke_reason": None,
+    }
+    data.update(overrides)
+    return SessionState(**data)
+
+
+@pytest.fixture
+def store(redis) -> RedisSessionStore:
+    return RedisSessionStore(redis, prefix="test")
+
+
+async def test_put_and_get_roundtrip(store: RedisSessionStore) -> None:
+    state = _state()
+    await store.put("j1", state)
+
+    assert await store.get("j1") == state
+    assert await store.get("missing") is None
+
+
+async def test_put_skips_expired_state(store: RedisSessionStore) -> None:
+    await store.put("j1", _state(expires_at=datetime.now(UTC) - timedelta(seconds=1)))
+
+    assert await store.get("j1") is None
+
+
+async def test_put_sets_ttl_from_expires_at(store: RedisSessionStore, redis) -> None:
+    await store.put("j1", _state(expires_at=datetime.now(UTC) + timedelta(seconds=120)))
+
+    assert 0 < await redis.ttl("test:state:j1") <= 120
+
+
+async def test_revoke_overrides_cached_state(store: RedisSessionStore) -> None:
+    await store.put("j1", _state())
+    await store.revoke(["j1", "j2"], reason="强制下线")
+
+    revoked = await store.get("j1")
+    assert revoked is not None
+    assert revoked.status == 0
+    assert revoked.revoke_reason == "强制下线"
+
+    # 未缓存过状态的会话同样能读到撤销标记
+    never_cached = await store.get("j2")
+    assert never_cached is not None
+    assert never_cached.status == 0
+
+
+async def test_revocation_is_shared_between_workers(redis, redis_peer) -> None:
+    worker_a = RedisSessionStore(redis, prefix="test")
+    worker_b = RedisSessionStore(redis_peer, prefix="test")
+
+    await worker_b.put("j1", _state())
+    await worker_a.revoke(["j1"], reason="已下线")
+
+    state = await worker_b.get("j1")
+    assert state is not None and state.status == 0
+
+
+async def test_invalidate_drops_state_only(store: RedisSessionStore) -> None:
+    await store.put("j1", _state())
+    await store.invalidate(["j1"])
+
+    assert await store.get("j1") is None
+
+
+async def test_touch_is_throttled(store: RedisSessionStore, redis) -> None:
+    first = datetime.now(UTC)
+    state = _state()
+
+    # Redis 存储自行缓冲心跳，调用方不需要再记入本地缓冲
+    assert await store.touch("j1", state, first) is False
+    assert await store.touch("j1", state, first + timedelta(seconds=5)) is False
+
+    assert await redis.hgetall("test:heartbeats") == {"j1": first.isoformat()}
+    assert await redis.ttl("test:seen:j1") > 0
+
+
+async def test_drain_heartbeats_returns_and_clears(store: RedisSessionStore) -> None:
+    now = datetime.now(UTC)
+    await store.touch("j1", _state(), now)
+    await store.touch("j2", _state(), now)
+
+    assert await store.drain_heartbeats() == {"j1": now, "j2": now}
+    assert await store.drain_heartbeats() == {}
+
+
+async def test_concurrent_drains_take_each_heartbeat_once(redis, redis_peer) -> None:
+    worker_a = RedisSessionStore(redis, prefix="test")
+    worker_b = RedisSessionStore(redis_peer, prefix="test")
+    now = datetime.now(UTC)
+    jtis = [f"j{i}" for i in range(50)]
+    for jti in jtis:
+        await worker_a.touch(jti, _state(), now)
+
+    drained = await asyncio.gather(worker_a.drain_heartbeats(), worker_b.drain_heartbeats())
+
+    keys = [jti for beats in drained for jti in beats]
+    assert sorted(keys) == sorted(jtis)
+
+
+async def _create_session(jti: str, *, status: int = 1) -> UserSession:
+    user, _ = await User.get_or_create(
+        username="alice",
+        defaults={"password_hash": get_password_hash("x"), "real_name": "Alice"},
+    )
+    return await UserSession.create(user=user, username=user.username, jti=jti, status=status)
+
+
+async def test_heartbeat_flush_writes_latest_time(db) -> None:
+    await _create_session("j1")
+    await _create_session("j2", status=0)
+    buffer = HeartbeatBuffer(batch_size=1)
+    t1 = datetime(2026, 10, 18, 8, 0, tzinfo=UTC)
+    t2 = t1 + timedelta(minutes=1)
+
+    buffer.record("j1", t2)
+    buffer.record("j1", t1)  # 较早的时间不会覆盖
+    buffer.record("j2", t1)
+
+    # extra（如 Redis drain 的结果）与本地缓冲合并，取较新的时间
+    assert await buffer.flush(extra={"j1": t1 - timedelta(minutes=5)}) == 2
+    assert buffer.queue_depth == 0
+
+    j1 = await UserSession.get(jti="j1")
+    j2 = await UserSession.get(jti="j2")
+    assert j1.last_seen_at == t2
+    assert j2.last_seen_at is None  # 已下线的会话不更新
+
+
+async def test_heartbeat_flush_merges_back_on_failure(db, monkeypatch) -> None:
+    await _create_session("j1")
+    buffer = HeartbeatBuffer()
+    t1 = datetime(2026, 10, 18, 8, 0, tzinfo=UTC)
+    buffer.record("j1", t1)
+
+    def broken_filter(*args, **kwargs):
+        raise RuntimeError("db down")
+
+    with monkeypatch.context() as m:
+        m.setattr(UserSession, "filter", broken_filter)
+        with pytest.raises(RuntimeError):
+            await buffer.flush(extra={"j2": t1})
+
+    # 失败的整批（包括 extra）放回缓冲，等待下次重试；期间的新心跳照常合并
+    assert buffer.queue_depth == 2
+    assert buffer.stats()["failedFlushes"] == 1
+    buffer.record("j1", t1 + timedelta(minutes=1))
+
+    assert await buffer.flush() == 2
+    assert (await UserSession.get(jti="j1")).last_seen_at == t1 + timedelta(minutes=1)
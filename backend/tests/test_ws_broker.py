@@ -0,0 +1,214 @@
+"""WebSocket 广播总线：多个管理器共享 LocalBroker、RedisBroker（fakeredis）。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from app.core.config import settings
+from app.ws.broker import LocalBroker, RedisBroker
+from app.ws.notice import NOTICE_CHANNEL, NoticeWsManager, WsConnection
+
+
+class FakeWebSocket:
+    """记录发送内容的模拟 WebSocket。"""
+
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        return None
+
+
+async def _wait_for(predicate: Callable[[], bool | Awaitable[bool]], timeout: float = 3.0) -> None:
+    async def check() -> bool:
+        result = predicate()
+        return await result if isinstance(result, Awaitable) else result
+
+    async with asyncio.timeout(timeout):
+        while not await check():
+            await asyncio.sleep(0.01)
+
+
+async def _flushed(*conns: WsConnection) -> None:
+    """等待写任务把各连接的发送队列发完。"""
+
+    await _wait_for(lambda: all(c.queue.empty() for c in conns))
+    await asyncio.sleep(0)
+
+
+def _events(ws: FakeWebSocket) -> list[tuple[str, int]]:
+    return [(e["event"], e["seq"]) for e in ws.sent]
+
+
+@pytest.fixture(autouse=True)
+def no_heartbeat(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "WS_HEARTBEAT_INTERVAL_SECONDS", 0)
+
+
+@pytest.fixture
+async def local_workers() -> AsyncIterator[tuple[NoticeWsManager, NoticeWsManager]]:
+    broker = LocalBroker()
+    workers = (NoticeWsManager(broker), NoticeWsManager(broker))
+    for worker in workers:
+        await worker.start()
+    try:
+        yield workers
+    finally:
+        for worker in workers:
+            await worker.stop()
+
+
+async def test_local_broker_fans_out_to_every_manager(
+    local_workers: tuple[NoticeWsManager, NoticeWsManager],
+) -> None:
+    w1, w2 = local_workers
+    ws = {name: FakeWebSocket() for name in ("a1", "a2", "a3", "b1")}
+    conns = [
+        await w1.connect("alice", "jti-a1", ws["a1"]),
+        await w1.connect("alice", "jti-a2", ws["a2"]),
+        await w2.connect("alice", "jti-a3", ws["a3"]),
+        await w2.connect("bob", "jti-b1", ws["b1"]),
+    ]
+
+    # 在 w1 上按用户推送：两个 worker 上 alice 的连接都能收到，bob 收不到
+    await w1.send_to_user("alice", w1.build_event("notice:new"))
+    # 在 w2 上按会话推送：只有该 token 的连接收到（即使连接在另一个 worker 上）
+    await w2.send_to_session("alice", "jti-a1", w2.build_event("session:kick"))
+    await w2.broadcast_users(["alice", "bob"], w2.build_event("notice:all"))
+    await _flushed(*conns)
+
+    assert _events(ws["a1"]) == [("notice:new", 1), ("session:kick", 2), ("notice:all", 3)]
+    assert _events(ws["a2"]) == [("notice:new", 1), ("notice:all", 3)]
+    assert _events(ws["a3"]) == [("notice:new", 1), ("notice:all", 3)]
+    assert _events(ws["b1"]) == [("notice:all", 3)]
+
+    assert w1.stats()["enqueued"] == 5
+    assert w2.stats()["enqueued"] == 3
+    broker_stats = w1.stats()["broker"]
+    assert broker_stats["published"] == 3
+    assert broker_stats["gaps"] == broker_stats["reordered"] == 0
+
+    # 断开后不再投递
+    await w2.disconnect(conns[2])
+    await w1.send_to_user("alice", w1.build_event("notice:new"))
+    await _flushed(*conns)
+    assert _events(ws["a3"]) == [("notice:new", 1), ("notice:all", 3)]
+    assert len(ws["a1"].sent) == 4
+
+
+@pytest.fixture
+async def redis_brokers(
+    redis: FakeRedis,
+    redis_peer: FakeRedis,
+) -> AsyncIterator[tuple[RedisBroker, RedisBroker]]:
+    brokers = (RedisBroker(redis, prefix="test"), RedisBroker(redis_peer, prefix="test"))
+    try:
+        yield brokers
+    finally:
+        for broker in brokers:
+            await broker.close()
+
+
+async def _subscribed(redis: FakeRedis, channel: str, count: int = 1) -> None:
+    """等待订阅连接真正完成 SUBSCRIBE（监听任务在后台执行）。"""
+
+    async def ready() -> bool:
+        numsub = dict(await redis.pubsub_numsub(f"test:ch:{channel}"))
+        return int(numsub.get(f"test:ch:{channel}", 0)) >= count
+
+    await _wait_for(ready)
+
+
+async def test_redis_broker_publish_and_listen(
+    redis: FakeRedis,
+    redis_brokers: tuple[RedisBroker, RedisBroker],
+) -> None:
+    b1, b2 = redis_brokers
+    received: list[tuple[str, dict[str, Any]]] = []
+
+    async def handler(channel: str, message: dict[str, Any]) -> None:
+        received.append((channel, message))
+
+    await b2.subscribe("notice", handler)
+    await _subscribed(redis, "notice")
+
+    # 序号由 INCR 全局分配：不同 worker 发布的消息共用同一序列
+    assert await b1.publish("notice", {"n": 1}) == 1
+    assert await b2.publish("notice", {"n": 2}) == 2
+    await _wait_for(lambda: len(received) == 2)
+
+    assert [(c, m["seq"], m["payload"]) for c, m in received] == [
+        ("notice", 1, {"n": 1}),
+        ("notice", 2, {"n": 2}),
+    ]
+    stats = b2.stats()
+    assert stats["received"] == 2
+    assert stats["gaps"] == stats["reordered"] == 0
+    assert stats["lastSeq"] == {"notice": 2}
+
+    # 无法解析的消息被忽略，不影响后续消息
+    await redis.publish("test:ch:notice", "not-json")
+    await b1.publish("notice", {"n": 3})
+    await _wait_for(lambda: len(received) == 3)
+    assert received[-1][1]["payload"] == {"n": 3}
+
+    # 新增频道时重新订阅；取消全部订阅后监听任务结束
+    other: list[dict[str, Any]] = []
+
+    async def other_handler(_channel: str, message: dict[str, Any]) -> None:
+        other.append(message)
+
+    await b2.subscribe("other", other_handler)
+    await _subscribed(redis, "other")
+    await b1.publish("other", {"n": 4})
+    await _wait_for(lambda: len(other) == 1)
+
+    await b2.unsubscribe("notice", handler)
+    await b2.unsubscribe("other", other_handler)
+    await _wait_for(lambda: b2._listener is not None and b2._listener.done())
+
+
+async def test_redis_broker_reports(redis_brokers: tuple[RedisBroker, RedisBroker]) -> None:
+    b1, b2 = redis_brokers
+
+    await b1.report("worker-1", {"connections": 3}, ttl=30)
+    await b2.report("worker-2", {"connections": 5}, ttl=30)
+
+    assert await b1.reports() == {
+        "worker-1": {"connections": 3},
+        "worker-2": {"connections": 5},
+    }
+    assert 0 < await b1._client.ttl("test:worker:worker-1") <= 30
+
+
+async def test_managers_on_redis_broker_reach_other_workers(
+    redis: FakeRedis,
+    redis_brokers: tuple[RedisBroker, RedisBroker],
+) -> None:
+    w1, w2 = (NoticeWsManager(broker) for broker in redis_brokers)
+    await w1.start()
+    await w2.start()
+    try:
+        await _subscribed(redis, NOTICE_CHANNEL, count=2)
+        ws_remote = FakeWebSocket()
+        conn = await w2.connect("alice", "jti-a1", ws_remote)
+
+        await w1.send_to_user("alice", w1.build_event("notice:new"))
+        await _wait_for(lambda: len(ws_remote.sent) == 1)
+        await _flushed(conn)
+
+        assert _events(ws_remote) == [("notice:new", 1)]
+        assert w1.stats()["enqueued"] == 0
+        assert w2.stats()["enqueued"] == 1
+    finally:
+        await w1.stop()
+        await w2.stop()
@@ -0,0 +1,254 @@
+"""通知 WebSocket 管理器：有界发送队列、慢消费者剔除、心跳（ping/空闲清理/会话过期）、监控接口。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.deps import require_superuser
+from app.api.v1.endpoints.monitor import ws as monitor_ws
+from app.core.config import settings
+from app.main import create_app
+from app.schemas.user import CurrentUser
+from app.ws import notice
+from app.ws.broker import INSTANCE_ID, LocalBroker
+from app.ws.notice import NoticeWsManager, WsConnection
+
+
+class FakeWebSocket:
+    """模拟 WebSocket：可让发送/关闭一直阻塞（模拟不读数据的客户端）。"""
+
+    def __init__(self, *, stalled: bool = False) -> None:
+        self.stalled = stalled
+        self.sent: list[dict[str, Any]] = []
+        self.close_calls: list[tuple[int, str]] = []
+
+    async def send_text(self, text: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_calls.append((code, reason))
+        if self.stalled:
+            await asyncio.Event().wait()
+
+
+@pytest.fixture(autouse=True)
+def no_heartbeat(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "WS_HEARTBEAT_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(notice, "_CLOSE_TIMEOUT_SECONDS", 0.05)
+
+
+@pytest.fixture
+async def manager() -> AsyncIterator[NoticeWsManager]:
+    manager = NoticeWsManager(LocalBroker(), queue_size=2)
+    await manager.start()
+    try:
+        yield manager
+    finally:
+        await manager.stop()
+
+
+async def test_slow_consumer_evicted_without_blocking_sender(manager: NoticeWsManager) -> None:
+    slow_ws, fast_ws = FakeWebSocket(stalled=True), FakeWebSocket()
+    slow = await manager.connect("alice", "jti-slow", slow_ws)
+    fast = await manager.connect("bob", "jti-fast", fast_ws)
+
+    # 入队不让出事件循环：慢连接的前两条填满队列，第三条触发剔除
+    for _ in range(2):
+        await manager.broadcast_users(["alice"], manager.build_event("notice:new"))
+    stats = manager.stats()
+    assert stats["queue"]["maxDepth"] == 2
+    assert stats["queue"]["backlogged"] == 1
+
+    # 关闭慢连接会一直阻塞，但发送方不等待关闭
+    async with asyncio.timeout(1):
+        await manager.broadcast_users(["alice", "bob"], manager.build_event("notice:new"))
+
+    assert manager.evicted == 1
+    assert manager.stats()["evicted"] == 1
+    assert manager._registry.user_connections("alice") == ()
+    assert slow.queue.qsize() == 2
+
+    # 已剔除的连接不再入队；其他连接正常收到
+    await manager.broadcast_users(["alice", "bob"], manager.build_event("notice:new"))
+    assert slow.queue.qsize() == 2
+    assert manager.evicted == 1
+    async with asyncio.timeout(1):
+        while len(fast_ws.sent) < 2 or manager._closing:
+            await asyncio.sleep(0.01)
+    assert [e["event"] for e in fast_ws.sent] == ["notice:new", "notice:new"]
+    assert fast.queue.empty()
+
+    # 后台关闭：先发关闭帧（1013），阻塞的关闭在超时后放弃
+    assert slow.closed
+    assert slow_ws.close_calls == [(1013, "")]
+
+
+async def test_close_is_bounded_when_peer_stalls() -> None:
+    ws = FakeWebSocket(stalled=True)
+    conn = WsConnection("alice", "jti-a", ws, queue_size=1)
+
+    async with asyncio.timeout(1):
+        await conn.close(1001, "连接空闲超时")
+        await conn.close(1001)  # 可重复调用
+
+    assert conn.closed
+    assert ws.close_calls == [(1001, "连接空闲超时")]
+
+
+async def test_stop_waits_for_pending_evictions() -> None:
+    manager = NoticeWsManager(LocalBroker(), queue_size=1)
+    await manager.start()
+    ws = FakeWebSocket(stalled=True)
+    conn = await manager.connect("alice", "jti-a", ws)
+
+    for _ in range(2):
+        await manager.send_to_user("alice", manager.build_event("notice:new"))
+    assert manager._closing
+
+    async with asyncio.timeout(1):
+        await manager.stop()
+    assert conn.closed
+    assert not manager._closing
+
+
+class FakeClock:
+    """替换 notice 模块使用的单调时钟（不影响事件循环）。"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(notice, "time", SimpleNamespace(monotonic=clock.monotonic, time=time.time))
+    monkeypatch.setattr(settings, "WS_IDLE_TIMEOUT_SECONDS", 60)
+    return clock
+
+
+async def _sent(ws: FakeWebSocket, count: int) -> list[dict[str, Any]]:
+    async with asyncio.timeout(1):
+        while len(ws.sent) < count:
+            await asyncio.sleep(0.01)
+    return ws.sent
+
+
+async def test_heartbeat_enqueues_ping(manager: NoticeWsManager, clock: FakeClock) -> None:
+    ws = FakeWebSocket()
+    conn = await manager.connect("alice", "jti-a", ws)
+
+    clock.now += 30
+    await manager.heartbeat()
+
+    assert manager.pings == 1
+    assert [e["event"] for e in await _sent(ws, 1)] == ["ping"]
+    assert not conn.closed
+
+
+async def test_heartbeat_reaps_idle_connections(
+    manager: NoticeWsManager,
+    clock: FakeClock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    idle_ws, active_ws = FakeWebSocket(), FakeWebSocket()
+    idle = await manager.connect("alice", "jti-idle", idle_ws)
+    active = await manager.connect("alice", "jti-active", active_ws)
+
+    clock.now += 45
+    active.touch()  # 回复过 pong
+    clock.now += 30  # idle 已 75 秒无消息，active 30 秒
+
+    await manager.heartbeat()
+
+    assert idle.closed
+    assert idle_ws.close_calls == [(1001, "连接空闲超时")]
+    assert manager._registry.user_connections("alice") == (active,)
+    assert manager.idle_reaped == 1
+    assert [e["event"] for e in await _sent(active_ws, 1)] == ["ping"]
+
+    # 关闭空闲清理后不再断开
+    monkeypatch.setattr(settings, "WS_IDLE_TIMEOUT_SECONDS", 0)
+    clock.now += 3600
+    await manager.heartbeat()
+    assert not active.closed
+
+
+async def test_heartbeat_closes_expired_sessions(
+    manager: NoticeWsManager,
+    clock: FakeClock,
+) -> None:
+    now = datetime.now(UTC)
+    expired_ws, valid_ws = FakeWebSocket(), FakeWebSocket()
+    expired = await manager.connect("alice", "jti-old", expired_ws, expires_at=now)
+    valid = await manager.connect("alice", "jti-new", valid_ws, expires_at=now + timedelta(hours=1))
+
+    await manager.heartbeat()
+
+    assert expired.closed
+    assert expired_ws.close_calls == [(1008, "登录已过期")]
+    assert manager.expired == 1
+    assert manager._registry.user_connections("alice") == (valid,)
+    assert manager.pings == 1
+
+
+async def test_monitor_ws_payload(
+    manager: NoticeWsManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(monitor_ws, "notice_ws_manager", manager)
+    fast_ws, slow_ws = FakeWebSocket(), FakeWebSocket(stalled=True)
+    fast = await manager.connect("alice", "jti-a1", fast_ws)
+    await manager.connect("alice", "jti-a2", slow_ws)
+    await manager.connect("bob", "jti-b1", FakeWebSocket())
+    # 慢连接：第 1 条卡在发送中，第 2、3 条填满队列，第 4 条触发剔除
+    for _ in range(4):
+        await manager.broadcast_users(["alice"], manager.build_event("notice:new"))
+        await asyncio.sleep(0.01)
+    await _sent(fast_ws, 4)
+    assert fast.queue.empty()
+
+    app = create_app()
+    app.dependency_overrides[require_superuser] = lambda: CurrentUser(
+        username="admin",
+        roles=[settings.SUPERUSER_ROLE_CODE],
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get(f"{settings.API_V1_STR}/monitor/ws")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["code"] == 0
+    data = body["data"]
+    assert data["instance"] == INSTANCE_ID
+    assert [w["instance"] for w in data["workers"]] == [INSTANCE_ID]
+    worker = data["workers"][0]
+    assert worker["users"] == 2
+    assert sorted(worker["topUsers"], key=lambda u: u["username"]) == [
+        {"username": "alice", "connections": 1},
+        {"username": "bob", "connections": 1},
+    ]
+    assert worker["queue"] == {"size": 2, "queued": 0, "maxDepth": 0, "backlogged": 0}
+    assert worker["broker"]["published"] == 4
+    assert data["total"] == {
+        "connections": 2,
+        "enqueued": 7,
+        "evicted": 1,
+        "sendErrors": 0,
+        "pings": 0,
+        "idleReaped": 0,
+        "expired": 0,
+    }
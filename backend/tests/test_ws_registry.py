@@ -0,0 +1,94 @@
+"""WebSocket 连接注册表：索引一致性、重复注销、会话校验、快照不变性。"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.ws.notice import WsConnection
+from app.ws.registry import ConnectionRegistry
+
+
+def _conn(username: str, jti: str) -> WsConnection:
+    websocket: Any = object()
+    return WsConnection(username, jti, websocket, queue_size=1)
+
+
+def _assert_consistent(registry: ConnectionRegistry) -> None:
+    by_user = [c for conns in registry._by_user.values() for c in conns]
+    by_jti = [c for conns in registry._by_jti.values() for c in conns]
+    assert len(registry) == len(by_user) == len(by_jti)
+    assert {id(c) for c in by_user} == {id(c) for c in by_jti}
+    # 不保留空 tuple
+    assert all(registry._by_user.values())
+    assert all(registry._by_jti.values())
+
+
+def test_add_and_remove_keep_indexes_consistent() -> None:
+    registry = ConnectionRegistry()
+    a1, a2, b1 = _conn("alice", "jti-a"), _conn("alice", "jti-a"), _conn("bob", "jti-b")
+
+    for conn in (a1, a2, b1):
+        registry.add(conn)
+        _assert_consistent(registry)
+
+    assert len(registry) == 3
+    assert registry.user_count == 2
+    assert registry.user_connections("alice") == (a1, a2)
+    assert registry.session_connections("alice", "jti-a") == (a1, a2)
+
+    assert registry.remove(a1)
+    _assert_consistent(registry)
+    assert registry.user_connections("alice") == (a2,)
+    assert registry.session_connections("alice", "jti-a") == (a2,)
+
+    assert registry.remove(a2)
+    assert registry.remove(b1)
+    _assert_consistent(registry)
+    assert len(registry) == registry.user_count == 0
+    assert registry._by_user == registry._by_jti == {}
+
+
+def test_double_remove_returns_false() -> None:
+    registry = ConnectionRegistry()
+    conn, other = _conn("alice", "jti-a"), _conn("alice", "jti-a")
+    registry.add(conn)
+    registry.add(other)
+
+    assert registry.remove(conn)
+    assert not registry.remove(conn)
+    # 从未注册的连接同样返回 False，不影响计数
+    assert not registry.remove(_conn("carol", "jti-c"))
+
+    assert len(registry) == 1
+    assert registry.user_connections("alice") == (other,)
+    _assert_consistent(registry)
+
+
+def test_session_connections_requires_matching_username() -> None:
+    registry = ConnectionRegistry()
+    conn = _conn("alice", "jti-a")
+    registry.add(conn)
+
+    assert registry.session_connections("alice", "jti-a") == (conn,)
+    assert registry.session_connections("mallory", "jti-a") == ()
+    assert registry.session_connections("alice", "jti-unknown") == ()
+
+
+def test_snapshot_not_mutated_by_later_changes() -> None:
+    registry = ConnectionRegistry()
+    a1, a2, b1 = _conn("alice", "jti-a1"), _conn("alice", "jti-a2"), _conn("bob", "jti-b")
+    for conn in (a1, a2, b1):
+        registry.add(conn)
+
+    users = registry.users()
+    alice = registry.user_connections("alice")
+    session = registry.session_connections("alice", "jti-a1")
+
+    registry.remove(a1)
+    registry.remove(b1)
+    registry.add(_conn("carol", "jti-c"))
+
+    assert users == {"alice": (a1, a2), "bob": (b1,)}
+    assert alice == (a1, a2)
+    assert session == (a1,)
+    assert registry.users() == {"alice": (a2,), "carol": registry.user_connections("carol")}
@@ -122,6 +122,11 @@ export const useNoticeStore = defineStore('notice', () => {
     noticeWs.onmessage = async (evt) => {
       try {
         const payload = JSON.parse(evt.data || '{}');
+        if (payload?.event === 'ping') {
+          // 服务端心跳：回复任意消息，避免被当作空闲连接断开
+          noticeWs?.send('pong');
+          return;
+        }
         if (payload?.event === 'auth:kickout') {
           const reason = payload?.data?.reason || '已被强制下线，请重新登录';
           notification.warning({
@@ -150,7 +155,11 @@ export const useNoticeStore = defineStore('notice', () => {
       }
     };
 
-    noticeWs.onclose = () => {
+    noticeWs.onclose = (evt) => {
+      // 1008：鉴权失败或会话已过期，重连也会被拒绝；token 更新后由下方 watch 重新连接
+      if (evt.code === 1008) {
+        return;
+      }
       // token 仍存在时尝试重连
       if (accessStore.accessToken) {
         const delay = reconnectDelay;